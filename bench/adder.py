@@ -0,0 +1,144 @@
+"""Ripple-carry adder netlist: coroutine processes vs. methods vs. CycleKernel.
+
+Each full adder is one combinational process,
+sensitive to its inputs ``a``, ``b``, and carry in.
+
+Methods are also created MSB first,
+so FIFO order evaluates each full adder once per arriving carry,
+with and without ranks from declared outputs.
+
+Usage::
+
+    $ python -m bench.adder
+"""
+
+import random
+from typing import Any, Never, cast
+
+from deltacycle import (
+    CycleKernel,
+    Method,
+    Singular,
+    any_of,
+    create_task,
+    get_running_kernel,
+    run,
+    sleep,
+)
+
+from .common import best_of, report
+
+WIDTH = 64
+VECTORS = 500
+
+type Bit = Singular[bool]
+
+
+def build() -> tuple[list[Bit], list[Bit], list[Bit], list[Bit]]:
+    a = [Singular(False) for _ in range(WIDTH)]
+    b = [Singular(False) for _ in range(WIDTH)]
+    s = [Singular(False) for _ in range(WIDTH)]
+    c = [Singular(False) for _ in range(WIDTH + 1)]
+    return a, b, s, c
+
+
+async def drv_inputs(a: list[Bit], b: list[Bit], s: list[Bit], c: list[Bit]):
+    rng = random.Random(42)
+    mask = (1 << WIDTH) - 1
+    for _ in range(VECTORS):
+        x = rng.getrandbits(WIDTH)
+        y = rng.getrandbits(WIDTH)
+        for i in range(WIDTH):
+            a[i].next = bool(x >> i & 1)
+            b[i].next = bool(y >> i & 1)
+        await sleep(1)
+        z = sum(bit.value << i for i, bit in enumerate(s))
+        assert z == (x + y) & mask
+
+
+def run_tasks():
+    a, b, s, c = build()
+
+    async def fa(i: int) -> Never:
+        while True:
+            await any_of(a[i].pred(), b[i].pred(), c[i].pred())
+            x, y, ci = a[i].value, b[i].value, c[i].value
+            s[i].next = x ^ y ^ ci
+            c[i + 1].next = x & y | ci & (x | y)
+
+    async def main():
+        for i in range(WIDTH):
+            create_task(fa(i))
+        await sleep(1)
+        await drv_inputs(a, b, s, c)
+
+    run(main())
+
+
+def run_methods(reverse: bool = False, ranked: bool = False) -> tuple[int, int]:
+    a, b, s, c = build()
+    methods: list[Method] = []
+
+    def fa(i: int):
+        def f():
+            x, y, ci = a[i].value, b[i].value, c[i].value
+            s[i].next = x ^ y ^ ci
+            c[i + 1].next = x & y | ci & (x | y)
+
+        return f
+
+    async def main():
+        for i in reversed(range(WIDTH)) if reverse else range(WIDTH):
+            pvs = [a[i].pred(), b[i].pred(), c[i].pred()]
+            outputs = [s[i], c[i + 1]] if ranked else None
+            methods.append(Method(fa(i), pvs, outputs=outputs))
+        await sleep(1)
+        await drv_inputs(a, b, s, c)
+
+    run(main())
+
+    triggers = sum(m.triggers for m in methods)
+    calls = sum(m.calls for m in methods)
+    return triggers, calls
+
+
+def run_cycle():
+    a, b, s, c = build()
+
+    def fa(i: int):
+        def f():
+            x, y, ci = a[i].value, b[i].value, c[i].value
+            s[i].next = x ^ y ^ ci
+            c[i + 1].next = x & y | ci & (x | y)
+
+        return f
+
+    async def main():
+        kernel = cast(CycleKernel[Any], get_running_kernel())
+        for i in range(WIDTH):
+            kernel.comb(fa(i), [a[i], b[i], c[i]], [s[i], c[i + 1]])
+        await sleep(1)
+        await drv_inputs(a, b, s, c)
+
+    run(main(), kernel_type=CycleKernel)
+
+
+def main():
+    results = {
+        "await any_of(...)": best_of(run_tasks),
+        "Method": best_of(run_methods),
+        "Method (MSB 1st)": best_of(lambda: run_methods(reverse=True)),
+        "Method (MSB 1st, ranked)": best_of(lambda: run_methods(reverse=True, ranked=True)),
+        "CycleKernel": best_of(run_cycle),
+    }
+    report(f"Adder: {WIDTH} bits x {VECTORS} vectors", results)
+
+    print("Method calls (MSB first)")
+    for ranked in (False, True):
+        triggers, calls = run_methods(reverse=True, ranked=ranked)
+        name = "ranked" if ranked else "FIFO"
+        print(f"    {name:<24} {calls:9d} calls  {triggers - calls:9d} saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Clock: coroutine driver vs. kernel-driven Clock.
+
+Usage::
+
+    $ python -m bench.clock
+"""
+
+from typing import Never
+
+from deltacycle import Clock, Singular, create_task, run, sleep
+
+from .common import best_of, report
+
+CYCLES = 20_000
+PERIOD = 10
+
+
+async def count_posedges(clk: Singular[bool], n: int):
+    for _ in range(n):
+        await clk.posedge()
+
+
+def run_coro(waiters: int):
+    clk = Singular(False)
+
+    async def drv_clk() -> Never:
+        while True:
+            await sleep(PERIOD // 2)
+            clk.next = not clk.prev
+
+    async def main():
+        create_task(drv_clk())
+        for _ in range(waiters):
+            create_task(count_posedges(clk, CYCLES))
+
+    run(main(), until=CYCLES * PERIOD)
+
+
+def run_kernel(waiters: int, fast_forward: bool = True):
+    clk = Clock(PERIOD, phase=PERIOD // 2, fast_forward=fast_forward)
+
+    async def main():
+        clk.start()
+        for _ in range(waiters):
+            create_task(count_posedges(clk, CYCLES))
+
+    run(main(), until=CYCLES * PERIOD)
+
+
+def main():
+    for waiters in (0, 1):
+        results = {
+            "coroutine driver": best_of(lambda: run_coro(waiters)),
+            "Clock (no fast forward)": best_of(lambda: run_kernel(waiters, False)),
+            "Clock": best_of(lambda: run_kernel(waiters)),
+        }
+        report(f"Clock: {CYCLES} cycles, {waiters} waiter(s)", results)
+
+
+if __name__ == "__main__":
+    main()
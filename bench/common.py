@@ -0,0 +1,22 @@
+"""Benchmark helpers"""
+
+import time
+from collections.abc import Callable
+
+
+def best_of(f: Callable[[], object], n: int = 3) -> float:
+    """Return the best wall time of *n* runs, in seconds."""
+    best = float("inf")
+    for _ in range(n):
+        t0 = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def report(title: str, results: dict[str, float]):
+    """Print wall times, relative to the first result."""
+    print(title)
+    base = next(iter(results.values()))
+    for name, t in results.items():
+        print(f"    {name:<24} {t * 1000:9.2f} ms  {base / t:5.2f}x")
@@ -0,0 +1,75 @@
+"""Registers: flip-flop tasks vs. kernel-updated Register.
+
+A shift register of ``STAGES`` stages, clocked by a ``Clock``.
+The input toggles every cycle, and stages start with alternating values,
+so every stage changes on every clock edge.
+
+Usage::
+
+    $ python -m bench.register
+"""
+
+from typing import Never
+
+from deltacycle import Clock, Register, Singular, create_task, run, wait
+
+from .common import best_of, report
+
+STAGES = 1_000
+CYCLES = 200
+PERIOD = 10
+
+
+async def drv_d(clk: Clock, d: Singular[int]) -> Never:
+    i = 0
+    while True:
+        i ^= 1
+        d.next = i
+        await clk.posedge()
+
+
+def run_tasks():
+    clk = Clock(PERIOD)
+    d = Singular(0)
+    qs = [Singular(k % 2) for k in range(STAGES)]
+
+    async def dff(q: Singular[int], d: Singular[int]) -> Never:
+        while True:
+            await wait()
+            q.next = d.prev
+
+    async def main():
+        clk.start()
+        create_task(drv_d(clk, d))
+        for q, x in zip(qs, [d, *qs]):
+            create_task(dff(q, x), sensitive=[clk.posedge()])
+
+    run(main(), until=CYCLES * PERIOD)
+
+
+def run_registers():
+    clk = Clock(PERIOD)
+    d = Singular(0)
+    qs: list[Register[int]] = []
+    x = d
+    for k in range(STAGES):
+        x = Register(clk, x, value=k % 2)
+        qs.append(x)
+
+    async def main():
+        clk.start()
+        create_task(drv_d(clk, d))
+
+    run(main(), until=CYCLES * PERIOD)
+
+
+def main():
+    results = {
+        "flip-flop tasks": best_of(run_tasks),
+        "Register": best_of(run_registers),
+    }
+    report(f"Shift register: {STAGES} stages x {CYCLES} cycles", results)
+
+
+if __name__ == "__main__":
+    main()
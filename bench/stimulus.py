@@ -0,0 +1,53 @@
+"""Stimulus: driver coroutine vs. scheduled writes.
+
+Usage::
+
+    $ python -m bench.stimulus
+"""
+
+from deltacycle import Singular, create_task, run, schedule_writes, sleep
+
+from .common import best_of, report
+
+N = 100_000
+PERIOD = 10
+
+TIMES = [PERIOD * i for i in range(1, N + 1)]
+VALUES = [i % 256 for i in range(N)]
+
+
+def run_coro():
+    x = Singular(0)
+
+    async def drv():
+        now = 0
+        for t, v in zip(TIMES, VALUES):
+            await sleep(t - now)
+            now = t
+            x.next = v
+
+    async def main():
+        create_task(drv())
+
+    run(main())
+
+
+def run_writes():
+    x = Singular(0)
+
+    async def main():
+        schedule_writes(x, zip(TIMES, VALUES))
+
+    run(main())
+
+
+def main():
+    results = {
+        "driver coroutine": best_of(run_coro),
+        "schedule_writes": best_of(run_writes),
+    }
+    report(f"Stimulus: {N} writes", results)
+
+
+if __name__ == "__main__":
+    main()
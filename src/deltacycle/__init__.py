@@ -2,12 +2,27 @@
 DeltaCycle is a Python library for discrete event simulation (DES).
 """
 
+from ._array import ArraySingular
+from ._bank import BankItem, SignalBank
+from ._bits import Bits, BitVec, cat
+from ._clock import Clock
 from ._container import Container
 from ._credit_pool import CreditPool, ReqCredit
+from ._cycle import CycleKernel
 from ._event import Event
-from ._kernel import DefaultKernel, Kernel, KernelExit, finish
+from ._histogram import Histogram
+from ._kernel import DefaultKernel, Kernel, KernelExit, LivelockError, finish
+from ._latency import LatencyReport
+from ._log import LogRecord, SimLog, log
+from ._method import Method
+from ._monitor import LevelStats, ResourceMonitor
+from ._profile import TaskProfile
 from ._queue import Queue
+from ._register import Register
 from ._semaphore import Lock, ReqSemaphore, Semaphore
+from ._sensitivity import SensitivityReport
+from ._stats import KernelStats
+from ._stimulus import play_stimulus, read_stimulus_csv, read_stimulus_npy
 from ._task import (
     AllOf,
     AnyOf,
@@ -25,11 +40,15 @@ from ._top import (
     get_current_task,
     get_kernel,
     get_running_kernel,
+    nba,
     now,
     run,
+    schedule_write,
+    schedule_writes,
     set_kernel,
     sleep,
     step,
+    wait,
 )
 from ._variable import (
     Aggregate,
@@ -38,9 +57,11 @@ from ._variable import (
     Predicate,
     PredVariable,
     Singular,
+    Subscription,
     Value,
     Variable,
 )
+from ._watchdog import WatchdogTimeout
 
 __all__ = [
     "AggrItem",
@@ -48,38 +69,68 @@ __all__ = [
     "Aggregate",
     "AllOf",
     "AnyOf",
+    "ArraySingular",
+    "BankItem",
+    "BitVec",
+    "Bits",
     "Blocking",
+    "Clock",
     "Container",
     "CreditPool",
+    "CycleKernel",
     "DefaultKernel",
     "Event",
+    "Histogram",
     "Interrupt",
     "Kernel",
     "KernelExit",
+    "KernelStats",
     "Kill",
+    "LatencyReport",
+    "LevelStats",
+    "LivelockError",
     "Lock",
+    "LogRecord",
+    "Method",
     "PredVariable",
     "Predicate",
     "Queue",
+    "Register",
     "ReqCredit",
     "ReqSemaphore",
+    "ResourceMonitor",
     "Semaphore",
+    "SensitivityReport",
+    "SignalBank",
+    "SimLog",
     "Singular",
+    "Subscription",
     "Task",
     "TaskCoro",
     "TaskGroup",
+    "TaskProfile",
     "Value",
     "Variable",
+    "WatchdogTimeout",
     "all_of",
     "any_of",
+    "cat",
     "create_task",
     "finish",
     "get_current_task",
     "get_kernel",
     "get_running_kernel",
+    "log",
+    "nba",
     "now",
+    "play_stimulus",
+    "read_stimulus_csv",
+    "read_stimulus_npy",
     "run",
+    "schedule_write",
+    "schedule_writes",
     "set_kernel",
     "sleep",
     "step",
+    "wait",
 ]
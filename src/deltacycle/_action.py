@@ -0,0 +1,95 @@
+"""Kernel actions"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from ._variable import Value
+
+if TYPE_CHECKING:
+    from ._kernel import Kernel
+    from ._task import Task, TaskArgs
+
+# Kernel event queue item: (region, task, args), or (region, action, None)
+type QueueItem = tuple[int, Task[Any], TaskArgs] | tuple[int, Action, None]
+
+
+class Action(ABC):
+    """Callback scheduled directly in the kernel's event queue.
+
+    Actions are lightweight alternatives to tasks for kernel-native events,
+    such as clock edges.
+    They have no coroutine, no state machine, and cannot block.
+    An action runs to completion within its time slot.
+    """
+
+    @abstractmethod
+    def run(self) -> None:
+        """Execute the action."""
+
+
+class Write[T](Action):
+    """Write a value to a variable."""
+
+    def __init__(self, x: Value[T], value: T):
+        self._x = x
+        self._value = value
+
+    def run(self):
+        self._x.set_next(self._value)
+
+
+class WriteSeq(Action):
+    """Write a sequence of timed values to variables.
+
+    Only the next write is in the kernel's event queue at any time.
+    """
+
+    def __init__(
+        self,
+        kernel: Kernel[Any],
+        events: Iterator[tuple[int, Value[Any], Any]],
+        priority: int,
+        region: Kernel.Region,
+    ):
+        self._kernel = kernel
+        self._events = events
+        self._priority = priority
+        self._region = region
+
+        # Next write
+        self._time = kernel.time()
+        self._x: Value[Any]
+        self._value: Any
+
+    def schedule(self) -> bool:
+        """Schedule the next write; return False if there are no more."""
+        try:
+            time, x, value = next(self._events)
+        except StopIteration:
+            return False
+        if time < self._time:
+            raise ValueError(f"Expected time ≥ {self._time}, got {time}")
+        self._time = time
+        self._x = x
+        self._value = value
+        self._kernel.call_action_at(time, self, self._priority, self._region)
+        return True
+
+    def run(self):
+        time = self._time
+        self._x.set_next(self._value)
+
+        # Apply writes at the same time here, without rescheduling
+        for t, x, value in self._events:
+            if t != time:
+                if t < time:
+                    raise ValueError(f"Expected time ≥ {time}, got {t}")
+                self._time = t
+                self._x = x
+                self._value = value
+                self._kernel.call_action_at(t, self, self._priority, self._region)
+                return
+            x.set_next(value)
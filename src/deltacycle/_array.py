@@ -0,0 +1,146 @@
+"""NumPy array variables"""
+
+from __future__ import annotations
+
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from ._variable import Value, Variable
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+
+def _import_numpy() -> ModuleType:
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as e:  # pragma: no cover
+        raise ImportError("ArraySingular requires numpy") from e
+    return numpy
+
+
+def _readonly(a: NDArray[Any]) -> NDArray[Any]:
+    v = a.view()
+    v.flags.writeable = False
+    return v
+
+
+class ArraySingular(Variable, Value[Any]):
+    """Model state organized as a single NumPy array.
+
+    Requires ``numpy``.
+
+    The array shape and dtype are fixed at construction.
+    Values are stored in two pre-allocated buffers: *prev* and *next*.
+    Writes copy into the *next* buffer in place;
+    ``update`` swaps the two buffers instead of copying.
+
+    ``prev`` and ``value`` return zero-copy, read-only views.
+    Do not hold on to them across time slots,
+    because the underlying buffers are recycled.
+
+    Change detection is vectorized.
+    By default, any element difference is a change.
+    If *rtol* or *atol* is nonzero, the new value is a change only if it is
+    not element-wise close to the previous value
+    (see ``numpy.allclose``).
+    """
+
+    def __init__(
+        self,
+        value: ArrayLike,
+        dtype: DTypeLike | None = None,
+        rtol: float = 0.0,
+        atol: float = 0.0,
+        name: str | None = None,
+    ):
+        Variable.__init__(self, name)
+
+        np = _import_numpy()
+        self._np = np
+
+        self._prev: NDArray[Any] = np.array(value, dtype=dtype)
+        self._next: NDArray[Any] = np.empty_like(self._prev)
+        self._prev_view = _readonly(self._prev)
+        self._next_view = _readonly(self._next)
+
+        # Next buffer holds stale data from two slots ago
+        self._stale = True
+
+        self._rtol = rtol
+        self._atol = atol
+        self._tol = rtol != 0.0 or atol != 0.0
+
+        self._changed: bool = False
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._prev.shape
+
+    @property
+    def dtype(self) -> Any:
+        return self._prev.dtype
+
+    def _check(self):
+        if self._tol:
+            close = self._np.allclose(
+                self._next, self._prev, rtol=self._rtol, atol=self._atol, equal_nan=True
+            )
+            self._changed = not close
+        else:
+            self._changed = not self._np.array_equal(self._next, self._prev)
+
+    # Value
+    def get_prev(self) -> NDArray[Any]:
+        return self._prev_view
+
+    prev = property(fget=get_prev)
+
+    def set_next(self, value: ArrayLike):
+        self._kernel.check_write()
+        self._next[...] = value
+        self._stale = False
+        self._check()
+
+        # Notify the kernel
+        self._set()
+
+    next = property(fset=set_next)
+
+    def set_next_item(self, key: Any, value: ArrayLike):
+        """Schedule update to part of the array in the current timeslot.
+
+        Args:
+            key: Any valid NumPy index, e.g. ``(0, slice(2, 4))``.
+            value: Broadcastable to ``next[key]``.
+        """
+        self._kernel.check_write()
+        if self._stale:
+            self._np.copyto(self._next, self._prev)
+            self._stale = False
+        self._next[key] = value
+        self._check()
+
+        # Notify the kernel
+        self._set()
+
+    # Variable
+    def get_value(self) -> NDArray[Any]:
+        """Return present value.
+
+        When performing multiple updates to a variable during the same timeslot,
+        this method will always return the value of the *latest* update.
+        """
+        return self._prev_view if self._stale else self._next_view
+
+    value = property(fget=get_value)
+
+    def changed(self) -> bool:
+        return self._changed
+
+    def update(self):
+        # Swap buffers
+        self._prev, self._next = self._next, self._prev
+        self._prev_view, self._next_view = self._next_view, self._prev_view
+        self._stale = True
+        self._changed = False
@@ -0,0 +1,181 @@
+"""Signal bank: struct-of-arrays storage for many scalar variables"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import MutableSequence
+from typing import Any
+
+from ._variable import Predicate, PredVariable, Value, Variable, _WaitQ
+
+
+class SignalBank[T](Variable):
+    """Many scalar signals stored in parallel arrays.
+
+    A model with tens of thousands of small signals (e.g. a gate-level
+    netlist) would otherwise need one ``Singular`` object per signal,
+    each with its own wait queue and ``__dict__``.
+    A bank stores all *prev* and *next* values in two flat arrays,
+    and hands out lightweight ``BankItem`` handles by index.
+
+    If *typecode* is given, values are stored in an ``array.array``
+    of that type (e.g. ``"b"`` for bool, ``"q"`` for int, ``"d"`` for float),
+    and the cost per signal is two machine words or less.
+    Otherwise values are stored in Python lists.
+
+    Wait queues are only created for signals that are actually awaited.
+    All dirty signals are committed in one pass at the end of the slot.
+    """
+
+    # Commit with one bulk copy when more than 1/_bulk_ratio of signals are dirty
+    _bulk_ratio = 4
+
+    def __init__(
+        self,
+        n: int,
+        value: T,
+        typecode: str | None = None,
+        name: str | None = None,
+    ):
+        super().__init__(name)
+        self._n = n
+        self._prevs: MutableSequence[T]
+        self._nexts: MutableSequence[T]
+        if typecode is None:
+            self._prevs = [value] * n
+            self._nexts = [value] * n
+        else:
+            a: array[Any] = array(typecode)
+            a.append(value)
+            self._prevs = a * n
+            self._nexts = a * n
+
+        # Indices written in the current time slot
+        self._dirty: set[int] = set()
+
+        # Index => tasks waiting for that signal
+        self._waitqs: dict[int, _WaitQ] = {}
+
+        # Index => interned PredVariable for any change
+        self._changed_pvs: dict[int, PredVariable] = {}
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> BankItem[T]:
+        if not 0 <= i < self._n:
+            raise IndexError(f"Signal index out of range: {i}")
+        return BankItem(self, i)
+
+    def _get_waitq(self, i: int) -> _WaitQ:
+        try:
+            return self._waitqs[i]
+        except KeyError:
+            waitq = self._waitqs[i] = _WaitQ()
+            return waitq
+
+    def _get_changed_pv(self, i: int) -> PredVariable:
+        try:
+            return self._changed_pvs[i]
+        except KeyError:
+            pv = self._changed_pvs[i] = _BankPred(self, i, None)
+            return pv
+
+    def get_prev(self, i: int) -> T:
+        """Return value at the end of the previous timeslot."""
+        return self._prevs[i]
+
+    def get_next(self, i: int) -> T:
+        """Return present value."""
+        return self._nexts[i]
+
+    def set_next(self, i: int, value: T):
+        """Schedule update to value in the current timeslot."""
+        self._kernel.check_write()
+        self._nexts[i] = value
+
+        # Notify tasks waiting on this signal, or on the whole bank
+        waitq = self._waitqs.get(i)
+        if waitq:
+            self._notify(waitq)
+        if self._waitq:
+            self._notify(self._waitq)
+
+        self._dirty.add(i)
+        self._kernel.touch_var(self)
+
+    def changed_at(self, i: int) -> bool:
+        """Return True if signal *i* changed during the current time slot."""
+        return self._nexts[i] != self._prevs[i]
+
+    # Variable
+    def changed(self) -> bool:
+        return any(self._nexts[i] != self._prevs[i] for i in self._dirty)
+
+    def update(self):
+        if len(self._dirty) * self._bulk_ratio > self._n:
+            self._prevs[:] = self._nexts
+        else:
+            prevs, nexts = self._prevs, self._nexts
+            for i in self._dirty:
+                prevs[i] = nexts[i]
+        self._dirty.clear()
+
+
+class _BankPred(PredVariable):
+    """Predicated variable bound to one signal of a bank."""
+
+    def __init__(self, bank: SignalBank[Any], i: int, p: Predicate | None):
+        super().__init__(bank, p if p is not None else (lambda: bank.changed_at(i)))
+        self._waitq = bank._get_waitq(i)
+
+
+class BankItem[T](Value[T]):
+    """Lightweight handle to one signal of a ``SignalBank``."""
+
+    __slots__ = ("_bank", "_index")
+
+    def __init__(self, bank: SignalBank[T], i: int):
+        self._bank = bank
+        self._index = i
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    def get_prev(self) -> T:
+        return self._bank._prevs[self._index]
+
+    prev = property(fget=get_prev)
+
+    def set_next(self, value: T):
+        self._bank.set_next(self._index, value)
+
+    next = property(fset=set_next)
+
+    def get_value(self) -> T:
+        """Return present value."""
+        return self._bank._nexts[self._index]
+
+    value = property(fget=get_value)
+
+    def changed(self) -> bool:
+        """Return True if changed during the current time slot."""
+        return self._bank.changed_at(self._index)
+
+    def pred(self, p: Predicate | None = None) -> PredVariable:
+        """Return blocking, predicated variable.
+
+        Only ``set_next`` calls on *this* signal evaluate the predicate.
+
+        Args:
+            p: Predicate function with no args and ``bool`` return type.
+                If not given, wait for any change to this signal.
+                That PredVariable is created once, and shared by all waiters.
+
+        Returns:
+            Predicated Variable object.
+        """
+        if p is None:
+            return self._bank._get_changed_pv(self._index)
+        return _BankPred(self._bank, self._index, p)
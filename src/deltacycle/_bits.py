@@ -0,0 +1,307 @@
+"""Packed bit vector variables"""
+
+from __future__ import annotations
+
+from typing import Self
+
+from ._variable import PredVariable, Singular
+
+# Characters for 4-state bit values: (aval, bval) => char
+_CHARS = {
+    (0, 0): "0",
+    (1, 0): "1",
+    (0, 1): "Z",
+    (1, 1): "X",
+}
+
+_PLANES = {
+    "0": (0, 0),
+    "1": (1, 0),
+    "Z": (0, 1),
+    "z": (0, 1),
+    "X": (1, 1),
+    "x": (1, 1),
+}
+
+
+def _mask(n: int) -> int:
+    return (1 << n) - 1
+
+
+class Bits:
+    """Immutable, packed vector of 4-state bits.
+
+    Each bit has one of four values: ``0``, ``1``, ``X`` (unknown),
+    or ``Z`` (high impedance).
+    Bits are stored in two integer *planes*,
+    using the same encoding as the Verilog VPI ``aval`` / ``bval`` pair:
+
+    ==== ==== =====
+    aval bval Value
+    ==== ==== =====
+    0    0    0
+    1    0    1
+    0    1    Z
+    1    1    X
+    ==== ==== =====
+
+    A 2-state vector is simply a vector where ``bval`` is zero.
+
+    Bit zero is the least significant bit.
+    Slicing, concatenation, and bitwise operators are implemented with a
+    constant number of integer shift / mask operations,
+    independent of the number of bits.
+    """
+
+    __slots__ = ("_aval", "_bval", "_size")
+
+    def __init__(self, size: int, aval: int = 0, bval: int = 0):
+        if size < 0:
+            raise ValueError(f"Expected size ≥ 0, got {size}")
+        mask = _mask(size)
+        self._size = size
+        self._aval = aval & mask
+        self._bval = bval & mask
+
+    @classmethod
+    def from_str(cls, s: str) -> Self:
+        """Convert a string of bit characters to a vector.
+
+        The left-most character is the most significant bit.
+        Valid characters are ``0``, ``1``, ``X``, ``Z``, and ``_`` (ignored).
+        """
+        aval, bval, size = 0, 0, 0
+        for c in reversed(s):
+            if c == "_":
+                continue
+            try:
+                a, b = _PLANES[c]
+            except KeyError as e:
+                raise ValueError(f"Invalid bit character: {c!r}") from e
+            aval |= a << size
+            bval |= b << size
+            size += 1
+        return cls(size, aval, bval)
+
+    @property
+    def size(self) -> int:
+        """Number of bits."""
+        return self._size
+
+    @property
+    def aval(self) -> int:
+        return self._aval
+
+    @property
+    def bval(self) -> int:
+        return self._bval
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"Bits({self._size}, aval={self._aval:#x}, bval={self._bval:#x})"
+
+    def __str__(self) -> str:
+        chars = [
+            _CHARS[((self._aval >> i) & 1, (self._bval >> i) & 1)]
+            for i in reversed(range(self._size))
+        ]
+        return f"{self._size}'b" + "".join(chars)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Bits):
+            return (
+                self._size == other._size
+                and self._aval == other._aval
+                and self._bval == other._bval
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._size, self._aval, self._bval))
+
+    def __bool__(self) -> bool:
+        """Return True if any bit is known to be ``1``."""
+        return bool(self._aval & ~self._bval)
+
+    def __int__(self) -> int:
+        if self._bval:
+            raise ValueError(f"Cannot convert {self} to int")
+        return self._aval
+
+    def is_known(self) -> bool:
+        """Return True if all bits are ``0`` or ``1``."""
+        return not self._bval
+
+    def ones(self) -> int:
+        """Return mask of bits known to be ``1``."""
+        return self._aval & ~self._bval
+
+    def zeros(self) -> int:
+        """Return mask of bits known to be ``0``."""
+        return ~(self._aval | self._bval) & _mask(self._size)
+
+    def _norm(self, key: int | slice) -> tuple[int, int]:
+        if isinstance(key, int):
+            if key < 0:
+                key += self._size
+            if not 0 <= key < self._size:
+                raise IndexError(f"Bit index out of range: {key}")
+            return key, key + 1
+        if key.step is not None:
+            raise ValueError("Slice step is not supported")
+        start, stop, _ = key.indices(self._size)
+        return start, max(start, stop)
+
+    def __getitem__(self, key: int | slice) -> Bits:
+        """Return a bit, or a contiguous range of bits.
+
+        Slices use Python semantics: ``x[lo:hi]`` selects bits lo to hi-1.
+        """
+        lo, hi = self._norm(key)
+        n = hi - lo
+        return Bits(n, self._aval >> lo, self._bval >> lo)
+
+    def _check_size(self, other: Bits):
+        if self._size != other._size:
+            raise ValueError(f"Expected size {self._size}, got {other._size}")
+
+    def _from_01(self, ones: int, zeros: int) -> Bits:
+        """Build result from masks of known 1s, known 0s; everything else is X."""
+        xs = ~(ones | zeros) & _mask(self._size)
+        return Bits(self._size, ones | xs, xs)
+
+    def __invert__(self) -> Bits:
+        return self._from_01(self.zeros(), self.ones())
+
+    def __and__(self, other: Bits) -> Bits:
+        self._check_size(other)
+        return self._from_01(self.ones() & other.ones(), self.zeros() | other.zeros())
+
+    def __or__(self, other: Bits) -> Bits:
+        self._check_size(other)
+        return self._from_01(self.ones() | other.ones(), self.zeros() & other.zeros())
+
+    def __xor__(self, other: Bits) -> Bits:
+        self._check_size(other)
+        known = ~(self._bval | other._bval) & _mask(self._size)
+        x = self._aval ^ other._aval
+        return self._from_01(x & known, ~x & known)
+
+    def diff(self, other: Bits) -> int:
+        """Return mask of bits that differ from *other*."""
+        return (self._aval ^ other._aval) | (self._bval ^ other._bval)
+
+
+def cat(*xs: Bits) -> Bits:
+    """Concatenate vectors.
+
+    The first argument occupies the least significant bits.
+    """
+    aval, bval, size = 0, 0, 0
+    for x in xs:
+        aval |= x._aval << size
+        bval |= x._bval << size
+        size += x._size
+    return Bits(size, aval, bval)
+
+
+class BitVec(Singular[Bits]):
+    """Singular variable holding a packed bit vector.
+
+    A bus of *size* wires is modeled as one variable, instead of one
+    variable per bit.
+    Edge detection uses integer masks, computed with a few integer ops,
+    and ``pred_bits`` creates a predicated variable that is only sensitive
+    to changes in a sub-range of bits.
+
+    If *four_state* is False, values containing ``X`` or ``Z`` are rejected.
+    Integer values are accepted by ``set_next``,
+    and converted to a 2-state vector.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        value: Bits | int = 0,
+        four_state: bool = True,
+        name: str | None = None,
+    ):
+        self._size = size
+        self._four_state = four_state
+        super().__init__(self._convert(value), name)
+
+        # Interned PredVariables for bit ranges
+        self._bits_pvs: dict[tuple[int, int], PredVariable] = {}
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _convert(self, value: Bits | int) -> Bits:
+        if isinstance(value, int):
+            if not 0 <= value <= _mask(self._size):
+                raise ValueError(f"Expected value in [0, {_mask(self._size)}], got {value}")
+            return Bits(self._size, value)
+        if value.size != self._size:
+            raise ValueError(f"Expected size {self._size}, got {value.size}")
+        if not self._four_state and not value.is_known():
+            raise ValueError(f"Expected 2-state value, got {value}")
+        return value
+
+    def set_next(self, value: Bits | int):
+        super().set_next(self._convert(value))
+
+    next = property(fset=set_next)
+
+    def set_next_bits(self, key: int | slice, value: Bits | int):
+        """Schedule update to a sub-range of bits in the current timeslot.
+
+        Bits outside the range keep their latest value.
+        """
+        lo, hi = self._next._norm(key)
+        n = hi - lo
+        if isinstance(value, int):
+            value = Bits(n, value)
+        if value.size != n:
+            raise ValueError(f"Expected size {n}, got {value.size}")
+        mask = _mask(n) << lo
+        x = self._next
+        aval = (x.aval & ~mask) | (value.aval << lo)
+        bval = (x.bval & ~mask) | (value.bval << lo)
+        self.set_next(Bits(self._size, aval, bval))
+
+    def changed_mask(self) -> int:
+        """Return mask of bits changed during the current time slot."""
+        return self._next.diff(self._prev)
+
+    def posedge_mask(self) -> int:
+        """Return mask of bits transitioning from ``0`` to ``1``."""
+        return self._prev.zeros() & self._next.ones()
+
+    def negedge_mask(self) -> int:
+        """Return mask of bits transitioning from ``1`` to ``0``."""
+        return self._prev.ones() & self._next.zeros()
+
+    def pred_bits(self, key: int | slice) -> PredVariable:
+        """Return predicated variable sensitive to a sub-range of bits.
+
+        Args:
+            key: Bit index, or slice of bit indices.
+
+        Returns:
+            Predicated Variable object.
+            Its predicate is True only if a bit in the range changed.
+            It is created once per range, and shared by all waiters.
+        """
+        lo, hi = self._prev._norm(key)
+        pv = self._bits_pvs.get((lo, hi))
+        if pv is None:
+            mask = _mask(hi - lo) << lo
+
+            def p() -> bool:
+                return bool(self.changed_mask() & mask)
+
+            pv = self._bits_pvs[(lo, hi)] = self.pred(p)
+        return pv
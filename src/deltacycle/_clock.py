@@ -0,0 +1,308 @@
+"""Kernel-driven clock"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ._action import Action
+from ._kernel import Kernel
+from ._task import Task
+from ._variable import PredVariable, Singular, _WaitQ
+
+if TYPE_CHECKING:
+    from ._register import Register
+
+
+class _Toggle(Action):
+    """Clock edge event."""
+
+    def __init__(self, clk: Clock, kernel: Kernel[Any]):
+        self._clk = clk
+        self._kernel = kernel
+
+    def run(self):
+        clk = self._clk
+
+        # Clock was stopped, or restarted with a new action
+        if clk._toggle is not self:
+            return
+
+        # Nobody is sensitive to this clock: stop scheduling edges
+        if clk._fast_forward and not clk._registers and not clk._waitq.sensitive():
+            clk._sleep(self._kernel)
+            return
+
+        # Same as set_next, without looking up the running kernel
+        kernel = self._kernel
+        level = not clk._next
+        clk._next = level
+        clk._changed = True
+        if clk._waitq:
+            clk._notify(clk._waitq)
+        kernel.touch_var(clk)
+
+        if level and clk._registers:
+            clk._update_registers(kernel)
+
+        # Schedule the next edge
+        delay = clk._duty if level else clk._period - clk._duty
+        kernel.call_action_at(kernel.time() + delay, self, clk._priority)
+
+
+class _ClockWaitQ(_WaitQ):
+    """Clock wait queue: wake up an idle clock when a task waits for it."""
+
+    track_armed = True
+
+    def __init__(self, clk: Clock):
+        super().__init__()
+        self._clk = clk
+
+        # Number of armed subscriptions
+        self._armed = 0
+
+    def sensitive(self) -> bool:
+        return bool(self._items) or self._armed > 0
+
+    def push(self, task: Task[Any], unblock: bool, pv: PredVariable):
+        super().push(task, unblock, pv)
+        if self._clk._idle:
+            self._clk._wake()
+
+    def on_arm(self):
+        self._armed += 1
+        if self._clk._idle:
+            self._clk._wake()
+
+    def on_disarm(self):
+        self._armed -= 1
+
+
+class Clock(Singular[bool]):
+    """Free-running clock, toggled natively by the kernel.
+
+    Unlike a clock driven by a coroutine
+    (``await sleep(period // 2); clk.next = not clk.prev``),
+    the kernel toggles a ``Clock`` from its event queue,
+    with no task resumption.
+
+    The first positive edge is at time *phase*.
+    After that, there is a positive edge every *period* time steps.
+    The clock is high for *duty* time steps (default: ``period // 2``),
+    then low for the remainder of the period.
+    Before the first edge, the clock is low.
+
+    Edges are ordered with other events in the same time slot by *priority*.
+
+    A clock does not toggle until ``start`` is called by a running task.
+    Use multiple clocks for multiple clock domains;
+    their periods may have arbitrary ratios.
+    All ``Register`` objects in a clock domain are updated together,
+    on the positive edge.
+
+    If *fast_forward* is True (the default),
+    a clock with no sensitive waiters and no registers goes *idle*:
+    it stops scheduling edges, so the kernel skips directly to the next
+    time something else is scheduled.
+    While idle, ``prev`` and ``value`` are computed from the waveform,
+    as they would be before an edge due at the current time.
+    When a task waits on the clock again, or arms a subscription to it,
+    the clock resumes in phase.
+    Fast forwarding does not change when waiters wake up.
+    """
+
+    min_period = 2
+
+    def __init__(  # noqa: PLR0913
+        self,
+        period: int,
+        duty: int | None = None,
+        phase: int = 0,
+        priority: int = 0,
+        fast_forward: bool = True,
+        *,
+        name: str | None = None,
+    ):
+        if period < self.min_period:
+            raise ValueError(f"Expected period ≥ {self.min_period}, got {period}")
+        if duty is None:
+            duty = period // 2
+        if not 0 < duty < period:
+            raise ValueError(f"Expected 0 < duty < {period}, got {duty}")
+        if phase < 0:
+            raise ValueError(f"Expected phase ≥ 0, got {phase}")
+
+        super().__init__(False, name)
+        self._waitq = _ClockWaitQ(self)
+
+        self._period = period
+        self._duty = duty
+        self._phase = phase
+        self._priority = priority
+        self._fast_forward = fast_forward
+
+        # Pending edge event
+        self._toggle: _Toggle | None = None
+
+        # Running, but not scheduling edges
+        self._idle = False
+        self._idle_kernel: Kernel[Any] | None = None
+
+        # Clock domain
+        self._registers: list[Register[Any]] = []
+
+    @property
+    def period(self) -> int:
+        return self._period
+
+    @property
+    def duty(self) -> int:
+        return self._duty
+
+    @property
+    def phase(self) -> int:
+        return self._phase
+
+    def level_at(self, t: int) -> bool:
+        """Return the ideal clock level at time *t*."""
+        return t >= self._phase and (t - self._phase) % self._period < self._duty
+
+    def next_edge(self, t: int) -> int:
+        """Return the time of the first edge strictly after time *t*."""
+        if t < self._phase:
+            return self._phase
+        k, r = divmod(t - self._phase, self._period)
+        base = self._phase + k * self._period
+        return base + self._duty if r < self._duty else base + self._period
+
+    def _idle_level(self) -> bool:
+        # Level before any edge due at the current time
+        assert self._idle_kernel is not None
+        return self.level_at(self._idle_kernel.time() - 1)
+
+    # Value
+    def get_prev(self) -> bool:
+        if self._idle:
+            return self._idle_level()
+        return self._prev
+
+    prev = property(fget=get_prev)
+
+    # Variable
+    def get_value(self) -> bool:
+        if self._idle:
+            return self._idle_level()
+        return self._next
+
+    value = property(fget=get_value)
+
+    def changed(self) -> bool:
+        if self._idle:
+            return False
+        return self._changed
+
+    def is_posedge(self) -> bool:
+        if self._idle:
+            return False
+        return not self._prev and self._next
+
+    def is_negedge(self) -> bool:
+        if self._idle:
+            return False
+        return self._prev and not self._next
+
+    def running(self) -> bool:
+        """Return True if the clock is running (possibly idle)."""
+        return self._toggle is not None or self._idle
+
+    def idle(self) -> bool:
+        """Return True if the clock is idle (fast forwarding)."""
+        return self._idle
+
+    @property
+    def registers(self) -> tuple[Register[Any], ...]:
+        """Registers in this clock domain."""
+        return tuple(self._registers)
+
+    def _add_register(self, q: Register[Any]):
+        self._registers.append(q)
+        if self._idle:
+            self._wake()
+
+    def _update_registers(self, kernel: Kernel[Any]):
+        # Inputs are read from prev values, so update order does not matter
+        for q in self._registers:
+            rst = q._reset
+            if rst is not None and rst.prev:
+                value = q._reset_value
+            else:
+                en = q._enable
+                if en is not None and not en.prev:
+                    continue
+                value = q._d.prev
+            if value == q._next:
+                continue
+            q._next = value
+            q._changed = True
+            if q._waitq:
+                q._notify(q._waitq)
+            kernel.touch_var(q)
+
+    def _schedule(self, kernel: Kernel[Any], now: int):
+        self._toggle = _Toggle(self, kernel)
+        kernel.call_action_at(self.next_edge(now), self._toggle, self._priority)
+
+    def _sleep(self, kernel: Kernel[Any]):
+        self._toggle = None
+        self._idle = True
+        # Hold the kernel, so the clock can be read after the run
+        self._idle_kernel = kernel
+
+    def _wake(self):
+        """Reconstruct clock state at the current time, and resume edges.
+
+        If an edge is due at the current time,
+        it is scheduled in the current time slot,
+        as it would have been if the clock had not gone idle.
+        """
+        kernel = self._idle_kernel
+        assert kernel is not None
+        self._idle = False
+        self._idle_kernel = None
+
+        now = kernel.time()
+        self._prev = self._next = self.level_at(now - 1)
+        self._changed = False
+
+        self._schedule(kernel, now - 1)
+
+    def start(self):
+        """Start toggling the clock.
+
+        If the current time is past *phase*,
+        the clock level is set to its ideal value immediately.
+
+        Raises:
+            RuntimeError: The clock is already running.
+        """
+        if self.running():
+            raise RuntimeError("Clock is already running")
+
+        kernel = self._kernel
+        now = kernel.time()
+
+        level = self.level_at(now)
+        if level != self._next:
+            self.set_next(level)
+
+        self._schedule(kernel, now)
+
+    def stop(self):
+        """Stop toggling the clock; it holds its current value."""
+        if self._idle:
+            value = self._idle_level()
+            self._idle = False
+            self._idle_kernel = None
+            self._prev = self._next = value
+            self._changed = False
+        self._toggle = None
@@ -6,13 +6,19 @@ import heapq
 from typing import Any
 
 from ._kernel_if import KernelIf
+from ._monitor import Monitored
 from ._task import SupportsDropTask, Task
 
 
 class _PortQ(SupportsDropTask):
     """Tasks wait for credit to become available."""
 
-    def __init__(self):
+    blocked_on = "Container"
+
+    def __init__(self, port: str = "get"):
+        # Blocking method name, e.g. "get"
+        self.port = port
+
         # priority, index, task, n
         self._items: list[tuple[int, int, Task[Any], int]] = []
 
@@ -20,6 +26,9 @@ class _PortQ(SupportsDropTask):
         # Breaks (time, priority, ...) ties in the heapq
         self._index: int = 0
 
+    def wait_label(self) -> str:
+        return f"{self.blocked_on}.{self.port}"
+
     def __len__(self) -> int:
         return len(self._items)
 
@@ -51,10 +60,16 @@ class _PortQ(SupportsDropTask):
 
 
 class _PortLock(SupportsDropTask):
+    blocked_on = "Container"
+
     def __init__(self, parent: Container):
         self._parent = parent
         self._task: Task[Any] | None = None
 
+    def wait_label(self) -> None:
+        # Port held by a woken task, not waiting
+        return None
+
     def __bool__(self) -> bool:
         return self._task is not None
 
@@ -98,7 +113,7 @@ class _PutLock(_PortLock):
             self.acquire(task=self._parent._putq_pop())
 
 
-class Container(KernelIf):
+class Container(KernelIf, Monitored):
     """Producer / Consumer Resource Container.
 
     Has both blocking and non-blocking put and get interfaces.
@@ -112,6 +127,8 @@ class Container(KernelIf):
     Its size is subject only to the machine's memory limitations.
     """
 
+    _monitor_queues = ("_getq", "_putq")
+
     def __init__(self, capacity: int = 0):
         self._capacity = capacity
         self._has_capacity = capacity > 0
@@ -123,7 +140,7 @@ class Container(KernelIf):
         self._getq = _PortQ()
 
         # Tasks waiting to put resource
-        self._putq = _PortQ()
+        self._putq = _PortQ("put")
 
         # Lock ensures gets are atomic
         self._get_lock = _GetLock(parent=self)
@@ -7,13 +7,19 @@ from types import TracebackType
 from typing import Any, Self
 
 from ._kernel_if import KernelIf
+from ._monitor import Monitored
 from ._task import Blocking, SupportsDropTask, Task
 
 
 class _PortQ(SupportsDropTask):
     """Tasks wait for credit to become available."""
 
-    def __init__(self):
+    blocked_on = "CreditPool"
+
+    def __init__(self, port: str = "get"):
+        # Blocking method name, e.g. "get"
+        self.port = port
+
         # priority, index, task, n
         self._items: list[tuple[int, int, Task[Any], ReqCredit | None, int]] = []
 
@@ -21,6 +27,9 @@ class _PortQ(SupportsDropTask):
         # Breaks (time, priority, ...) ties in the heapq
         self._index: int = 0
 
+    def wait_label(self) -> str:
+        return f"{self.blocked_on}.{self.port}"
+
     def __len__(self) -> int:
         return len(self._items)
 
@@ -52,10 +61,16 @@ class _PortQ(SupportsDropTask):
 
 
 class _PortLock(SupportsDropTask):
+    blocked_on = "CreditPool"
+
     def __init__(self, parent: CreditPool):
         self._parent = parent
         self._task: Task[Any] | None = None
 
+    def wait_label(self) -> None:
+        # Port held by a woken task, not waiting
+        return None
+
     def __bool__(self) -> bool:
         return self._task is not None
 
@@ -86,7 +101,9 @@ class _GetLock(_PortLock):
             self.acquire(task=self._parent._getq_pop())
 
 
-class CreditPool(KernelIf):
+class CreditPool(KernelIf, Monitored):
+    _monitor_free = True
+
     def __init__(self, value: int = 0, capacity: int = 0):
         self._capacity = capacity
         self._has_capacity = capacity > 0
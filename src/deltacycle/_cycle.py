@@ -0,0 +1,214 @@
+"""Cycle-based kernel"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from ._action import Action
+from ._kernel import DefaultKernel
+from ._task import TaskCoro
+from ._variable import Variable
+
+
+class _Comb:
+    """Combinational process."""
+
+    __slots__ = ("dirty", "func", "inputs", "level", "outputs")
+
+    def __init__(
+        self,
+        func: Callable[[], None],
+        inputs: tuple[Variable, ...],
+        outputs: tuple[Variable, ...],
+    ):
+        self.func = func
+        self.inputs = inputs
+        self.outputs = outputs
+        self.level = 0
+
+        # Needs evaluation; every process is evaluated once at start
+        self.dirty = True
+
+
+class _Settle(Action):
+    """Evaluate dirty combinational processes."""
+
+    def __init__(self, kernel: CycleKernel[Any]):
+        self._kernel = kernel
+
+    def run(self):
+        self._kernel._settle()
+
+
+class CycleKernel[MainResultType](DefaultKernel[MainResultType]):
+    """Cycle-based kernel for synchronous designs.
+
+    Combinational processes are declared up front with ``comb``,
+    with the variables they read and write.
+    The kernel sorts them in levelized (topological) order.
+    Instead of waking up each process once per input change,
+    the kernel evaluates all processes with changed inputs in one pass,
+    in level order, at the end of the time slot.
+    Each process is evaluated at most once per pass.
+
+    Registers are committed in bulk by their ``Clock``,
+    which triggers one pass per clock edge.
+
+    Combinational loops, and variables with more than one combinational
+    driver, are rejected.
+    A process that writes a variable it did not declare falls back to
+    event semantics: the kernel runs extra passes until the logic settles,
+    up to ``max_passes``.
+
+    Tasks, methods, and all other primitives keep their usual
+    event-driven semantics; use them for test benches.
+    """
+
+    # Run after other tasks and actions in the active region
+    settle_priority = 1 << 30
+
+    # Maximum passes per settle, before declaring a combinational loop
+    max_passes = 1_000
+
+    def __init__(self, coro: TaskCoro[MainResultType]):
+        super().__init__(coro)
+
+        # Combinational processes, in declaration order
+        self._combs: list[_Comb] = []
+
+        # Variable => processes that read it
+        self._readers: dict[Variable, list[_Comb]] = {}
+
+        # Levelized order; None if it needs to be recomputed
+        self._order: list[_Comb] | None = None
+
+        self._settle_action = _Settle(self)
+        self._settle_pending = False
+        self._settling = False
+
+    def comb(
+        self,
+        func: Callable[[], None],
+        inputs: Iterable[Variable],
+        outputs: Iterable[Variable],
+    ):
+        """Declare a combinational process.
+
+        The process is evaluated once at start,
+        and then whenever one of its *inputs* changes.
+
+        Args:
+            func: Function with no arguments.
+                It reads values of *inputs*, and writes values of *outputs*.
+            inputs: Variables read by *func*.
+            outputs: Variables written by *func*.
+        """
+        c = _Comb(func, tuple(dict.fromkeys(inputs)), tuple(dict.fromkeys(outputs)))
+        self._combs.append(c)
+        for v in c.inputs:
+            self._readers.setdefault(v, []).append(c)
+        self._order = None
+
+        if self._state is self.State.RUNNING:
+            self._schedule_settle()
+
+    def levels(self) -> list[list[Callable[[], None]]]:
+        """Return combinational processes, grouped by level.
+
+        Processes in level zero only read variables with no combinational
+        driver (e.g. registers, and test bench inputs).
+
+        Raises:
+            ValueError: Combinational loop, or variable with multiple drivers.
+        """
+        order = self._levelize()
+        levels: list[list[Callable[[], None]]] = []
+        for c in order:
+            if c.level == len(levels):
+                levels.append([])
+            levels[c.level].append(c.func)
+        return levels
+
+    def _levelize(self) -> list[_Comb]:
+        if self._order is not None:
+            return self._order
+
+        drivers: dict[Variable, _Comb] = {}
+        for c in self._combs:
+            for v in c.outputs:
+                if v in drivers:
+                    raise ValueError(f"Variable has multiple combinational drivers: {v!r}")
+                drivers[v] = c
+
+        # Kahn's algorithm; ties are broken by declaration order
+        succs: dict[_Comb, list[_Comb]] = {c: [] for c in self._combs}
+        npreds: dict[_Comb, int] = dict.fromkeys(self._combs, 0)
+        for c in self._combs:
+            c.level = 0
+            for v in c.inputs:
+                d = drivers.get(v)
+                if d is not None:
+                    succs[d].append(c)
+                    npreds[c] += 1
+
+        ready = deque(c for c in self._combs if npreds[c] == 0)
+        order: list[_Comb] = []
+        while ready:
+            c = ready.popleft()
+            order.append(c)
+            for s in succs[c]:
+                s.level = max(s.level, c.level + 1)
+                npreds[s] -= 1
+                if npreds[s] == 0:
+                    ready.append(s)
+
+        if len(order) != len(self._combs):
+            loop = [c.func for c in self._combs if npreds[c]]
+            raise ValueError(f"Combinational loop: {loop}")
+
+        # Stable order by level
+        order.sort(key=lambda c: c.level)
+        self._order = order
+        return order
+
+    def _schedule_settle(self):
+        if not self._settle_pending:
+            self._settle_pending = True
+            when = max(self._time, self.start_time)
+            self.call_action_at(when, self._settle_action, self.settle_priority)
+
+    def _settle(self):
+        self._settle_pending = False
+        order = self._levelize()
+
+        self._settling = True
+        try:
+            for _ in range(self.max_passes):
+                for c in order:
+                    if c.dirty:
+                        c.dirty = False
+                        c.func()
+                # An undeclared write may have dirtied an earlier level
+                if not any(c.dirty for c in order):
+                    return
+        finally:
+            self._settling = False
+
+        raise RuntimeError(f"Combinational logic did not settle in {self.max_passes} passes")
+
+    def touch_var(self, v: Variable):
+        super().touch_var(v)
+        readers = self._readers.get(v)
+        if readers:
+            for c in readers:
+                c.dirty = True
+            if not self._settling:
+                self._schedule_settle()
+
+    def _start(self):
+        init = self._state is self.State.INIT
+        super()._start()
+        if init and self._combs:
+            self._schedule_settle()
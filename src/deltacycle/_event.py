@@ -12,6 +12,8 @@ from ._task import Blocking, SupportsDropTask, Task
 class _WaitQ(SupportsDropTask):
     """Tasks wait for event trigger."""
 
+    blocked_on = "Event"
+
     def __init__(self):
         self._items: dict[Task[Any], Event | None] = {}
 
@@ -0,0 +1,173 @@
+"""Log-bucketed histogram"""
+
+from __future__ import annotations
+
+from typing import Any, Self
+
+
+class Histogram:
+    """Histogram of non-negative integers, with log-scale buckets.
+
+    Similar to an HDR histogram:
+    values less than ``2**precision`` have their own buckets;
+    larger values share buckets that span ``1 / 2**(precision - 1)``
+    of the value, or less.
+    Memory depends on the range of values, not the number of samples.
+    Only non-empty buckets are stored.
+
+    Histograms with the same precision may be merged,
+    e.g. from different primitives, or from different simulation runs.
+    """
+
+    def __init__(self, precision: int = 5):
+        if precision < 1:
+            raise ValueError(f"Expected precision ≥ 1, got {precision}")
+
+        self._precision = precision
+        self._half = 1 << (precision - 1)
+
+        # Bucket index => count
+        self._counts: dict[int, int] = {}
+
+        self._count = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+
+    def _index(self, value: int) -> int:
+        k = value.bit_length() - self._precision
+        if k <= 0:
+            return value
+        return k * self._half + (value >> k)
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        if index < 2 * self._half:
+            return index, index
+        k = index // self._half - 1
+        m = index - k * self._half
+        return m << k, ((m + 1) << k) - 1
+
+    @property
+    def precision(self) -> int:
+        """Bucket precision, in significant bits."""
+        return self._precision
+
+    @property
+    def count(self) -> int:
+        """Number of samples."""
+        return self._count
+
+    @property
+    def min(self) -> int:
+        """Minimum sample; zero if empty."""
+        return self._min
+
+    @property
+    def max(self) -> int:
+        """Maximum sample; zero if empty."""
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of the samples; zero if empty."""
+        return self._sum / self._count if self._count else 0.0
+
+    def record(self, value: int, count: int = 1):
+        """Add *count* samples of *value*.
+
+        Raises:
+            ValueError: Negative value.
+        """
+        if value < 0:
+            raise ValueError(f"Expected value ≥ 0, got {value}")
+
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+
+        if self._count == 0:
+            self._min = self._max = value
+        else:
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+        self._count += count
+        self._sum += value * count
+
+    def merge(self, other: Histogram) -> Self:
+        """Add the samples of *other* to this histogram.
+
+        Returns:
+            This histogram.
+
+        Raises:
+            ValueError: Precisions do not match.
+        """
+        if other._precision != self._precision:
+            raise ValueError(f"Expected precision {self._precision}, got {other._precision}")
+        if other._count == 0:
+            return self
+
+        for index, n in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + n
+
+        if self._count == 0:
+            self._min, self._max = other._min, other._max
+        else:
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        self._count += other._count
+        self._sum += other._sum
+        return self
+
+    def percentile(self, p: float) -> int:
+        """Return the *p* percentile, e.g. 99 for p99.
+
+        The result is the highest value in the bucket of the percentile,
+        clamped to the sample range.
+        Zero if empty.
+
+        Raises:
+            ValueError: p is not in [0, 100].
+        """
+        q = p / 100
+        if not 0 <= q <= 1:
+            raise ValueError(f"Expected 0 ≤ p ≤ 100, got {p}")
+        if self._count == 0:
+            return 0
+
+        rank = max(q * self._count, 1)
+        total = 0
+        for index in sorted(self._counts):
+            total += self._counts[index]
+            if total >= rank:
+                _, hi = self._bounds(index)
+                return max(min(hi, self._max), self._min)
+        return self._max  # pragma: no cover
+
+    def buckets(self) -> list[tuple[int, int, int]]:
+        """Return (low, high, count) rows for non-empty buckets, lowest first.
+
+        Bucket bounds are inclusive.
+        """
+        return [(*self._bounds(i), self._counts[i]) for i in sorted(self._counts)]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible dump of the histogram."""
+        return {
+            "precision": self._precision,
+            "count": self._count,
+            "sum": self._sum,
+            "min": self._min,
+            "max": self._max,
+            "counts": [[i, self._counts[i]] for i in sorted(self._counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> Histogram:
+        """Load a histogram dumped by ``to_dict``."""
+        h = cls(d["precision"])
+        h._counts = {i: n for i, n in d["counts"]}
+        h._count = d["count"]
+        h._sum = d["sum"]
+        h._min = d["min"]
+        h._max = d["max"]
+        return h
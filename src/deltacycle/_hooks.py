@@ -0,0 +1,92 @@
+"""Kernel hooks"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from ._action import QueueItem
+from ._probe import Probe, _Shadow
+from ._task import Task
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+type SlotHook = Callable[[int], Any]
+type TimeHook = Callable[[int, int], Any]
+type TaskHook = Callable[[Task[Any]], Any]
+
+
+class HookProbe(Probe):
+    """Call user hooks at slot and task boundaries.
+
+    Installed only while some hook is registered.
+    The event queue is shadowed only while task hooks are registered.
+    """
+
+    def __init__(self, kernel: DefaultKernel[Any]):
+        super().__init__(kernel)
+
+        self.slot_end: list[SlotHook] = []
+        self.time_advance: list[TimeHook] = []
+        self.task_start: list[TaskHook] = []
+        self.task_done: list[TaskHook] = []
+
+        # Task activation being watched for completion
+        self._task: Task[Any] | None = None
+
+    def _lists(self) -> list[list[Any]]:
+        return [self.slot_end, self.time_advance, self.task_start, self.task_done]
+
+    def empty(self) -> bool:
+        return not any(self._lists())
+
+    def remove(self, f: Callable[..., Any]) -> bool:
+        found = False
+        for hooks in self._lists():
+            while f in hooks:
+                hooks.remove(f)
+                found = True
+        return found
+
+    def _shadows(self) -> list[_Shadow]:
+        kernel = self._kernel
+        queue = kernel._queue
+        pop = queue.pop
+        run_slot = kernel._run_slot
+
+        def hooked_pop() -> QueueItem:
+            self._check_done()
+            item = pop()
+            if item[2] is not None:
+                task = self._task = item[1]
+                if item[2][0] is Task.Command.START:
+                    for f in self.task_start:
+                        f(task)
+            return item
+
+        def hooked_run_slot(t: int) -> bool:
+            old = kernel.time()
+            for f in self.time_advance:
+                f(old, t)
+            try:
+                finished = run_slot(t)
+            finally:
+                self._check_done()
+            if not finished:
+                for f in self.slot_end:
+                    f(t)
+            return finished
+
+        shadows: list[_Shadow] = [(kernel, "_run_slot", hooked_run_slot)]
+        if self.task_start or self.task_done:
+            shadows.append((queue, "pop", hooked_pop))
+        return shadows
+
+    def _check_done(self):
+        task = self._task
+        if task is not None:
+            self._task = None
+            if task.done():
+                for f in self.task_done:
+                    f(task)
@@ -1,19 +1,45 @@
 """Execution Kernel"""
 
 import heapq
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
 from enum import IntEnum
-from typing import Any, ClassVar, Never
+from os import PathLike
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar, Never, TextIO, cast
 from weakref import WeakKeyDictionary
 
+from ._action import Action, QueueItem
+from ._hooks import SlotHook, TaskHook, TimeHook, HookProbe
+from ._latency import LatencyReport, LatencyProbe
+from ._probe import Probe
+from ._profile import TaskProfile, ProfileProbe
+from ._sensitivity import SensitivityReport, SensitivityProbe
+from ._stats import KernelStats, StatsProbe
 from ._task import Blocking, Kill, SupportsDropTask, Task, TaskArgs, TaskCoro
-from ._variable import Variable
+from ._trace import TraceProbe
+from ._variable import PredVariable, Subscription, Variable
+from ._watchdog import _WatchdogProbe
+
+if TYPE_CHECKING:
+    from ._method import _Ranker, _RankQ
+
+# Event queue entry: (time, region, priority, index, task/action, args)
+type _Entry = (
+    tuple[int, int, int, int, Task[Any], TaskArgs] | tuple[int, int, int, int, Action, None]
+)
 
 
 class _ForkTable(SupportsDropTask):
     """Tasks wait for event trigger."""
 
+    blocked_on = "any_of/all_of"
+
+    def wait_label(self) -> str:
+        return "AnyOf/AllOf"
+
     def __init__(self):
         self._items: dict[Task[Any], set[Blocking]] = {}
 
@@ -51,6 +77,39 @@ class KernelExit(BaseException):
     """Force the kernel to exit."""
 
 
+class LivelockError(RuntimeError):
+    """Time slot exceeded its budget of task activations or variable updates.
+
+    Usually caused by a zero-delay feedback loop,
+    e.g. two tasks that wake each other up with ``set_next`` forever.
+
+    Attributes:
+        time: Simulation time of the runaway slot.
+        tasks: Most frequent tasks and actions in a sample of the slot,
+            as (name, count) pairs, most frequent first.
+        variables: Most frequently updated variables in the same sample,
+            as (name, count) pairs, most frequent first.
+            Variables without a name are identified by ``repr``.
+    """
+
+    def __init__(
+        self,
+        reason: str,
+        time: int,
+        tasks: list[tuple[str, int]],
+        variables: list[tuple[str, int]],
+    ):
+        lines = [f"Zero-delay livelock at time {time}: {reason}"]
+        lines.append("Top tasks:")
+        lines.extend(f"    {n:8d}  {name}" for name, n in tasks)
+        lines.append("Top variables:")
+        lines.extend(f"    {n:8d}  {name}" for name, n in variables)
+        super().__init__("\n".join(lines))
+        self.time = time
+        self.tasks = tasks
+        self.variables = variables
+
+
 class Kernel[MainResultType](ABC):
     """Simulation Kernel.
 
@@ -95,6 +154,28 @@ class Kernel[MainResultType](ABC):
 
     _done = State.COMPLETED & State.FINISHED
 
+    class Region(IntEnum):
+        """Scheduling regions within a time slot.
+
+        Modeled on SystemVerilog.
+        Events in a time slot run in region order.
+        Within a region, they run in priority order.
+        An event scheduled into an earlier region runs before any remaining
+        events in later regions of the same time slot.
+
+        * ACTIVE: Default region for tasks, actions, and methods
+        * INACTIVE: Runs after the active region is empty
+        * NBA: Non-blocking assignments; see ``nba``
+        * OBSERVED: Runs after variables settle, e.g. for assertions
+        * POSTPONED: Read-only; sample final values, e.g. for monitors
+        """
+
+        ACTIVE = 0
+        INACTIVE = 1
+        NBA = 2
+        OBSERVED = 3
+        POSTPONED = 4
+
     _state_transitions: ClassVar = {
         State.INIT: {
             State.RUNNING,
@@ -121,6 +202,9 @@ class Kernel[MainResultType](ABC):
 
         # Currently executing task
         self._task: Task[Any] | None = None
+
+        # Currently executing region
+        self._region = self.Region.ACTIVE
         self._task_index = 0
 
         # Main task
@@ -134,6 +218,13 @@ class Kernel[MainResultType](ABC):
         # Model variables
         self._dirty_vars: set[Variable] = set()
 
+        # Variable updates in the current time slot
+        self._nupdates = 0
+
+        # Ranked methods: dependency graph, and queues by (region, priority)
+        self._ranker: _Ranker | None = None
+        self._rank_queues: dict[tuple[Kernel.Region, int], _RankQ] = {}
+
     @classmethod
     def _get_index(cls) -> int:
         index = cls._index
@@ -193,16 +284,34 @@ class Kernel[MainResultType](ABC):
     def call_at(self, when: int, task: Task[Any], args: TaskArgs) -> None:
         """Schedule task to run at specified time: ``when``."""
 
+    @abstractmethod
+    def call_action_at(
+        self,
+        when: int,
+        action: Action,
+        priority: int = 0,
+        region: Region = Region.ACTIVE,
+    ) -> None:
+        """Schedule action to run at specified time: ``when``.
+
+        Actions run in the same event queue as tasks,
+        and are ordered by the same rules.
+        """
+
     def _create_task[ResultType](
         self,
         coro: TaskCoro[ResultType],
         name: str | None = None,
+        sensitive: Iterable[PredVariable] | None = None,
     ) -> Task[ResultType]:
         assert self._time >= self.start_time
         index = self._get_task_index()
         if name is None:
             name = f"Task-{index}"
-        return Task(coro, index, name)
+        task = Task(coro, index, name)
+        if sensitive is not None:
+            task._sensitive = Subscription(*sensitive)
+        return task
 
     @abstractmethod
     def create_task[ResultType](
@@ -213,11 +322,33 @@ class Kernel[MainResultType](ABC):
     ) -> Task[ResultType]:
         """Create child task, and schedule it soon.
 
+        All kernels support the ``sensitive`` keyword argument:
+        an iterable of PredVariables for the task's static sensitivity.
+        All kernels support the ``region`` keyword argument:
+        the scheduling region the task runs in.
+
         Returns:
             Handle to the created task
         """
 
+    def region(self) -> Region:
+        """Currently executing scheduling region."""
+        return self._region
+
+    def check_write(self):
+        """Raise RuntimeError if variables are read-only in the current region.
+
+        Variables check before they record a new value,
+        so a rejected write has no effect.
+        """
+        if self._region is self.Region.POSTPONED:
+            raise RuntimeError("Cannot update variables in the postponed region")
+
     def touch_var(self, v: Variable):
+        # Variables call check_write before they record a new value.
+        # Clock edges and register updates are exempt:
+        # they always run in the active region.
+        self._nupdates += 1
         self._dirty_vars.add(v)
 
     def _update_vars(self):
@@ -244,14 +375,53 @@ class Kernel[MainResultType](ABC):
         self._set_state(self.State.FINISHED)
 
     @abstractmethod
-    def _call(self, limit: int | None) -> None:
+    def _call(self, limit: int | None, stop: Callable[[], bool] | None) -> None:
         """Run a simulation.
 
         Invoked by the public ``__call__`` method.
         Implements the inner loop of the top-level ``run`` function.
+
+        If *stop* is not None, call it after each time slot,
+        and return if it returns True.
         """
 
-    def __call__(self, ticks: int | None = None, until: int | None = None):
+    @staticmethod
+    def _stop_check(
+        max_wall_seconds: float | None,
+        max_slots: int | None,
+        stop_when: Callable[[], bool] | None,
+    ) -> Callable[[], bool] | None:
+        """Return an end-of-slot check for the run limits, or None if unlimited."""
+        if max_wall_seconds is None and max_slots is None and stop_when is None:
+            return None
+        if max_slots is not None and max_slots < 1:
+            raise ValueError(f"Expected max_slots ≥ 1, got {max_slots}")
+
+        deadline = None if max_wall_seconds is None else perf_counter() + max_wall_seconds
+        slots = 0
+
+        def stop() -> bool:
+            nonlocal slots
+            slots += 1
+            if max_slots is not None and slots >= max_slots:
+                return True
+            if deadline is not None and perf_counter() >= deadline:
+                return True
+            return stop_when is not None and stop_when()
+
+        return stop
+
+    def __call__(
+        self,
+        ticks: int | None = None,
+        until: int | None = None,
+        *,
+        max_wall_seconds: float | None = None,
+        max_slots: int | None = None,
+        stop_when: Callable[[], bool] | None = None,
+    ):
+        stop = self._stop_check(max_wall_seconds, max_slots, stop_when)
+
         # Determine the run limit
         if ticks is None:
             # Run until absolute limit, or no tasks left
@@ -263,7 +433,7 @@ class Kernel[MainResultType](ABC):
                 # Both relative & absolute given; clamp to soonest
                 limit = min(limit, until)
 
-        self._call(limit)
+        self._call(limit, stop)
 
     @abstractmethod
     def _iter(self) -> Iterator[int]:
@@ -278,21 +448,29 @@ class Kernel[MainResultType](ABC):
 
 
 class _PendQ(SupportsDropTask):
-    """Priority queue for ordering task execution."""
+    """Priority queue for ordering task execution.
+
+    Also holds kernel actions, which have no task args.
+    """
+
+    blocked_on = "sleep"
+
+    def wait_label(self) -> None:
+        # Scheduled, or sleeping
+        return None
 
     def __init__(self):
-        # time, priority, index, task, value
-        self._items: list[tuple[int, int, int, Task[Any], TaskArgs]] = []
+        self._items: list[_Entry] = []
 
         # Monotonically increasing integer
-        # Breaks (time, priority, ...) ties in the heapq
+        # Breaks (time, region, priority, ...) ties in the heapq
         self._index: int = 0
 
     def __len__(self) -> int:
         return len(self._items)
 
     def _find(self, task: Task[Any]) -> int:
-        for i, (_, _, _, t, _) in enumerate(self._items):
+        for i, (_, _, _, _, t, _) in enumerate(self._items):
             if t is task:
                 return i
         raise ValueError(f"Task not in queue: {task}")  # pragma: no cover
@@ -303,33 +481,96 @@ class _PendQ(SupportsDropTask):
         heapq.heapify(self._items)
         task._unlink(tq=self)
 
-    def push(self, time: int, priority: int, task: Task[Any], args: TaskArgs):
+    def push(self, time: int, region: int, priority: int, task: Task[Any], args: TaskArgs):
         task._link(tq=self)
-        heapq.heappush(self._items, (time, priority, self._index, task, args))
+        heapq.heappush(self._items, (time, region, priority, self._index, task, args))
         self._index += 1
 
-    def pop(self) -> tuple[Task[Any], TaskArgs]:
-        _, _, _, task, args = heapq.heappop(self._items)
-        task._unlink(tq=self)
-        return (task, args)
+    def push_action(self, time: int, region: int, priority: int, action: Action):
+        heapq.heappush(self._items, (time, region, priority, self._index, action, None))
+        self._index += 1
+
+    def pop(self) -> QueueItem:
+        entry = heapq.heappop(self._items)
+        if entry[5] is None:
+            return (entry[1], entry[4], None)
+        entry[4]._unlink(tq=self)
+        return (entry[1], entry[4], entry[5])
 
     def peek(self) -> int:
         assert self._items
         return self._items[0][0]
 
 
+class _LivelockSample:
+    """Count tasks and variable updates in a runaway time slot."""
+
+    def __init__(self, kernel: Kernel[Any], reason: str):
+        self._kernel = kernel
+        self._reason = reason
+        self.n = 0
+        self._tasks: Counter[str] = Counter()
+        self._vars: Counter[str] = Counter()
+
+        # Shadow the kernel method; there is no cost unless sampling
+        touch_var = kernel.touch_var
+
+        def counting_touch_var(v: Variable):
+            self._vars[v.name or repr(v)] += 1
+            touch_var(v)
+
+        setattr(kernel, "touch_var", counting_touch_var)
+
+    def count(self, item: Task[Any] | Action):
+        self.n += 1
+        name = item.name if isinstance(item, Task) else repr(item)
+        self._tasks[name] += 1
+
+    def error(self, top: int) -> LivelockError:
+        delattr(self._kernel, "touch_var")
+        return LivelockError(
+            self._reason,
+            self._kernel.time(),
+            self._tasks.most_common(top),
+            self._vars.most_common(top),
+        )
+
+
 class DefaultKernel[MainResultType](Kernel[MainResultType]):
     """Default simulation kernel
 
     Tasks are scheduled with a (heapq) priority queue.
+    Kernel actions (e.g. clock edges) share the same queue.
 
     Task ordering rules:
 
     * Tasks scheduled at different times run in time order.
-    * Tasks scheduled at same time run in priority order.
-    * Tasks scheduled at same time with same priority run in insertion order.
+    * Tasks scheduled at same time run in region order.
+    * Tasks scheduled at same time and region run in priority order.
+    * Tasks scheduled at same time, region, and priority run in insertion order.
 
     Priority is an arbitrary integer.
+    Region is a ``Kernel.Region``.
+
+    Each time slot has a budget of task activations
+    (``max_slot_activations``) and variable updates (``max_slot_updates``).
+    If a slot exceeds its budget, the kernel samples the next
+    ``livelock_sample`` events, stops, and raises ``LivelockError``
+    with the most frequent tasks and variables.
+
+    Performance counters are off by default.
+    Use ``enable_stats`` to turn them on, and ``stats`` to read them.
+    Likewise, use ``enable_profile`` to time task activations,
+    ``enable_trace`` to write a timeline of task activity,
+    ``enable_sensitivity`` to find wasted predicate evaluations,
+    ``enable_latency`` to measure how long tasks wait,
+    and ``enable_watchdog`` to catch tasks that do not yield.
+
+    Hooks (``on_slot_end``, ``on_time_advance``,
+    ``on_task_start``, and ``on_task_done``) run user callbacks
+    at slot and task boundaries, e.g. for recorders, coverage,
+    and assertions.
+    Like instrumentation, they have no cost unless registered.
 
     The ``main`` (parent) task will be assigned priority zero.
     """
@@ -337,27 +578,291 @@ class DefaultKernel[MainResultType](Kernel[MainResultType]):
     main_priority = 0
     task_priority = 0
 
+    # Per time slot budgets; None to disable
+    max_slot_activations: int | None = 1_000_000
+    max_slot_updates: int | None = 10_000_000
+
+    # Events sampled for a livelock diagnostic
+    livelock_sample = 10_000
+    livelock_top = 5
+
     def __init__(self, coro: TaskCoro[MainResultType]):
         super().__init__(coro)
 
         # Task queue
         self._queue = _PendQ()
 
-        # Task priorities
-        self._priorities: WeakKeyDictionary[Task[Any], int] = WeakKeyDictionary()
-        self._priorities[self._main] = self.main_priority
+        # Task (region, priority)
+        self._priorities: WeakKeyDictionary[Task[Any], tuple[int, int]] = WeakKeyDictionary()
+        self._priorities[self._main] = (self.Region.ACTIVE, self.main_priority)
+
+        # Instrumentation, in install order
+        self._probes: dict[type[Probe], Probe] = {}
+
+    def _set_probe(self, kind: type[Probe], probe: Probe | None):
+        for p in reversed(self._probes.values()):
+            p.uninstall()
+        self._probes.pop(kind, None)
+        if probe is not None:
+            self._probes[kind] = probe
+        for p in self._probes.values():
+            p.install()
+
+    def enable_stats(self):
+        """Start counting kernel events.
+
+        Counters are reset.
+        While disabled, counting has no cost.
+        """
+        self._set_probe(StatsProbe, StatsProbe(self))
+
+    def disable_stats(self):
+        """Stop counting kernel events."""
+        self._set_probe(StatsProbe, None)
+
+    def stats(self) -> KernelStats:
+        """Return a snapshot of kernel performance counters.
+
+        Raises:
+            RuntimeError: Stats are not enabled.
+        """
+        probe = self._probes.get(StatsProbe)
+        if probe is None:
+            raise RuntimeError("Stats are not enabled")
+        return cast(StatsProbe, probe).snapshot()
+
+    def enable_profile(self):
+        """Start timing task activations.
+
+        The profile is reset.
+        While disabled, profiling has no cost.
+        """
+        self._set_probe(ProfileProbe, ProfileProbe(self))
+
+    def disable_profile(self):
+        """Stop timing task activations."""
+        self._set_probe(ProfileProbe, None)
+
+    def profile(self) -> TaskProfile:
+        """Return a snapshot of the task CPU time profile.
+
+        Raises:
+            RuntimeError: Profiling is not enabled.
+        """
+        probe = self._probes.get(ProfileProbe)
+        if probe is None:
+            raise RuntimeError("Profiling is not enabled")
+        return cast(ProfileProbe, probe).snapshot()
+
+    def enable_sensitivity(self):
+        """Start counting predicate evaluations, by variable and predicate.
+
+        The counts are reset.
+        While disabled, counting has no cost.
+        """
+        self._set_probe(SensitivityProbe, SensitivityProbe(self))
+
+    def disable_sensitivity(self):
+        """Stop counting predicate evaluations."""
+        self._set_probe(SensitivityProbe, None)
+
+    def sensitivity(self) -> SensitivityReport:
+        """Return a snapshot of predicate evaluation counts.
+
+        Raises:
+            RuntimeError: Sensitivity counting is not enabled.
+        """
+        probe = self._probes.get(SensitivityProbe)
+        if probe is None:
+            raise RuntimeError("Sensitivity counting is not enabled")
+        return cast(SensitivityProbe, probe).snapshot()
+
+    def enable_latency(self, precision: int = 5):
+        """Start recording task wait times, by primitive.
+
+        Histograms are reset.
+        While disabled, recording has no cost.
+
+        Args:
+            precision: Histogram precision, in significant bits.
+
+        Raises:
+            ValueError: Invalid precision.
+        """
+        self._set_probe(LatencyProbe, LatencyProbe(self, precision))
+
+    def disable_latency(self):
+        """Stop recording task wait times."""
+        self._set_probe(LatencyProbe, None)
+
+    def latency(self) -> LatencyReport:
+        """Return a snapshot of task wait time histograms.
+
+        Raises:
+            RuntimeError: Latency recording is not enabled.
+        """
+        probe = self._probes.get(LatencyProbe)
+        if probe is None:
+            raise RuntimeError("Latency recording is not enabled")
+        return cast(LatencyProbe, probe).snapshot()
+
+    def enable_trace(
+        self,
+        path: str | PathLike[str],
+        axis: str = "sim",
+        timescale: int = 1000,
+        buffering: int = 1 << 20,
+    ):
+        """Start writing task activity to a Chrome Trace Event JSON file.
+
+        The file can be viewed with Perfetto (https://ui.perfetto.dev),
+        or ``chrome://tracing``.
+        Each task, and each kind of kernel action, has its own track.
+        Each activation is a slice, with its simulation time,
+        wall time, task command, and what the task blocked on after it ran.
+        Flow arrows connect a task to the tasks it woke up.
+
+        Events are written as they happen, through a buffered file.
+
+        Args:
+            path: Output file path.
+            axis: Timeline axis: ``"sim"`` or ``"wall"``.
+                On the simulation time axis, each time step spans
+                *timescale* microseconds, and activations in a time slot
+                are laid out in execution order, one microsecond each.
+                A slot with more than *timescale* activations
+                warns once, and the rest share its last microsecond.
+                On the wall time axis, slices show wall time.
+            timescale: Microseconds per simulation time step (sim axis).
+            buffering: File buffer size, in bytes.
+
+        Raises:
+            ValueError: Invalid axis or timescale.
+        """
+        self.disable_trace()
+        self._set_probe(TraceProbe, TraceProbe(self, path, axis, timescale, buffering))
+
+    def disable_trace(self):
+        """Stop tracing, and close the trace file."""
+        probe = self._probes.get(TraceProbe)
+        if probe is not None:
+            self._set_probe(TraceProbe, None)
+            cast(TraceProbe, probe).close()
+
+    def enable_watchdog(
+        self,
+        timeout: float,
+        raise_timeout: bool = False,
+        file: TextIO | None = None,
+    ):
+        """Start a thread that watches for tasks that do not yield.
+
+        If one task or action runs for more than *timeout* seconds
+        of wall time, without awaiting, write its name,
+        the simulation time, and the stack of the kernel thread to *file*.
+        Each activation is reported at most once.
+
+        The kernel only writes the current task and a timestamp
+        when it dispatches a task.
+
+        Args:
+            timeout: Wall time threshold, in seconds.
+            raise_timeout: Also raise ``WatchdogTimeout`` in the task.
+                This is best effort, and does not interrupt C code.
+            file: Output stream; default is ``sys.stderr``.
+
+        Raises:
+            ValueError: Invalid timeout.
+        """
+        self.disable_watchdog()
+        probe = _WatchdogProbe(self, timeout, raise_timeout, file)
+        self._set_probe(_WatchdogProbe, probe)
+        probe.start()
+
+    def disable_watchdog(self):
+        """Stop the watchdog thread."""
+        probe = self._probes.get(_WatchdogProbe)
+        if probe is not None:
+            self._set_probe(_WatchdogProbe, None)
+            cast(_WatchdogProbe, probe).stop()
+
+    def _add_hook[F](self, hooks: Callable[[HookProbe], list[F]], f: F) -> F:
+        probe = cast(HookProbe | None, self._probes.get(HookProbe))
+        if probe is None:
+            probe = HookProbe(self)
+        hooks(probe).append(f)
+        # Reinstall, to shadow the event queue if necessary
+        self._set_probe(HookProbe, probe)
+        return f
+
+    def on_slot_end(self, f: SlotHook) -> SlotHook:
+        """Call ``f(time)`` at the end of each time slot.
+
+        Hooks run after variable updates, so they see settled values.
+        They should not change model state.
+        Exceptions raised by hooks propagate out of ``run``.
+
+        Returns *f*, so this method may be used as a decorator.
+        """
+        return self._add_hook(lambda p: p.slot_end, f)
+
+    def on_time_advance(self, f: TimeHook) -> TimeHook:
+        """Call ``f(old, new)`` when simulation time advances.
+
+        Hooks run before the first task of the new time slot.
+        Before the first slot, *old* is ``init_time``.
+
+        Returns *f*, so this method may be used as a decorator.
+        """
+        return self._add_hook(lambda p: p.time_advance, f)
+
+    def on_task_start(self, f: TaskHook) -> TaskHook:
+        """Call ``f(task)`` before a task runs for the first time.
+
+        Returns *f*, so this method may be used as a decorator.
+        """
+        return self._add_hook(lambda p: p.task_start, f)
+
+    def on_task_done(self, f: TaskHook) -> TaskHook:
+        """Call ``f(task)`` after a task returns, raises, or is killed.
+
+        Hooks run before the next task, or at the end of the time slot.
+
+        Returns *f*, so this method may be used as a decorator.
+        """
+        return self._add_hook(lambda p: p.task_done, f)
+
+    def remove_hook(self, f: Callable[..., Any]):
+        """Remove all registrations of hook *f*.
+
+        Raises:
+            ValueError: *f* is not registered.
+        """
+        probe = cast(HookProbe | None, self._probes.get(HookProbe))
+        if probe is None or not probe.remove(f):
+            raise ValueError(f"Hook not registered: {f!r}")
+        self._set_probe(HookProbe, None if probe.empty() else probe)
 
     def call_soon(self, task: Task[Any], args: TaskArgs):
-        priority = self._priorities[task]
-        self._queue.push(self._time, priority, task, args)
+        region, priority = self._priorities[task]
+        self._queue.push(self._time, region, priority, task, args)
 
     def call_later(self, delay: int, task: Task[Any], args: TaskArgs):
-        priority = self._priorities[task]
-        self._queue.push(self._time + delay, priority, task, args)
+        region, priority = self._priorities[task]
+        self._queue.push(self._time + delay, region, priority, task, args)
 
     def call_at(self, when: int, task: Task[Any], args: TaskArgs):
-        priority = self._priorities[task]
-        self._queue.push(when, priority, task, args)
+        region, priority = self._priorities[task]
+        self._queue.push(when, region, priority, task, args)
+
+    def call_action_at(
+        self,
+        when: int,
+        action: Action,
+        priority: int = 0,
+        region: Kernel.Region = Kernel.Region.ACTIVE,
+    ):
+        self._queue.push_action(when, region, priority, action)
 
     def create_task[ResultType](
         self,
@@ -365,24 +870,111 @@ class DefaultKernel[MainResultType](Kernel[MainResultType]):
         name: str | None = None,
         **kwargs: Any,
     ) -> Task[ResultType]:
-        task = super()._create_task(coro, name)
-        self._priorities[task] = kwargs.get("priority", self.task_priority)
+        task = super()._create_task(coro, name, kwargs.get("sensitive"))
+        region = self.Region(kwargs.get("region", self.Region.ACTIVE))
+        priority = kwargs.get("priority", self.task_priority)
+        self._priorities[task] = (region, priority)
         self.call_soon(task, args=(Task.Command.START,))
         return task
 
-    def _iter_time_slot(self, time: int) -> Iterator[tuple[Task[Any], TaskArgs]]:
-        """Iterate through all tasks in a time slot.
+    def _iter_time_slot(self, time: int) -> Iterator[QueueItem]:
+        """Iterate through all tasks and actions in a time slot.
 
-        The first task has already been peeked.
+        The first item has already been peeked.
         This is a do-while loop.
         """
-        task, args = self._queue.pop()
-        yield (task, args)
+        yield self._queue.pop()
         while self._queue and self._queue.peek() == time:
-            task, args = self._queue.pop()
-            yield (task, args)
+            yield self._queue.pop()
 
-    def _call(self, limit: int | None):
+    def _sample_livelock(
+        self,
+        sample: _LivelockSample | None,
+        item: Task[Any] | Action,
+        n: int,
+        alimit: int,
+        ulimit: int,
+    ) -> _LivelockSample:
+        if sample is None:
+            if n > alimit:
+                reason = f"more than {alimit} activations"
+            else:
+                reason = f"more than {ulimit} variable updates"
+            sample = _LivelockSample(self, reason)
+        sample.count(item)
+        if sample.n > self.livelock_sample:
+            self._finish()
+            raise sample.error(self.livelock_top)
+        return sample
+
+    def _run_slot(self, time: int) -> bool:
+        """Execute one time slot.
+
+        Returns:
+            True if a task called ``finish``, otherwise False.
+        """
+        # Advance to new timeslot
+        self._time = time
+
+        # Livelock detection
+        n = 0
+        alimit = self.max_slot_activations or sys.maxsize
+        ulimit = self.max_slot_updates or sys.maxsize
+        self._nupdates = 0
+        sample: _LivelockSample | None = None
+
+        for item in self._iter_time_slot(time):
+            self._region = item[0]
+
+            n += 1
+            if n > alimit or self._nupdates > ulimit:
+                sample = self._sample_livelock(sample, item[1], n, alimit, ulimit)
+                # Sample every remaining event
+                alimit = ulimit = 0
+
+            # Action: no args
+            if item[2] is None:
+                try:
+                    item[1].run()
+                except KernelExit:
+                    self._finish()
+                    return True
+                except Exception:
+                    # Actions have no task to hold the exception,
+                    # and the rest of the slot cannot resume.
+                    self._region = self.Region.ACTIVE
+                    self._finish()
+                    raise
+                continue
+
+            # Task
+            task = item[1]
+            self._task = task
+            try:
+                task.do_run(item[2])
+            except KernelExit:
+                self._finish()
+                return True
+            except StopIteration as exc:
+                task.do_result(exc)
+            except Kill as exc:
+                task.do_except(exc)
+            except Exception as exc:
+                task.do_except(exc)
+            finally:
+                self._task = None
+
+        # Budget exceeded, but the slot finished before the sample was full
+        if sample is not None:
+            self._finish()
+            raise sample.error(self.livelock_top)
+
+        # Update simulation state
+        self._region = self.Region.ACTIVE
+        self._update_vars()
+        return False
+
+    def _call(self, limit: int | None, stop: Callable[[], bool] | None):
         self._start()
 
         while self._queue:
@@ -396,28 +988,13 @@ class DefaultKernel[MainResultType](Kernel[MainResultType]):
             if limit is not None and time >= limit:
                 return
 
-            # Otherwise, advance to new timeslot
-            self._time = time
+            # Otherwise, execute time slot
+            if self._run_slot(time):
+                return
 
-            # Execute time slot
-            for task, args in self._iter_time_slot(time):
-                self._task = task
-                try:
-                    task.do_run(args)
-                except KernelExit:
-                    self._finish()
-                    return
-                except StopIteration as exc:
-                    task.do_result(exc)
-                except Kill as exc:
-                    task.do_except(exc)
-                except Exception as exc:
-                    task.do_except(exc)
-                finally:
-                    self._task = None
-
-            # Update simulation state
-            self._update_vars()
+            # Halt if we hit a wall time, slot count, or model limit
+            if stop is not None and stop():
+                return
 
         # All tasks exhausted
         self._complete()
@@ -435,28 +1012,9 @@ class DefaultKernel[MainResultType](Kernel[MainResultType]):
             # Yield before entering new timeslot
             yield time
 
-            # Advance to new timeslot
-            self._time = time
-
             # Execute time slot
-            for task, args in self._iter_time_slot(time):
-                self._task = task
-                try:
-                    task.do_run(args)
-                except KernelExit:
-                    self._finish()
-                    return
-                except StopIteration as exc:
-                    task.do_result(exc)
-                except Kill as exc:
-                    task.do_except(exc)
-                except Exception as exc:
-                    task.do_except(exc)
-                finally:
-                    self._task = None
-
-            # Update simulation state
-            self._update_vars()
+            if self._run_slot(time):
+                return
 
         # All tasks exhausted
         self._complete()
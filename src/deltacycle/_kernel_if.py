@@ -4,13 +4,28 @@ Allows easy access to global kernel for Event, Semaphore, Task, ...
 Works around tricky circular import: Kernel => Task => Kernel.
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._kernel import Kernel
+
+# Bound on first use; an import statement on every access is slow
+_get_running_kernel: Callable[[], Kernel[Any]] | None = None
+
 
 class KernelIf:
     @property
-    def _kernel(self):
-        from ._top import get_running_kernel  # noqa: PLC0415
+    def _kernel(self) -> Kernel[Any]:
+        global _get_running_kernel  # noqa: PLW0603
+        if _get_running_kernel is None:
+            from ._top import get_running_kernel  # noqa: PLC0415
+
+            _get_running_kernel = get_running_kernel
 
-        kernel = get_running_kernel()
+        kernel = _get_running_kernel()
         try:
             cached_kernel = getattr(self, "__cached_kernel")
         except AttributeError:
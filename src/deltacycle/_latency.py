@@ -0,0 +1,173 @@
+"""Wait latency histograms"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ._action import QueueItem
+from ._histogram import Histogram
+from ._probe import _LinkHooks, _LinkObserver, Probe, _Shadow
+from ._task import SupportsDropTask, Task
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+
+type _Axis = dict[str, Histogram]
+
+
+class LatencyReport:
+    """Wait latency histograms, by primitive.
+
+    Returned by ``DefaultKernel.latency``.
+
+    A wait starts when a task blocks in a primitive,
+    and ends when the task is woken up, or reneges (e.g. ``AnyOf``).
+    Waits are measured in simulation time,
+    and in activations: the number of kernel activations (tasks and actions)
+    that ran during the wait.
+
+    Primitives are named by type, and blocking method:
+    e.g. ``"Semaphore.get"``, ``"Queue.put"``, ``"Event"``,
+    ``"PredVariable"``, ``"Task"`` (join), and ``"AnyOf/AllOf"``.
+    A task waiting on ``AnyOf`` also waits on each of its primitives.
+    """
+
+    def __init__(self, sim: _Axis, activations: _Axis):
+        self._sim = sim
+        self._activations = activations
+
+    @property
+    def sim(self) -> _Axis:
+        """Wait times in simulation time, by primitive."""
+        return self._sim
+
+    @property
+    def activations(self) -> _Axis:
+        """Wait times in activations, by primitive."""
+        return self._activations
+
+    def merge(self, other: LatencyReport) -> LatencyReport:
+        """Return a report with the samples of both reports.
+
+        E.g. to combine replications of a simulation.
+        """
+        axes: list[_Axis] = []
+        for a, b in ((self._sim, other._sim), (self._activations, other._activations)):
+            axis: _Axis = {}
+            for hs in (a, b):
+                for key, h in hs.items():
+                    if key in axis:
+                        axis[key].merge(h)
+                    else:
+                        axis[key] = Histogram(h.precision).merge(h)
+            axes.append(axis)
+        return LatencyReport(*axes)
+
+    def table(self, axis: str = "sim", percentiles: tuple[float, ...] = (50, 90, 99)) -> str:
+        """Return a text table of wait percentiles, by primitive.
+
+        Args:
+            axis: ``"sim"`` or ``"activations"``.
+            percentiles: Percentile columns.
+
+        Raises:
+            ValueError: Invalid *axis* argument.
+        """
+        axes = {"sim": self._sim, "activations": self._activations}
+        try:
+            hs = axes[axis]
+        except KeyError as e:
+            raise ValueError(f"Expected axis in {set(axes)}, got {axis!r}") from e
+
+        head = "".join(f" {f'p{p:g}':>10}" for p in percentiles)
+        lines = [f"{'waits':>10} {'mean':>10}{head} {'max':>10}  primitive"]
+        for key in sorted(hs):
+            h = hs[key]
+            cols = "".join(f" {h.percentile(p):10d}" for p in percentiles)
+            lines.append(f"{h.count:10d} {h.mean:10.1f}{cols} {h.max:10d}  {key}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible dump of the report."""
+        return {
+            "sim": {k: h.to_dict() for k, h in self._sim.items()},
+            "activations": {k: h.to_dict() for k, h in self._activations.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> LatencyReport:
+        """Load a report dumped by ``to_dict``."""
+        sim = {k: Histogram.from_dict(h) for k, h in d["sim"].items()}
+        activations = {k: Histogram.from_dict(h) for k, h in d["activations"].items()}
+        return cls(sim, activations)
+
+
+class LatencyProbe(Probe, _LinkObserver):
+    """Record task wait times."""
+
+    _hooks = (_LinkHooks,)
+
+    def __init__(self, kernel: DefaultKernel[Any], precision: int):
+        # Check precision early
+        Histogram(precision)
+
+        super().__init__(kernel)
+        self._precision = precision
+
+        self._sim: _Axis = {}
+        self._activations: _Axis = {}
+
+        # Number of activations so far
+        self._count = 0
+
+        # (task, queue) => (label, start time, start activation)
+        self._waits: dict[tuple[Task[Any], SupportsDropTask], tuple[str, int, int]] = {}
+
+    def _shadows(self) -> list[_Shadow]:
+        kernel = self._kernel
+        queue = kernel._queue
+        pop = queue.pop
+        run_slot = kernel._run_slot
+
+        def counting_pop() -> QueueItem:
+            self._count += 1
+            return pop()
+
+        def observing_run_slot(t: int) -> bool:
+            _LinkHooks.observers.append(self)
+            try:
+                return run_slot(t)
+            finally:
+                _LinkHooks.observers.remove(self)
+
+        return [
+            (queue, "pop", counting_pop),
+            (kernel, "_run_slot", observing_run_slot),
+        ]
+
+    def on_link(self, task: Task[Any], tq: SupportsDropTask):
+        label = tq.wait_label()
+        if label is not None:
+            self._waits[(task, tq)] = (label, self._kernel.time(), self._count)
+
+    def on_unlink(self, task: Task[Any], tq: SupportsDropTask):
+        try:
+            label, t0, n0 = self._waits.pop((task, tq))
+        except KeyError:
+            return
+        self._hist(self._sim, label).record(self._kernel.time() - t0)
+        self._hist(self._activations, label).record(self._count - n0)
+
+    def _hist(self, axis: _Axis, label: str) -> Histogram:
+        try:
+            return axis[label]
+        except KeyError:
+            h = axis[label] = Histogram(self._precision)
+            return h
+
+    def snapshot(self) -> LatencyReport:
+        return LatencyReport(
+            {k: Histogram(self._precision).merge(h) for k, h in self._sim.items()},
+            {k: Histogram(self._precision).merge(h) for k, h in self._activations.items()},
+        )
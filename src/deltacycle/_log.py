@@ -0,0 +1,206 @@
+"""Simulation logging"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any, TextIO
+
+from ._kernel import Kernel
+from ._top import get_kernel
+
+
+class LogRecord:
+    """One log message, stamped with simulation time and task name.
+
+    The message is formatted only when it is read.
+    """
+
+    __slots__ = ("args", "level", "msg", "task", "time")
+
+    def __init__(self, time: int, task: str, level: int, msg: str, args: tuple[Any, ...]):
+        self.time = time
+        self.task = task
+        self.level = level
+        self.msg = msg
+        self.args = args
+
+    @property
+    def message(self) -> str:
+        """Message, with ``%`` style arguments applied."""
+        return self.msg % self.args if self.args else self.msg
+
+    @property
+    def level_name(self) -> str:
+        """Level name, e.g. ``"INFO"``."""
+        return logging.getLevelName(self.level)
+
+    def format(self, fmt: str) -> str:
+        """Return the record formatted by *fmt*.
+
+        *fmt* is a ``str.format`` template, with fields
+        ``time``, ``task``, ``level``, and ``message``.
+        """
+        return fmt.format(
+            time=self.time,
+            task=self.task,
+            level=self.level_name,
+            message=self.message,
+        )
+
+
+class SimLog:
+    """Log messages from simulation code.
+
+    Records are stamped with the current simulation time and task name.
+    Outside a running kernel, time is -1 and task name is empty.
+
+    Records below *level*, and records rejected by ``set_filter``
+    (task names, and time window) are discarded
+    before anything else is done.
+    The remaining records are kept, unformatted,
+    in a ring buffer of the last *capacity* records,
+    and formatted only if written to the *sink*, or dumped.
+
+    Use ``%`` style arguments, not f-strings,
+    so discarded messages cost almost nothing::
+
+        log.debug("x=%d y=%d", x.value, y.value)
+
+    Levels are the ``logging`` module levels.
+    """
+
+    default_fmt = "{time:>8} {task}: {level}: {message}"
+
+    def __init__(
+        self,
+        level: int = logging.INFO,
+        capacity: int = 1000,
+        sink: Callable[[str], Any] | None = None,
+        fmt: str = default_fmt,
+    ):
+        self.configure(level, capacity, sink, fmt)
+
+    def configure(
+        self,
+        level: int = logging.INFO,
+        capacity: int = 1000,
+        sink: Callable[[str], Any] | None = None,
+        fmt: str = default_fmt,
+    ):
+        """Reset log settings and filters, and clear the ring buffer.
+
+        Args:
+            level: Minimum level.
+            capacity: Number of records kept in the ring buffer.
+            sink: Called with each formatted record, e.g. ``print``.
+                If None, records are only kept in the ring buffer.
+            fmt: ``str.format`` template; see ``LogRecord.format``.
+
+        Raises:
+            ValueError: Invalid capacity.
+        """
+        if capacity < 1:
+            raise ValueError(f"Expected capacity ≥ 1, got {capacity}")
+
+        self._level = level
+        self._ring: deque[LogRecord] = deque(maxlen=capacity)
+        self._sink = sink
+        self._fmt = fmt
+        self.set_filter()
+
+    def set_filter(
+        self,
+        tasks: Iterable[str] | None = None,
+        start: int | None = None,
+        stop: int | None = None,
+    ):
+        """Only keep records from some tasks, or some time window.
+
+        Args:
+            tasks: Task names. If None, keep records from all tasks.
+            start: Only keep records at or after this time.
+            stop: Only keep records before this time.
+        """
+        self._tasks = None if tasks is None else frozenset(tasks)
+        self._start = start
+        self._stop = stop
+
+    @property
+    def level(self) -> int:
+        """Minimum level."""
+        return self._level
+
+    def enabled_for(self, level: int) -> bool:
+        """Return True if records at *level* may be kept.
+
+        Use to skip expensive message arguments.
+        """
+        return level >= self._level
+
+    def log(self, level: int, msg: str, *args: Any):
+        """Log *msg* % *args* at *level*."""
+        if level < self._level:
+            return
+
+        kernel = get_kernel()
+        if kernel is None or kernel.state() is not Kernel.State.RUNNING:
+            time, task = -1, ""
+        else:
+            time = kernel.time()
+            t = kernel.task()
+            task = "" if t is None else t.name
+
+        if self._tasks is not None and task not in self._tasks:
+            return
+        if self._start is not None and time < self._start:
+            return
+        if self._stop is not None and time >= self._stop:
+            return
+
+        record = LogRecord(time, task, level, msg, args)
+        self._ring.append(record)
+        if self._sink is not None:
+            self._sink(record.format(self._fmt))
+
+    def debug(self, msg: str, *args: Any):
+        """Log *msg* % *args* at DEBUG level."""
+        self.log(logging.DEBUG, msg, *args)
+
+    def info(self, msg: str, *args: Any):
+        """Log *msg* % *args* at INFO level."""
+        self.log(logging.INFO, msg, *args)
+
+    def warning(self, msg: str, *args: Any):
+        """Log *msg* % *args* at WARNING level."""
+        self.log(logging.WARNING, msg, *args)
+
+    def error(self, msg: str, *args: Any):
+        """Log *msg* % *args* at ERROR level."""
+        self.log(logging.ERROR, msg, *args)
+
+    def records(self) -> list[LogRecord]:
+        """Return records in the ring buffer, oldest first."""
+        return list(self._ring)
+
+    def clear(self):
+        """Remove all records from the ring buffer."""
+        self._ring.clear()
+
+    def dump(self, file: TextIO | None = None):
+        """Write the ring buffer to *file*, oldest first.
+
+        E.g. when a simulation fails.
+
+        Args:
+            file: Output stream; default is ``sys.stderr``.
+        """
+        f = sys.stderr if file is None else file
+        for record in self._ring:
+            f.write(record.format(self._fmt) + "\n")
+
+
+log = SimLog()
+"""Default simulation log."""
@@ -0,0 +1,312 @@
+"""Method processes"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+from weakref import WeakSet
+
+from ._action import Action
+from ._kernel import Kernel
+from ._kernel_if import KernelIf
+from ._variable import PredVariable, Variable, _Subscriber
+
+
+class Method(KernelIf, Action, _Subscriber):
+    """Callback process with static sensitivity.
+
+    Similar to a SystemC ``SC_METHOD``.
+    A method is a plain function, with no arguments,
+    that is called whenever a predicated variable in its sensitivity list
+    becomes True.
+    There is no coroutine, and no per-call registration:
+    the method subscribes to its variables once, when it is created,
+    and stays subscribed until it is closed.
+
+    The method runs in the same time slot as the variable update,
+    ordered with other tasks and actions by *region* and *priority*.
+    If several inputs change before the method runs,
+    it is called only once.
+
+    Methods cannot block.
+    Use them for combinational logic::
+
+        def adder():
+            s.next = a.value ^ b.value ^ ci.value
+            co.next = a.value & b.value | ci.value & (a.value | b.value)
+
+        Method(adder, [a.pred(), b.pred(), ci.pred()])
+
+    A method is not called at start.
+    Use ``schedule`` to call it once, e.g. to initialize its outputs.
+
+    If *outputs* is given, the method is *ranked*.
+    The kernel computes a topological rank for each ranked method,
+    from the variables it is sensitive to,
+    and the variables other ranked methods declare as *outputs*.
+    Pending ranked methods with the same *region* and *priority*
+    are called in rank order, instead of FIFO order,
+    so a method downstream of reconvergent paths runs once,
+    after all of its inputs have settled.
+    A method that writes a variable it did not declare still works,
+    but its readers may be called again in the same time slot.
+    Ranked methods must be created while their kernel is running.
+
+    The ``triggers`` and ``calls`` counters report how many
+    evaluations were saved: ``triggers - calls``.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], None],
+        sensitive: Iterable[PredVariable],
+        priority: int = 0,
+        region: Kernel.Region = Kernel.Region.ACTIVE,
+        outputs: Iterable[Variable] | None = None,
+    ):
+        self._func = func
+        self._pvs = tuple(dict.fromkeys(sensitive))
+        if not self._pvs:
+            raise ValueError("Expected non-empty sensitivity list")
+        self._priority = priority
+        self._region = Kernel.Region(region)
+
+        # Scheduled to run in the current time slot
+        self._pending = False
+
+        self._closed = False
+
+        # Number of times the method was triggered, and called
+        self._triggers = 0
+        self._calls = 0
+
+        # Dependency declaration
+        self._outputs = None if outputs is None else tuple(dict.fromkeys(outputs))
+        self._rank = 0
+        self._rankq: _RankQ | None = None
+        self._ranker: _Ranker | None = None
+        if self._outputs is not None:
+            # Ranks are computed per kernel
+            self._ranker = _Ranker.of(self._kernel)
+            self._ranker.add(self)
+
+        for pv in self._pvs:
+            pv._waitq.subscribe(self, pv)
+
+        # A method is always armed
+        waitqs = dict.fromkeys(pv._waitq for pv in self._pvs)
+        self._tracked = tuple(wq for wq in waitqs if wq.track_armed)
+        for wq in self._tracked:
+            wq.on_arm()
+
+    def __repr__(self) -> str:
+        return f"Method({self._func.__qualname__})"
+
+    @property
+    def func(self) -> Callable[[], None]:
+        return self._func
+
+    @property
+    def pvs(self) -> tuple[PredVariable, ...]:
+        """Predicated variables in the sensitivity list."""
+        return self._pvs
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def region(self) -> Kernel.Region:
+        return self._region
+
+    @property
+    def outputs(self) -> tuple[Variable, ...] | None:
+        """Declared output variables; None if the method is not ranked."""
+        return self._outputs
+
+    def rank(self) -> int:
+        """Return the topological rank of the method.
+
+        Ranked methods that are only sensitive to variables with no
+        ranked driver have rank zero.
+        Unranked methods always have rank zero.
+
+        Raises:
+            ValueError: Dependency loop between ranked methods.
+        """
+        if self._ranker is not None:
+            self._ranker.update()
+        return self._rank
+
+    @property
+    def triggers(self) -> int:
+        """Number of times the method was triggered."""
+        return self._triggers
+
+    @property
+    def calls(self) -> int:
+        """Number of times the method was called."""
+        return self._calls
+
+    def closed(self) -> bool:
+        """Return True if the method is closed."""
+        return self._closed
+
+    def close(self):
+        """Remove method from all variable wait queues.
+
+        A pending call is cancelled.
+        """
+        if not self._closed:
+            for pv in self._pvs:
+                pv._waitq.unsubscribe(self, pv)
+            for wq in self._tracked:
+                wq.on_disarm()
+            if self._ranker is not None:
+                self._ranker.remove(self)
+            self._closed = True
+
+    def schedule(self):
+        """Call the method in the current time slot.
+
+        Raises:
+            RuntimeError: The method is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Method is closed")
+        self._fire(self._kernel, None)
+
+    def _fire(self, kernel: Kernel[Any], pv: PredVariable | None):
+        self._triggers += 1
+        if not self._pending:
+            self._pending = True
+            if self._outputs is None:
+                kernel.call_action_at(kernel.time(), self, self._priority, self._region)
+            else:
+                assert self._ranker is not None
+                q = self._rankq
+                if q is None:
+                    q = self._rankq = _RankQ.get(kernel, self._region, self._priority)
+                self._ranker.update()
+                q.push(self)
+
+    def run(self):
+        self._pending = False
+        if not self._closed:
+            self._calls += 1
+            self._func()
+
+
+class _RankQ(Action):
+    """Call pending ranked methods of one region and priority, in rank order."""
+
+    @classmethod
+    def get(cls, kernel: Kernel[Any], region: Kernel.Region, priority: int) -> _RankQ:
+        # Queues are stored on the kernel, and created on first use
+        queues = kernel._rank_queues
+        key = (region, priority)
+        try:
+            return queues[key]
+        except KeyError:
+            q = queues[key] = cls(kernel, region, priority)
+            return q
+
+    def __init__(self, kernel: Kernel[Any], region: Kernel.Region, priority: int):
+        self._kernel = kernel
+        self._region = region
+        self._priority = priority
+
+        # rank, index, method
+        self._items: list[tuple[int, int, Method]] = []
+        self._index = 0
+
+        self._scheduled = False
+
+    def push(self, m: Method):
+        heapq.heappush(self._items, (m._rank, self._index, m))
+        self._index += 1
+        if not self._scheduled:
+            self._scheduled = True
+            kernel = self._kernel
+            kernel.call_action_at(kernel.time(), self, self._priority, self._region)
+
+    def run(self):
+        self._scheduled = False
+        items = self._items
+        called: set[Method] = set()
+        while items:
+            m = items[0][2]
+            # Undeclared feedback: yield to the kernel before calling again
+            if m in called:
+                self._scheduled = True
+                kernel = self._kernel
+                kernel.call_action_at(kernel.time(), self, self._priority, self._region)
+                return
+            heapq.heappop(items)
+            called.add(m)
+            m.run()
+
+
+class _Ranker:
+    """Ranked methods of one kernel, and their dependency graph."""
+
+    @classmethod
+    def of(cls, kernel: Kernel[Any]) -> _Ranker:
+        # Stored on the kernel, and created on first use
+        if kernel._ranker is None:
+            kernel._ranker = cls()
+        return kernel._ranker
+
+    def __init__(self):
+        self._methods: WeakSet[Method] = WeakSet()
+
+        # Ranks need to be recomputed
+        self._dirty = False
+
+    def add(self, m: Method):
+        self._methods.add(m)
+        self._dirty = True
+
+    def remove(self, m: Method):
+        self._methods.discard(m)
+        self._dirty = True
+
+    def update(self):
+        """Recompute ranks, with Kahn's algorithm."""
+        if not self._dirty:
+            return
+
+        methods = list(self._methods)
+        drivers: dict[Variable, list[Method]] = {}
+        for m in methods:
+            assert m._outputs is not None
+            for v in m._outputs:
+                drivers.setdefault(v, []).append(m)
+
+        succs: dict[Method, list[Method]] = {m: [] for m in methods}
+        npreds: dict[Method, int] = dict.fromkeys(methods, 0)
+        for m in methods:
+            m._rank = 0
+            for v in dict.fromkeys(pv.var for pv in m._pvs):
+                for d in drivers.get(v, ()):
+                    succs[d].append(m)
+                    npreds[m] += 1
+
+        ready = deque(m for m in methods if npreds[m] == 0)
+        n = 0
+        while ready:
+            m = ready.popleft()
+            n += 1
+            for s in succs[m]:
+                s._rank = max(s._rank, m._rank + 1)
+                npreds[s] -= 1
+                if npreds[s] == 0:
+                    ready.append(s)
+
+        if n != len(methods):
+            loop = [m for m in methods if npreds[m]]
+            raise ValueError(f"Method dependency loop: {loop}")
+
+        self._dirty = False
@@ -0,0 +1,288 @@
+"""Resource monitors"""
+
+from __future__ import annotations
+
+import math
+from abc import abstractmethod
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from ._kernel import Kernel
+
+
+def _now() -> int | None:
+    from ._top import get_kernel  # noqa: PLC0415
+
+    kernel = get_kernel()
+    return None if kernel is None else kernel.time()
+
+
+class LevelStats:
+    """Time-weighted statistics of an integer level.
+
+    The level is recorded only when it changes.
+    Each change updates the running sums in O(1) time and memory.
+    Sums are exact integers, so long simulations do not lose precision.
+
+    If *series* is positive, also keep a time series of at most *series*
+    ``(time, level)`` samples.
+    When it is full, every other sample is dropped,
+    and from then on only every other change is recorded (decimation).
+    """
+
+    def __init__(self, time: int, level: int, series: int = 0):
+        if series < 0:
+            raise ValueError(f"Expected series ≥ 0, got {series}")
+
+        self._start = time
+        self._time = time
+        self._level = level
+        self._changes = 0
+        self._min = level
+        self._max = level
+
+        # Sums of level * dt, and level² * dt
+        self._s1 = 0
+        self._s2 = 0
+
+        self._series = series
+        self._samples: list[tuple[int, int]] = [(time, level)] if series else []
+        self._stride = 1
+
+    def _record(self, time: int, level: int):
+        if level == self._level:
+            return
+
+        dt = time - self._time
+        self._s1 += self._level * dt
+        self._s2 += self._level * self._level * dt
+        self._time = time
+        self._level = level
+        self._changes += 1
+        self._min = min(self._min, level)
+        self._max = max(self._max, level)
+
+        if self._series and self._changes % self._stride == 0:
+            self._samples.append((time, level))
+            if len(self._samples) > self._series:
+                self._samples = self._samples[::2]
+                self._stride *= 2
+
+    def _sums(self, now: int | None) -> tuple[int, int, int]:
+        if now is None:
+            now = _now()
+        dt = 0 if now is None else max(now - self._time, 0)
+        duration = self._time + dt - self._start
+        s1 = self._s1 + self._level * dt
+        s2 = self._s2 + self._level * self._level * dt
+        return duration, s1, s2
+
+    @property
+    def level(self) -> int:
+        """Current level."""
+        return self._level
+
+    @property
+    def changes(self) -> int:
+        """Number of level changes."""
+        return self._changes
+
+    @property
+    def min(self) -> int:
+        """Minimum level."""
+        return self._min
+
+    @property
+    def max(self) -> int:
+        """Maximum level."""
+        return self._max
+
+    def duration(self, now: int | None = None) -> int:
+        """Return the monitored time span.
+
+        Args:
+            now: End of the time span.
+                Default is the current kernel time.
+        """
+        duration, _, _ = self._sums(now)
+        return duration
+
+    def mean(self, now: int | None = None) -> float:
+        """Return the time-weighted mean level.
+
+        If the time span is zero, return the current level.
+
+        Args:
+            now: End of the time span.
+                Default is the current kernel time.
+        """
+        duration, s1, _ = self._sums(now)
+        if duration == 0:
+            return float(self._level)
+        return s1 / duration
+
+    def var(self, now: int | None = None) -> float:
+        """Return the time-weighted variance of the level.
+
+        Args:
+            now: End of the time span.
+                Default is the current kernel time.
+        """
+        duration, s1, s2 = self._sums(now)
+        if duration == 0:
+            return 0.0
+        return (s2 * duration - s1 * s1) / (duration * duration)
+
+    def std(self, now: int | None = None) -> float:
+        """Return the time-weighted standard deviation of the level."""
+        return math.sqrt(self.var(now))
+
+    def series(self) -> list[tuple[int, int]]:
+        """Return (time, level) samples, oldest first.
+
+        Empty unless the monitor was created with a positive *series*.
+        """
+        return list(self._samples)
+
+
+class ResourceMonitor:
+    """Resource level and waiting task statistics.
+
+    Returned by the ``monitor`` method of
+    ``Semaphore``, ``Lock``, ``CreditPool``, ``Queue``, and ``Container``.
+
+    *level* is the resource length, ``len(resource)``:
+    free credits of a semaphore or credit pool,
+    or items held by a queue or container.
+    *waiting* is the number of tasks blocked in get or put.
+    """
+
+    def __init__(self, level: LevelStats, waiting: LevelStats, capacity: int | None, free: bool):
+        self._level = level
+        self._waiting = waiting
+        self._capacity = capacity
+        self._free = free
+
+    @property
+    def level(self) -> LevelStats:
+        """Statistics of the resource length."""
+        return self._level
+
+    @property
+    def waiting(self) -> LevelStats:
+        """Statistics of the number of waiting tasks."""
+        return self._waiting
+
+    def utilization(self, now: int | None = None) -> float:
+        """Return the time-weighted fraction of capacity in use.
+
+        For a semaphore or credit pool, credits held by tasks are in use.
+        For a queue or container, occupied slots are in use.
+
+        Args:
+            now: End of the time span.
+                Default is the current kernel time.
+
+        Raises:
+            ValueError: The resource has no capacity.
+        """
+        if self._capacity is None:
+            raise ValueError("Expected resource with capacity")
+        occupancy = self._level.mean(now) / self._capacity
+        return 1.0 - occupancy if self._free else occupancy
+
+
+def _counting[**P, R](
+    f: Callable[P, R],
+    stats: LevelStats,
+    level: Callable[[], int],
+    time: Callable[[], int],
+) -> Callable[P, R]:
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        y = f(*args, **kwargs)
+        stats._record(time(), level())
+        return y
+
+    return wrapper
+
+
+class Monitored:
+    """Mixin: Add a monitor method to a resource.
+
+    The monitor shadows the level changing methods of the resource instance,
+    and of its wait queues.
+    There is no cost for resources that are not monitored.
+    """
+
+    # Whether len(resource) counts free credits
+    _monitor_free: ClassVar[bool] = False
+
+    # Level changing methods
+    _monitor_methods: ClassVar[tuple[str, ...]] = ("_put", "_get")
+
+    # Wait queue attributes
+    _monitor_queues: ClassVar[tuple[str, ...]] = ("_getq",)
+
+    _resource_monitor: ResourceMonitor | None = None
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the resource level."""
+
+    @property
+    @abstractmethod
+    def _kernel(self) -> Kernel[Any]:
+        """Running kernel, provided by ``KernelIf``."""
+
+    def monitor(self, series: int = 0) -> ResourceMonitor:
+        """Start monitoring resource statistics.
+
+        If the resource is already monitored, return the existing monitor.
+
+        Args:
+            series: Maximum number of time series samples to keep,
+                for both level and waiting tasks.
+                Default is zero: only keep statistics.
+
+        Returns:
+            ResourceMonitor instance.
+        """
+        if self._resource_monitor is not None:
+            return self._resource_monitor
+
+        from ._kernel import Kernel  # noqa: PLC0415
+        from ._top import get_kernel  # noqa: PLC0415
+
+        kernel = get_kernel()
+        if kernel is not None and kernel.state() is Kernel.State.RUNNING:
+            t0 = kernel.time()
+        else:
+            t0 = Kernel.start_time
+
+        queues = [getattr(self, name) for name in self._monitor_queues]
+
+        def level() -> int:
+            return len(self)
+
+        def waiting() -> int:
+            return sum(len(q) for q in queues)
+
+        def time() -> int:
+            return self._kernel.time()
+
+        level_stats = LevelStats(t0, level(), series)
+        waiting_stats = LevelStats(t0, waiting(), series)
+        capacity: int | None = getattr(self, "capacity")
+
+        for name in self._monitor_methods:
+            f: Callable[..., Any] = getattr(self, name)
+            setattr(self, name, _counting(f, level_stats, level, time))
+        for q in queues:
+            for name in ("push", "pop", "drop"):
+                f = getattr(q, name)
+                setattr(q, name, _counting(f, waiting_stats, waiting, time))
+
+        mon = ResourceMonitor(level_stats, waiting_stats, capacity, self._monitor_free)
+        self._resource_monitor = mon
+        return mon
@@ -0,0 +1,229 @@
+"""Kernel instrumentation probes"""
+
+from __future__ import annotations
+
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ._task import SupportsDropTask, Task
+from ._variable import Predicate, Variable, _Subscriber, _WaitQ
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+type _Shadow = tuple[object, str, Callable[..., Any]]
+type _TaskLink = Callable[[Task[Any], SupportsDropTask], None]
+
+_MISSING = object()
+
+
+class Probe(ABC):
+    """Instrument a kernel by shadowing instance methods.
+
+    While installed, kernel, event queue, and fork table methods
+    are shadowed on the instance by wrappers.
+    There is no cost when no probe is installed.
+
+    Several probes may be installed on the same kernel;
+    each one wraps the methods installed before it.
+    The kernel reinstalls all of its probes when one is added or removed.
+
+    Probes that need class-level hooks list them in ``_hooks``.
+    """
+
+    # Class-level hooks enabled while installed
+    _hooks: ClassVar[tuple[type[_ClassHooks], ...]] = ()
+
+    def __init__(self, kernel: DefaultKernel[Any]):
+        self._kernel = kernel
+
+        # Object, name, previous instance attribute
+        self._saved: list[tuple[object, str, object]] = []
+
+        # Release each enabled hook
+        self._unhooks: list[Callable[[], Any]] = []
+
+    @abstractmethod
+    def _shadows(self) -> list[_Shadow]:
+        """Return (object, name, wrapper) triples.
+
+        Wrappers call the current methods, which may belong to another probe.
+        """
+
+    def install(self):
+        for obj, name, f in self._shadows():
+            self._saved.append((obj, name, obj.__dict__.get(name, _MISSING)))
+            setattr(obj, name, f)
+        for hooks in self._hooks:
+            self._unhooks.append(hooks.enable(self._kernel))
+
+    def uninstall(self):
+        while self._unhooks:
+            self._unhooks.pop()()
+        while self._saved:
+            obj, name, saved = self._saved.pop()
+            if saved is _MISSING:
+                delattr(obj, name)
+            else:
+                setattr(obj, name, saved)
+
+
+class _ClassHooks:
+    """Patch a class while any installed probe needs it.
+
+    Variables and tasks do not know their kernel,
+    so hooks are patched at class level, and counted by enabled probes.
+    A kernel that is dropped with a probe still installed
+    releases its count when it is garbage collected.
+    """
+
+    # Number of enabled probes; the class is patched while non-zero
+    _enabled = 0
+
+    @classmethod
+    def _patch(cls) -> None:
+        raise NotImplementedError()  # pragma: no cover
+
+    @classmethod
+    def _restore(cls) -> None:
+        raise NotImplementedError()  # pragma: no cover
+
+    @classmethod
+    def enable(cls, kernel: DefaultKernel[Any]) -> Callable[[], Any]:
+        """Enable hooks for *kernel*; return a function that releases them."""
+        if cls._enabled == 0:
+            cls._patch()
+        cls._enabled += 1
+        return weakref.finalize(kernel, cls._disable)
+
+    @classmethod
+    def _disable(cls):
+        cls._enabled -= 1
+        if cls._enabled == 0:
+            cls._restore()
+
+
+class _NotifyObserver:
+    """Observe predicate evaluations in variable wait queues."""
+
+    def on_eval(self, v: Variable, waitq: _WaitQ, p: Predicate, fired: bool, waiters: int):
+        """Predicate *p* of variable *v* was evaluated, for *waiters* waiters."""
+
+    def on_wake(self, n: int):
+        """Predicates woke up *n* tasks and subscribers."""
+
+
+class _NotifyHooks(_ClassHooks):
+    """Instrument predicate evaluation in all variables.
+
+    While any probe needs it, ``Variable._notify`` is patched at class level.
+    Each probe adds itself to ``observers`` while its kernel executes
+    a time slot.
+    """
+
+    _enabled = 0
+
+    # Observers of the kernel executing the current time slot
+    observers: ClassVar[list[_NotifyObserver]] = []
+
+    _notify = Variable._notify
+
+    @classmethod
+    def _patch(cls):
+        Variable._notify = _observed_notify
+
+    @classmethod
+    def _restore(cls):
+        Variable._notify = cls._notify
+
+
+def _observed_notify(self: Variable, waitq: _WaitQ):
+    """Same as Variable._notify, with one observer call per predicate."""
+    observers = _NotifyHooks.observers
+    if not observers:
+        _NotifyHooks._notify(self, waitq)
+        return
+
+    preds = waitq._preds
+    subs = waitq._subs
+
+    fired: list[Predicate] = []
+    for p, bucket in preds.items():
+        waiters = len(bucket) + len(subs.get(p, ()))
+        ok = p()
+        for o in observers:
+            o.on_eval(self, waitq, p, ok, waiters)
+        if ok:
+            fired.append(p)
+    for p, sub_bucket in subs.items():
+        if p not in preds:
+            ok = p()
+            for o in observers:
+                o.on_eval(self, waitq, p, ok, len(sub_bucket))
+            if ok:
+                fired.append(p)
+
+    if not fired:
+        return
+
+    woken: set[object] = set()
+    for p in fired:
+        woken.update(preds.get(p, ()))
+        sub_bucket: dict[_Subscriber, Any] = subs.get(p, {})
+        woken.update(sub_bucket)
+    for o in observers:
+        o.on_wake(len(woken))
+
+    self._wake_fired(waitq, fired)
+
+
+class _LinkObserver:
+    """Observe tasks waiting in queues."""
+
+    def on_link(self, task: Task[Any], tq: SupportsDropTask):
+        """Task started waiting in *tq*."""
+
+    def on_unlink(self, task: Task[Any], tq: SupportsDropTask):
+        """Task stopped waiting in *tq*."""
+
+
+class _LinkHooks(_ClassHooks):
+    """Instrument task queue links in all tasks.
+
+    Same as ``_NotifyHooks``, for ``Task._link`` and ``Task._unlink``.
+    Observers see only the first link and the last unlink of a queue.
+    """
+
+    _enabled = 0
+
+    observers: ClassVar[list[_LinkObserver]] = []
+
+    # Task is generic: go through getattr/setattr to keep the types known
+    _link: ClassVar[_TaskLink] = getattr(Task, "_link")
+    _unlink: ClassVar[_TaskLink] = getattr(Task, "_unlink")
+
+    @classmethod
+    def _patch(cls):
+        setattr(Task, "_link", _observed_link)
+        setattr(Task, "_unlink", _observed_unlink)
+
+    @classmethod
+    def _restore(cls):
+        setattr(Task, "_link", cls._link)
+        setattr(Task, "_unlink", cls._unlink)
+
+
+def _observed_link(self: Task[Any], tq: SupportsDropTask):
+    _LinkHooks._link(self, tq)
+    if self._refcnts[tq] == 1:
+        for o in _LinkHooks.observers:
+            o.on_link(self, tq)
+
+
+def _observed_unlink(self: Task[Any], tq: SupportsDropTask):
+    _LinkHooks._unlink(self, tq)
+    if tq not in self._refcnts:
+        for o in _LinkHooks.observers:
+            o.on_unlink(self, tq)
@@ -0,0 +1,233 @@
+"""Task CPU time profiler"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from ._action import Action, QueueItem
+from ._probe import Probe, _Shadow
+from ._task import Task
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+
+def _func_name(task: Task[Any]) -> str:
+    code = getattr(task.coro, "cr_code", None)
+    if code is None:
+        return type(task.coro).__qualname__
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _action_label(action: Action) -> str:
+    cls = type(action)
+    if cls.__repr__ is object.__repr__:
+        return cls.__qualname__
+    return repr(action)
+
+
+def _stack(task: Task[Any]) -> tuple[str, ...]:
+    """Return coroutine functions of task group parents, outermost first."""
+    stack = [_func_name(task)]
+    group = task.group
+    while group is not None:
+        parent = group._parent
+        stack.append(_func_name(parent))
+        group = parent.group
+    return tuple(reversed(stack))
+
+
+class _Entry:
+    """Profile of one task or action."""
+
+    __slots__ = ("calls", "func", "name", "stack", "time")
+
+    def __init__(self, name: str, func: str, stack: tuple[str, ...]):
+        self.name = name
+        self.func = func
+        self.stack = stack
+        self.calls = 0
+        self.time = 0.0
+
+
+type _Row = tuple[str, int, float]
+
+
+class TaskProfile:
+    """CPU time profile of task activations.
+
+    Returned by ``DefaultKernel.profile``.
+
+    Each task activation (``Task.do_run``) is timed,
+    from the time the kernel dispatches the task
+    to the time it dispatches the next task, or ends the time slot.
+    Kernel actions (e.g. methods, clock edges) are timed the same way.
+    Variable updates at the end of the time slot are not included.
+
+    Times may be aggregated by task name,
+    by coroutine function (``coro.cr_code``),
+    or by coroutine function stack,
+    following the ``TaskGroup`` hierarchy from the outermost parent task.
+    """
+
+    def __init__(self, entries: list[_Entry]):
+        self._entries = entries
+
+    @staticmethod
+    def _aggregate(entries: list[_Entry], key: Callable[[_Entry], str]) -> list[_Row]:
+        rows: dict[str, list[Any]] = {}
+        for e in entries:
+            try:
+                row = rows[key(e)]
+            except KeyError:
+                row = rows[key(e)] = [0, 0.0]
+            row[0] += e.calls
+            row[1] += e.time
+        return sorted(
+            ((k, n, t) for k, (n, t) in rows.items()),
+            key=lambda row: row[2],
+            reverse=True,
+        )
+
+    @property
+    def calls(self) -> int:
+        """Total number of activations."""
+        return sum(e.calls for e in self._entries)
+
+    @property
+    def total(self) -> float:
+        """Total time, in seconds."""
+        return sum(e.time for e in self._entries)
+
+    def by_task(self) -> list[_Row]:
+        """Return (task name, calls, seconds) rows, most time first."""
+        return self._aggregate(self._entries, lambda e: e.name)
+
+    def by_function(self) -> list[_Row]:
+        """Return (coroutine function, calls, seconds) rows, most time first."""
+        return self._aggregate(self._entries, lambda e: e.func)
+
+    def by_stack(self) -> list[_Row]:
+        """Return (stack, calls, seconds) rows, most time first.
+
+        Stack frames are coroutine functions, separated by ``;``.
+        """
+        return self._aggregate(self._entries, lambda e: ";".join(e.stack))
+
+    def collapsed(self) -> str:
+        """Return collapsed stacks, for flame graph tools.
+
+        One line per stack: frames separated by ``;``,
+        then a space, then the time in microseconds.
+        This is the input format of ``flamegraph.pl``, and speedscope.
+        """
+        lines = [f"{stack} {round(t * 1e6)}" for stack, _, t in self.by_stack()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def table(self, by: str = "function", limit: int | None = 20) -> str:
+        """Return a text table of the most expensive rows.
+
+        Args:
+            by: One of ``"task"``, ``"function"``, or ``"stack"``.
+            limit: Maximum number of rows; None for all rows.
+
+        Raises:
+            ValueError: Invalid *by* argument.
+        """
+        aggregate = {
+            "task": self.by_task,
+            "function": self.by_function,
+            "stack": self.by_stack,
+        }
+        try:
+            rows = aggregate[by]()
+        except KeyError as e:
+            raise ValueError(f"Expected by in {set(aggregate)}, got {by!r}") from e
+
+        total = self.total or 1.0
+        lines = [f"{'calls':>10} {'total ms':>10} {'us/call':>10} {'%':>6}  {by}"]
+        for key, n, t in rows[:limit]:
+            lines.append(f"{n:10d} {t * 1e3:10.3f} {t * 1e6 / n:10.3f} {t / total:6.1%}  {key}")
+        return "\n".join(lines)
+
+
+class ProfileProbe(Probe):
+    """Time task activations."""
+
+    def __init__(self, kernel: DefaultKernel[Any]):
+        super().__init__(kernel)
+
+        # Task index or action label => entry
+        self._entries: dict[int | str, _Entry] = {}
+
+        # Activation being timed
+        self._entry: _Entry | None = None
+        self._t0 = 0.0
+
+    def _shadows(self) -> list[_Shadow]:
+        kernel = self._kernel
+        queue = kernel._queue
+        pop = queue.pop
+        run_slot = kernel._run_slot
+        update_vars = kernel._update_vars
+
+        def timing_pop() -> QueueItem:
+            self._stop()
+            item = pop()
+            self._start(item[1])
+            return item
+
+        def timing_run_slot(t: int) -> bool:
+            try:
+                return run_slot(t)
+            finally:
+                self._stop()
+
+        def timing_update_vars():
+            self._stop()
+            update_vars()
+
+        return [
+            (queue, "pop", timing_pop),
+            (kernel, "_run_slot", timing_run_slot),
+            (kernel, "_update_vars", timing_update_vars),
+        ]
+
+    def _start(self, item: Task[Any] | Action):
+        # Key tasks by index, so the profile does not keep them alive.
+        # Actions may be created per event (e.g. nba); group them by label.
+        key = item.index if isinstance(item, Task) else _action_label(item)
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            if isinstance(item, Task):
+                entry = _Entry(item.name, _func_name(item), _stack(item))
+            else:
+                label = _action_label(item)
+                entry = _Entry(label, label, (label,))
+            self._entries[key] = entry
+        entry.calls += 1
+        self._entry = entry
+        self._t0 = time.perf_counter()
+
+    def _stop(self):
+        if self._entry is not None:
+            self._entry.time += time.perf_counter() - self._t0
+            self._entry = None
+
+    def snapshot(self) -> TaskProfile:
+        entries: list[_Entry] = []
+        for e in self._entries.values():
+            c = _Entry(e.name, e.func, e.stack)
+            c.calls = e.calls
+            c.time = e.time
+            entries.append(c)
+        return TaskProfile(entries)
+
+    def uninstall(self):
+        self._stop()
+        super().uninstall()
@@ -7,13 +7,19 @@ from collections import deque
 from typing import Any
 
 from ._kernel_if import KernelIf
+from ._monitor import Monitored
 from ._task import SupportsDropTask, Task
 
 
 class _PortQ(SupportsDropTask):
     """Tasks wait for a slot to become available."""
 
-    def __init__(self):
+    blocked_on = "Queue"
+
+    def __init__(self, port: str = "get"):
+        # Blocking method name, e.g. "get"
+        self.port = port
+
         # priority, index, task
         self._items: list[tuple[int, int, Task[Any]]] = []
 
@@ -21,6 +27,9 @@ class _PortQ(SupportsDropTask):
         # Breaks (time, priority, ...) ties in the heapq
         self._index: int = 0
 
+    def wait_label(self) -> str:
+        return f"{self.blocked_on}.{self.port}"
+
     def __len__(self) -> int:
         return len(self._items)
 
@@ -48,10 +57,16 @@ class _PortQ(SupportsDropTask):
 
 
 class _PortLock[T](SupportsDropTask):
+    blocked_on = "Queue"
+
     def __init__(self, parent: Queue[T]):
         self._parent = parent
         self._task: Task[Any] | None = None
 
+    def wait_label(self) -> None:
+        # Port held by a woken task, not waiting
+        return None
+
     def __bool__(self) -> bool:
         return self._task is not None
 
@@ -99,7 +114,7 @@ class _PutLock[T](_PortLock[T]):
             self.acquire(task=self._parent._putq_pop())
 
 
-class Queue[T](KernelIf):
+class Queue[T](KernelIf, Monitored):
     """Producer / Consumer FIFO Queue.
 
     Has both blocking and non-blocking put and get interfaces.
@@ -113,6 +128,8 @@ class Queue[T](KernelIf):
     Its size is subject only to the machine's memory limitations.
     """
 
+    _monitor_queues = ("_getq", "_putq")
+
     def __init__(self, capacity: int = 0):
         self._capacity = capacity
         self._has_capacity = capacity > 0
@@ -123,7 +140,7 @@ class Queue[T](KernelIf):
         self._getq = _PortQ()
 
         # Tasks waiting to put an item
-        self._putq = _PortQ()
+        self._putq = _PortQ("put")
 
         # Lock ensures gets are atomic
         self._get_lock = _GetLock(parent=self)
@@ -0,0 +1,64 @@
+"""Clocked register"""
+
+from __future__ import annotations
+
+from ._clock import Clock
+from ._variable import Singular, Value
+
+
+class Register[T](Singular[T]):
+    """Edge-triggered register (D flip-flop), updated by its clock.
+
+    On every positive edge of *clk*, the register samples *d*.
+    If *reset* is given and high, the register is set to its reset value.
+    Otherwise, if *enable* is given and low, the register holds its value.
+
+    Inputs are sampled from their ``prev`` values,
+    i.e. the values settled at the end of the previous time slot.
+    This is the same as a flip-flop task doing
+    ``await clk.posedge(); q.next = d.prev``,
+    but there is no task:
+    the clock updates all of its registers in one pass,
+    from the edge event itself.
+    Only registers whose value changed are notified and updated.
+
+    The initial (and reset) value is *value*.
+    If not given, it is the current value of *d*.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        clk: Clock,
+        d: Value[T],
+        enable: Value[bool] | None = None,
+        reset: Value[bool] | None = None,
+        value: T | None = None,
+        *,
+        name: str | None = None,
+    ):
+        init: T = d.prev if value is None else value
+        super().__init__(init, name)
+
+        self._clk = clk
+        self._d = d
+        self._enable = enable
+        self._reset = reset
+        self._reset_value = init
+
+        clk._add_register(self)
+
+    @property
+    def clk(self) -> Clock:
+        return self._clk
+
+    @property
+    def d(self) -> Value[T]:
+        return self._d
+
+    @property
+    def enable(self) -> Value[bool] | None:
+        return self._enable
+
+    @property
+    def reset(self) -> Value[bool] | None:
+        return self._reset
@@ -0,0 +1,114 @@
+"""Sensitivity efficiency report"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ._probe import _NotifyHooks, _NotifyObserver, Probe, _Shadow
+from ._variable import Predicate, Variable, _WaitQ
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+
+def _var_name(v: Variable, waitq: _WaitQ) -> str:
+    name = v.name or repr(v)
+    if waitq is v._waitq:
+        return name
+    # One signal of a bank
+    waitqs: dict[int, _WaitQ] = getattr(v, "_waitqs", {})
+    for i, q in waitqs.items():
+        if q is waitq:
+            return f"{name}[{i}]"
+    return name  # pragma: no cover
+
+
+def _pred_name(p: Predicate) -> str:
+    func = getattr(p, "__func__", p)
+    return getattr(func, "__qualname__", repr(func))
+
+
+type _Row = tuple[str, str, int, int, int]
+
+
+class SensitivityReport:
+    """Predicate evaluation counts, by variable and predicate.
+
+    Returned by ``DefaultKernel.sensitivity``.
+
+    Every time a variable changes, each distinct predicate that tasks
+    (or methods) are waiting on is evaluated once.
+    An evaluation that returns False is wasted work;
+    so is scanning the waiters of that predicate.
+    Variables with many wasted evaluations need a better sensitivity design,
+    e.g. a separate variable, or a more specific predicate.
+    """
+
+    def __init__(self, rows: list[_Row]):
+        # Worst offenders first
+        self._rows = sorted(rows, key=lambda r: (r[2] - r[3], r[4]), reverse=True)
+
+    def rows(self) -> list[_Row]:
+        """Return (variable, predicate, evals, fires, waiters) rows.
+
+        *waiters* is the total number of waiters scanned by all evaluations.
+        Rows are sorted by wasted evaluations (evals - fires),
+        most wasted first.
+        """
+        return list(self._rows)
+
+    def table(self, limit: int | None = 20) -> str:
+        """Return a text table of the worst offenders.
+
+        Args:
+            limit: Maximum number of rows; None for all rows.
+        """
+        lines = [
+            f"{'evals':>10} {'fires':>10} {'wasted':>10} {'hit %':>6} {'waiters':>10}  var: pred"
+        ]
+        for var, pred, evals, fires, waiters in self._rows[:limit]:
+            lines.append(
+                f"{evals:10d} {fires:10d} {evals - fires:10d} {fires / evals:6.1%}"
+                f" {waiters:10d}  {var}: {pred}"
+            )
+        return "\n".join(lines)
+
+
+class SensitivityProbe(Probe, _NotifyObserver):
+    """Count predicate evaluations."""
+
+    _hooks = (_NotifyHooks,)
+
+    def __init__(self, kernel: DefaultKernel[Any]):
+        super().__init__(kernel)
+
+        # (variable, waitq, predicate) => [evals, fires, waiters]
+        self._counts: dict[tuple[Variable, _WaitQ, Predicate], list[int]] = {}
+
+    def _shadows(self) -> list[_Shadow]:
+        run_slot = self._kernel._run_slot
+
+        def observing_run_slot(t: int) -> bool:
+            _NotifyHooks.observers.append(self)
+            try:
+                return run_slot(t)
+            finally:
+                _NotifyHooks.observers.remove(self)
+
+        return [(self._kernel, "_run_slot", observing_run_slot)]
+
+    def on_eval(self, v: Variable, waitq: _WaitQ, p: Predicate, fired: bool, waiters: int):
+        key = (v, waitq, p)
+        try:
+            counts = self._counts[key]
+        except KeyError:
+            counts = self._counts[key] = [0, 0, 0]
+        counts[0] += 1
+        counts[1] += fired
+        counts[2] += waiters
+
+    def snapshot(self) -> SensitivityReport:
+        rows: list[_Row] = []
+        for (v, waitq, p), (evals, fires, waiters) in self._counts.items():
+            rows.append((_var_name(v, waitq), _pred_name(p), evals, fires, waiters))
+        return SensitivityReport(rows)
@@ -0,0 +1,204 @@
+"""Kernel performance counters"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from ._action import Action, QueueItem
+from ._probe import _NotifyHooks, _NotifyObserver, Probe, _Shadow
+from ._task import Blocking, Task, TaskArgs
+from ._variable import Predicate, Variable, _WaitQ
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+
+class KernelStats:
+    """Kernel performance counters.
+
+    Returned by ``DefaultKernel.stats``.
+    Counts start when stats are enabled.
+
+    Attributes:
+        slots: Time slots executed.
+        activations: Task activations, by ``Task.Command``.
+        actions: Kernel actions executed (e.g. clock edges, methods).
+        pushes: Event queue pushes (tasks and actions).
+        pops: Event queue pops.
+        drops: Tasks dropped from the event queue (e.g. interrupted).
+        peak_queue: Peak event queue length.
+        commits: Variables committed at the end of time slots.
+        peak_commits: Most variables committed in one time slot.
+        pred_evals: Predicate evaluations, for variable changes.
+        wakeups: Tasks and subscribers woken by those predicates.
+        fork_sets: Tasks added to the fork table (``any_of``, ``all_of``).
+        fork_drops: Tasks removed from the fork table.
+        sim_time: Simulation time elapsed.
+        wall_time: Wall time spent executing time slots, in seconds.
+    """
+
+    def __init__(self):
+        self.slots = 0
+        self.activations: Counter[Task.Command] = Counter()
+        self.actions = 0
+        self.pushes = 0
+        self.pops = 0
+        self.drops = 0
+        self.peak_queue = 0
+        self.commits = 0
+        self.peak_commits = 0
+        self.pred_evals = 0
+        self.wakeups = 0
+        self.fork_sets = 0
+        self.fork_drops = 0
+        self.sim_time = 0
+        self.wall_time = 0.0
+
+    def __repr__(self) -> str:
+        lines = [f"{type(self).__name__}("]
+        for name, value in self.__dict__.items():
+            if name == "activations":
+                s = repr({cmd.name: n for cmd, n in sorted(value.items())})
+            else:
+                s = repr(value)
+            lines.append(f"    {name}={s},")
+        lines.append(")")
+        return "\n".join(lines)
+
+    def copy(self) -> KernelStats:
+        stats = KernelStats()
+        stats.__dict__.update(self.__dict__)
+        stats.activations = self.activations.copy()
+        return stats
+
+    @property
+    def commits_per_slot(self) -> float:
+        """Mean variables committed per time slot."""
+        return self.commits / self.slots if self.slots else 0.0
+
+    @property
+    def sim_wall_ratio(self) -> float:
+        """Simulation time steps per wall second."""
+        return self.sim_time / self.wall_time if self.wall_time else 0.0
+
+
+class StatsProbe(Probe, _NotifyObserver):
+    """Count kernel events."""
+
+    _hooks = (_NotifyHooks,)
+
+    def __init__(self, kernel: DefaultKernel[Any]):
+        super().__init__(kernel)
+        self.stats = KernelStats()
+        self.activations = [0] * len(Task.Command)
+        self._t0 = max(kernel.time(), kernel.start_time)
+
+    def _shadows(self) -> list[_Shadow]:
+        return [*self._queue_shadows(), *self._fork_shadows(), *self._kernel_shadows()]
+
+    def on_eval(self, v: Variable, waitq: _WaitQ, p: Predicate, fired: bool, waiters: int):
+        self.stats.pred_evals += 1
+
+    def on_wake(self, n: int):
+        self.stats.wakeups += n
+
+    def snapshot(self) -> KernelStats:
+        stats = self.stats.copy()
+        stats.activations = Counter(
+            {cmd: n for cmd, n in zip(Task.Command, self.activations, strict=True) if n}
+        )
+        return stats
+
+    def _queue_shadows(self) -> list[_Shadow]:
+        queue = self._kernel._queue
+        stats = self.stats
+
+        push = queue.push
+        push_action = queue.push_action
+        pop = queue.pop
+        drop = queue.drop
+
+        def counting_push(t: int, region: int, priority: int, task: Task[Any], args: TaskArgs):
+            push(t, region, priority, task, args)
+            stats.pushes += 1
+            stats.peak_queue = max(stats.peak_queue, len(queue))
+
+        def counting_push_action(t: int, region: int, priority: int, action: Action):
+            push_action(t, region, priority, action)
+            stats.pushes += 1
+            stats.peak_queue = max(stats.peak_queue, len(queue))
+
+        # Indexed by Task.Command
+        activations = self.activations
+
+        def counting_pop() -> QueueItem:
+            item = pop()
+            stats.pops += 1
+            args = item[2]
+            if args is None:
+                stats.actions += 1
+            else:
+                activations[args[0]] += 1
+            return item
+
+        def counting_drop(task: Task[Any]):
+            drop(task)
+            stats.drops += 1
+
+        return [
+            (queue, "push", counting_push),
+            (queue, "push_action", counting_push_action),
+            (queue, "pop", counting_pop),
+            (queue, "drop", counting_drop),
+        ]
+
+    def _fork_shadows(self) -> list[_Shadow]:
+        forks = self._kernel._forks
+        stats = self.stats
+
+        fork_set = forks.set
+        fork_drop = forks.drop
+
+        def counting_set(task: Task[Any], *bs: Blocking):
+            fork_set(task, *bs)
+            stats.fork_sets += 1
+
+        def counting_drop(task: Task[Any]):
+            fork_drop(task)
+            stats.fork_drops += 1
+
+        return [
+            (forks, "set", counting_set),
+            (forks, "drop", counting_drop),
+        ]
+
+    def _kernel_shadows(self) -> list[_Shadow]:
+        kernel = self._kernel
+        stats = self.stats
+
+        run_slot = kernel._run_slot
+        update_vars = kernel._update_vars
+
+        def counting_run_slot(t: int) -> bool:
+            _NotifyHooks.observers.append(self)
+            t0 = time.perf_counter()
+            try:
+                return run_slot(t)
+            finally:
+                stats.wall_time += time.perf_counter() - t0
+                stats.slots += 1
+                stats.sim_time = kernel.time() - self._t0
+                _NotifyHooks.observers.remove(self)
+
+        def counting_update_vars():
+            n = len(kernel._dirty_vars)
+            stats.commits += n
+            stats.peak_commits = max(stats.peak_commits, n)
+            update_vars()
+
+        return [
+            (kernel, "_run_slot", counting_run_slot),
+            (kernel, "_update_vars", counting_update_vars),
+        ]
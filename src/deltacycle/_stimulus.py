@@ -0,0 +1,131 @@
+"""Streaming stimulus"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from os import PathLike
+from typing import Any
+
+from ._action import WriteSeq
+from ._kernel import Kernel
+from ._top import get_running_kernel
+from ._variable import Value
+
+type StimulusRecord = tuple[int, Hashable, Any]
+
+type _Path = str | PathLike[str]
+
+
+def read_stimulus_csv(
+    path: _Path,
+    convert: Callable[[str], Any] | Mapping[str, Callable[[str], Any]] = int,
+    header: bool = True,
+) -> Iterator[StimulusRecord]:
+    """Stream (time, signal, value) records from a CSV file.
+
+    Each row has three columns: an integer time, a signal name, and a value.
+    Rows are read one at a time, so memory use does not depend on file size.
+
+    Args:
+        path: CSV file path.
+        convert: Function that converts the value column,
+            or mapping from signal name to function.
+        header: If True, skip the first row.
+
+    Yields:
+        (time, signal, value) records, in file order.
+    """
+    with open(path, newline="") as f:
+        rows = csv.reader(f)
+        if header:
+            next(rows, None)
+        if callable(convert):
+            for t, name, value in rows:
+                yield (int(t), name, convert(value))
+        else:
+            for t, name, value in rows:
+                yield (int(t), name, convert[name](value))
+
+
+def read_stimulus_npy(path: _Path, chunk_size: int = 1 << 16) -> Iterator[StimulusRecord]:
+    """Stream (time, signal, value) records from a NumPy ``.npy`` file.
+
+    Requires ``numpy``.
+
+    The file is memory-mapped,
+    and converted to Python objects *chunk_size* records at a time,
+    so memory use does not depend on file size.
+
+    The array is either a structured array with ``time``, ``signal``,
+    and ``value`` fields, or a 2-D array with three columns in that order.
+
+    Args:
+        path: ``.npy`` file path.
+        chunk_size: Number of records to convert at a time.
+
+    Yields:
+        (time, signal, value) records, in file order.
+    """
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as e:  # pragma: no cover
+        raise ImportError("read_stimulus_npy requires numpy") from e
+
+    a = numpy.load(path, mmap_mode="r")
+    if a.dtype.names is not None:
+        cols = (a["time"], a["signal"], a["value"])
+    elif a.ndim == 2 and a.shape[1] == 3:  # noqa: PLR2004
+        cols = (a[:, 0], a[:, 1], a[:, 2])
+    else:
+        raise ValueError(f"Expected structured or (N, 3) array, got shape {a.shape}")
+
+    ts, names, values = cols
+    for i in range(0, len(ts), chunk_size):
+        j = i + chunk_size
+        yield from zip(
+            ts[i:j].astype(int).tolist(),
+            names[i:j].tolist(),
+            values[i:j].tolist(),
+        )
+
+
+def play_stimulus(
+    records: Iterable[StimulusRecord],
+    signals: Mapping[Any, Value[Any]],
+    priority: int = 0,
+    region: Kernel.Region = Kernel.Region.ACTIVE,
+):
+    """Write (time, signal, value) records into variables at their times.
+
+    Records are consumed lazily, one time slot ahead,
+    so a streaming source (e.g. ``read_stimulus_csv``) is never loaded
+    into memory all at once.
+    There is no task per record, or per signal:
+    one kernel action applies all records of a time slot,
+    and reschedules itself for the next time.
+
+    Args:
+        records: (time, signal, value) records, in non-decreasing time order.
+        signals: Mapping from signal name to variable.
+            Variables may be ``Singular``,
+            or items of an ``Aggregate`` (e.g. ``mem[3]``).
+        priority: Order within each time slot.
+        region: Scheduling region.
+
+    The first record is checked immediately.
+    Later records are checked as they are read,
+    which is inside the kernel:
+    a bad record finishes the simulation,
+    and its error is raised by ``run``.
+    Writes from earlier time slots are kept.
+
+    Raises:
+        KeyError: Record signal not found in *signals*.
+        ValueError: Times are not in non-decreasing order,
+            or the first time is in the past.
+        RuntimeError: No kernel, or kernel is not currently running.
+    """
+    kernel = get_running_kernel()
+    events = ((t, signals[name], value) for t, name, value in records)
+    WriteSeq(kernel, events, priority, region).schedule()
@@ -7,10 +7,13 @@ from collections import Counter
 from collections.abc import Coroutine, Generator
 from enum import IntEnum
 from types import TracebackType
-from typing import Any, ClassVar, Iterator, Literal, Self, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Literal, Self, cast
 
 from ._kernel_if import KernelIf
 
+if TYPE_CHECKING:
+    from ._variable import Subscription
+
 type TaskCoro[ResultType] = Coroutine[None, Blocking | None, ResultType]
 
 type TaskArgs = (
@@ -30,10 +33,17 @@ class Kill(BaseException):
 
 
 class SupportsDropTask(ABC):
+    # Primitive a waiting task is blocked on, e.g. "Queue"; for reports
+    blocked_on = ""
+
     @abstractmethod
     def drop(self, task: Task[Any]) -> None:
         """Drop task from object's waiting queue."""
 
+    def wait_label(self) -> str | None:
+        """Return the wait latency label; None if a task here is not waiting."""
+        return self.blocked_on
+
 
 class Blocking(ABC):
     """Object capable of blocking task forward progress"""
@@ -145,6 +155,8 @@ class AnyOf(_Condition):
 class _WaitQ(SupportsDropTask):
     """Tasks wait for event trigger."""
 
+    blocked_on = "Task"
+
     def __init__(self):
         self._items: dict[Task[Any], tuple[Task[Any] | None, Task[Any] | None]] = {}
 
@@ -237,6 +249,9 @@ class Task[ResultType](KernelIf, Blocking):
         # Other tasks waiting for this task to complete
         self._waitq = _WaitQ()
 
+        # Static sensitivity
+        self._sensitive: Subscription | None = None
+
         # Flag to avoid multiple signals
         self._signal = False
 
@@ -284,6 +299,15 @@ class Task[ResultType](KernelIf, Blocking):
 
     group = property(fget=_get_group, fset=_set_group)
 
+    @property
+    def sensitive(self) -> Subscription | None:
+        """Static sensitivity, or None.
+
+        Set by the ``sensitive`` argument of ``create_task``.
+        Closed automatically when the task is done.
+        """
+        return self._sensitive
+
     def _set_state(self, state: State):
         assert state in self._state_transitions[self._state]
         self._state = state
@@ -352,15 +376,21 @@ class Task[ResultType](KernelIf, Blocking):
             else:
                 self._kernel.call_soon(task, args=(self.Command.RESUME,))
 
+    def _close_sensitive(self):
+        if self._sensitive is not None:
+            self._sensitive.close()
+
     def do_result(self, exc: StopIteration):
         self._result = exc.value
         self._set_state(self.State.RETURNED)
+        self._close_sensitive()
         self._set()
         assert self._refcnts.total() == 0
 
     def do_except(self, exc: BaseException):
         self._exception = exc
         self._set_state(self.State.EXCEPTED)
+        self._close_sensitive()
         self._set()
         assert self._refcnts.total() == 0
 
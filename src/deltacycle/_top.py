@@ -1,10 +1,12 @@
 """Top-level functions."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
 from typing import Any
 
+from ._action import Write, WriteSeq
 from ._kernel import DefaultKernel, Kernel
 from ._task import Blocking, Task, TaskCoro
+from ._variable import Subscription, Value
 
 _kernel: Kernel[Any] | None = None
 
@@ -88,6 +90,10 @@ def create_task[ResultType](
             If not given, a default name like ``Task-{index}`` will be assigned.
             Not guaranteed to be unique.
         kwargs: Arguments passed to the kernel to customize task execution.
+            For example, ``sensitive=[clk.posedge()]`` gives the task a
+            static sensitivity list; see ``wait``,
+            and ``region=Kernel.Region.POSTPONED`` runs the task in the
+            read-only postponed region.
 
     Returns:
         Created Task instance.
@@ -128,19 +134,27 @@ def _run_pre[MainResultType](
     return kernel
 
 
-def run[MainResultType](
+def run[MainResultType](  # noqa: PLR0913
     coro: TaskCoro[MainResultType] | None = None,
     kernel: Kernel[MainResultType] | None = None,
     kernel_type: type[Kernel[MainResultType]] = DefaultKernel,
     ticks: int | None = None,
     until: int | None = None,
+    *,
+    max_wall_seconds: float | None = None,
+    max_slots: int | None = None,
+    stop_when: Callable[[], bool] | None = None,
 ) -> MainResultType | None:
     """Run a simulation.
 
-    If a simulation hits the run limit, it will exit.
+    If a simulation hits a run limit, it will exit.
     That simulation may be resumed any number of times.
     If all tasks are exhausted, return the main coroutine result.
 
+    Simulation time limits are checked before each time slot.
+    Wall time, slot count, and *stop_when* limits are checked
+    after each time slot.
+
     Args:
         coro: Main coroutine function instance.
             Required if creating a new kernel.
@@ -151,17 +165,28 @@ def run[MainResultType](
             If provided, run for *ticks* simulation time steps.
         until: Optional absolute run limit.
             If provided, run *until* specified simulation time.
+        max_wall_seconds: Optional wall time limit, in seconds.
+        max_slots: Optional limit on the number of time slots.
+        stop_when: Optional model condition, e.g. ``lambda: done.value``.
+            Called after each time slot; stop if it returns True.
 
     Returns:
         If the main coroutine runs until completion, return its result.
         Otherwise, return ``None``.
 
     Raises:
-        ValueError: Creating a new kernel, but no main coroutine provided.
+        ValueError: Creating a new kernel, but no main coroutine provided,
+            or invalid *max_slots*.
         RuntimeError: The kernel is in an invalid state.
     """
     kernel = _run_pre(coro, kernel, kernel_type)
-    kernel(ticks, until)
+    kernel(
+        ticks,
+        until,
+        max_wall_seconds=max_wall_seconds,
+        max_slots=max_slots,
+        stop_when=stop_when,
+    )
 
     if kernel.main.done():
         return kernel.main.result()
@@ -213,6 +238,110 @@ async def sleep(delay: int):
     assert y is None
 
 
+def wait() -> Subscription:
+    """Return the current task's static sensitivity.
+
+    Use ``await wait()`` to suspend the current task until its static
+    sensitivity triggers.
+    The awaited value is the PredVariable that triggered.
+
+    The task must have been created with a ``sensitive`` argument.
+    The registration in each variable's wait queue persists across calls,
+    so re-arming does not depend on the number of variables.
+
+    Raises:
+        RuntimeError: The current task has no static sensitivity.
+    """
+    sub = get_running_kernel().check_task()._sensitive
+    if sub is None:
+        raise RuntimeError("Task has no static sensitivity")
+    return sub
+
+
+def nba[T](x: Value[T], value: T, priority: int = 0):
+    """Non-blocking assignment: update a variable in the NBA region.
+
+    The write to *x* is deferred until the active and inactive regions
+    of the current time slot are done.
+    Until then, ``x.value`` keeps its old value,
+    and tasks waiting on *x* are not woken up.
+
+    Args:
+        x: Variable (or variable item) to update.
+        value: New value.
+        priority: Order of writes within the NBA region.
+            Writes with the same priority are applied in call order.
+
+    Raises:
+        RuntimeError: No kernel, or kernel is not currently running.
+    """
+    kernel = get_running_kernel()
+    kernel.call_action_at(kernel.time(), Write(x, value), priority, Kernel.Region.NBA)
+
+
+def schedule_write[T](
+    x: Value[T],
+    value: T,
+    at: int,
+    priority: int = 0,
+    region: Kernel.Region = Kernel.Region.ACTIVE,
+):
+    """Schedule a write to a variable at a future time.
+
+    The write is a lightweight event in the kernel's queue;
+    no task is created or resumed.
+    It is ordered with other events in its time slot by *region*
+    and *priority*.
+
+    Args:
+        x: Variable (or variable item) to update.
+        value: New value.
+        at: Absolute simulation time of the write.
+        priority: Order within the time slot.
+        region: Scheduling region.
+
+    Raises:
+        ValueError: *at* is in the past.
+        RuntimeError: No kernel, or kernel is not currently running.
+    """
+    kernel = get_running_kernel()
+    if at < kernel.time():
+        raise ValueError(f"Expected at ≥ {kernel.time()}, got {at}")
+    kernel.call_action_at(at, Write(x, value), priority, region)
+
+
+def schedule_writes[T](
+    x: Value[T],
+    events: Iterable[tuple[int, T]],
+    priority: int = 0,
+    region: Kernel.Region = Kernel.Region.ACTIVE,
+):
+    """Schedule a sequence of writes to a variable.
+
+    Equivalent to calling ``schedule_write`` for each (time, value) pair,
+    but *events* is consumed lazily:
+    only the next write occupies the kernel's queue.
+    Multiple values at the same time are written in order.
+
+    For example, drive a vector of stimulus from two arrays::
+
+        schedule_writes(x, zip(times, values))
+
+    Args:
+        x: Variable (or variable item) to update.
+        events: (time, value) pairs, in non-decreasing time order.
+        priority: Order within each time slot.
+        region: Scheduling region.
+
+    Raises:
+        ValueError: Times are not in non-decreasing order,
+            or the first time is in the past.
+        RuntimeError: No kernel, or kernel is not currently running.
+    """
+    kernel = get_running_kernel()
+    WriteSeq(kernel, ((t, x, v) for t, v in events), priority, region).schedule()
+
+
 async def all_of(fst: Blocking, *rst: Blocking):
     """Block forward progress until all items are nonblocking.
 
@@ -0,0 +1,230 @@
+"""Chrome trace export"""
+
+from __future__ import annotations
+
+import json
+import time
+import warnings
+from os import PathLike
+from typing import TYPE_CHECKING, Any, TextIO
+from weakref import WeakKeyDictionary
+
+from ._action import Action, QueueItem
+from ._probe import Probe, _Shadow
+from ._profile import _action_label
+from ._task import SupportsDropTask, Task, TaskArgs
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+
+def _blocked_on(q: SupportsDropTask) -> str:
+    return q.blocked_on or type(q).__name__
+
+
+class TraceProbe(Probe):
+    """Write task activations as Chrome Trace Event JSON.
+
+    Events are written as they happen, through a buffered file,
+    so memory use does not depend on trace length.
+    """
+
+    axes = ("sim", "wall")
+
+    def __init__(
+        self,
+        kernel: DefaultKernel[Any],
+        path: str | PathLike[str],
+        axis: str,
+        timescale: int,
+        buffering: int,
+    ):
+        if axis not in self.axes:
+            raise ValueError(f"Expected axis in {self.axes}, got {axis!r}")
+        if timescale < 1:
+            raise ValueError(f"Expected timescale ≥ 1, got {timescale}")
+
+        super().__init__(kernel)
+        self._sim = axis == "sim"
+        self._timescale = timescale
+
+        self._f: TextIO = open(path, "w", buffering=buffering)
+        self._f.write('{"displayTimeUnit": "ns", "traceEvents": [\n')
+        self._f.write(
+            '{"ph": "M", "name": "process_name", "pid": 0, "tid": 0, '
+            f'"args": {{"name": {json.dumps(kernel._name)}}}}}'
+        )
+
+        # Task index or action label => (tid, JSON name)
+        self._lanes: dict[int | str, tuple[int, str]] = {}
+        self._action_tid = 0
+
+        # Woken task => (flow id, JSON waker name)
+        # A woken task may be killed before it runs; do not keep it alive
+        self._flows: WeakKeyDictionary[Task[Any], tuple[int, str]] = WeakKeyDictionary()
+        self._flow_id = 0
+
+        # Activation being traced
+        self._item: Task[Any] | Action | None = None
+        self._args: TaskArgs | None = None
+        self._lane: tuple[int, str] = (0, "")
+        self._woken_by: str | None = None
+        self._ts = "0"
+        self._t0 = 0.0
+
+        # Sim axis: position of the next activation in the slot
+        self._slot = kernel.init_time
+        self._ordinal = 0
+        self._overflow = False
+
+        self._origin = time.perf_counter()
+
+    def _shadows(self) -> list[_Shadow]:
+        kernel = self._kernel
+        queue = kernel._queue
+        pop = queue.pop
+        call_soon = kernel.call_soon
+        run_slot = kernel._run_slot
+        update_vars = kernel._update_vars
+
+        def tracing_pop() -> QueueItem:
+            self._end()
+            item = pop()
+            self._begin(item[1], item[2])
+            return item
+
+        def tracing_call_soon(task: Task[Any], args: TaskArgs):
+            call_soon(task, args)
+            if self._item is not None and self._item is not task:
+                self._wake(task)
+
+        def tracing_run_slot(t: int) -> bool:
+            try:
+                return run_slot(t)
+            finally:
+                self._end()
+
+        def tracing_update_vars():
+            self._end()
+            update_vars()
+
+        return [
+            (queue, "pop", tracing_pop),
+            (kernel, "call_soon", tracing_call_soon),
+            (kernel, "_run_slot", tracing_run_slot),
+            (kernel, "_update_vars", tracing_update_vars),
+        ]
+
+    def _get_lane(self, item: Task[Any] | Action) -> tuple[int, str]:
+        key = item.index if isinstance(item, Task) else _action_label(item)
+        try:
+            return self._lanes[key]
+        except KeyError:
+            pass
+
+        if isinstance(item, Task):
+            tid = item.index + 1
+            name = json.dumps(item.name)
+        else:
+            self._action_tid -= 1
+            tid = self._action_tid
+            name = json.dumps(key)
+        lane = self._lanes[key] = (tid, name)
+        self._f.write(
+            f',\n{{"ph": "M", "name": "thread_name", "pid": 0, "tid": {tid}, '
+            f'"args": {{"name": {name}}}}}'
+        )
+        return lane
+
+    def _begin(self, item: Task[Any] | Action, args: TaskArgs | None):
+        self._item = item
+        self._args = args
+        self._lane = self._get_lane(item)
+
+        t = self._kernel.time()
+        if t != self._slot:
+            self._slot = t
+            self._ordinal = 0
+        self._ordinal += 1
+
+        self._t0 = time.perf_counter()
+        if self._sim:
+            offset = self._ordinal - 1
+            if offset >= self._timescale:
+                self._warn_overflow(t)
+                # Stay inside the time step
+                offset = self._timescale - 1
+            self._ts = str(t * self._timescale + offset)
+        else:
+            self._ts = f"{(self._t0 - self._origin) * 1e6:.3f}"
+
+        self._woken_by = None
+        if isinstance(item, Task):
+            flow = self._flows.pop(item, None)
+            if flow is not None:
+                fid, self._woken_by = flow
+                tid, _ = self._lane
+                self._f.write(
+                    f',\n{{"ph": "f", "bp": "e", "name": "wake", "cat": "wake", '
+                    f'"id": {fid}, "ts": {self._ts}, "pid": 0, "tid": {tid}}}'
+                )
+
+    def _warn_overflow(self, t: int):
+        if not self._overflow:
+            self._overflow = True
+            warnings.warn(
+                f"Time slot {t} has more than {self._timescale} activations; "
+                "the rest share its last microsecond. Use a larger timescale.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    def _wake(self, task: Task[Any]):
+        self._flow_id += 1
+        fid = self._flow_id
+        tid, name = self._lane
+        self._flows[task] = (fid, name)
+        self._f.write(
+            f',\n{{"ph": "s", "name": "wake", "cat": "wake", '
+            f'"id": {fid}, "ts": {self._ts}, "pid": 0, "tid": {tid}}}'
+        )
+
+    def _end(self):
+        item = self._item
+        if item is None:
+            return
+        self._item = None
+
+        wall = (time.perf_counter() - self._t0) * 1e6
+        dur = "1" if self._sim else f"{wall:.3f}"
+        tid, name = self._lane
+
+        fields = [f'"time": {self._kernel.time()}', f'"wall_us": {wall:.3f}']
+        if isinstance(item, Task):
+            assert self._args is not None
+            cat = "task"
+            fields.append(f'"command": "{self._args[0].name}"')
+            if self._woken_by is not None:
+                fields.append(f'"woken_by": {self._woken_by}')
+            if item.done():
+                fields.append(f'"state": "{item.state().name}"')
+            else:
+                blocked = sorted({_blocked_on(q) for q in item._refcnts})
+                fields.append(f'"blocked_on": {json.dumps(blocked)}')
+        else:
+            cat = "action"
+
+        self._f.write(
+            f',\n{{"ph": "X", "name": {name}, "cat": "{cat}", '
+            f'"ts": {self._ts}, "dur": {dur}, "pid": 0, "tid": {tid}, '
+            f'"args": {{{", ".join(fields)}}}}}'
+        )
+
+    def uninstall(self):
+        self._end()
+        super().uninstall()
+
+    def close(self):
+        self._flows.clear()
+        self._f.write("\n]}\n")
+        self._f.close()
@@ -5,53 +5,163 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Callable, Generator, Hashable
-from typing import Any, Iterator, Self
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Iterator, Self, cast
 
 from ._kernel_if import KernelIf
 from ._task import Blocking, SupportsDropTask, Task
 
+if TYPE_CHECKING:
+    from ._kernel import Kernel
+
 type Predicate = Callable[[], bool]
 
 
 class _WaitQ(SupportsDropTask):
-    """Tasks wait for variable touch."""
+    """Tasks wait for variable touch.
+
+    Waiting tasks are grouped by predicate function.
+    Predicates compare equal if they are the same function,
+    or bound methods of the same function and instance.
+    Each distinct predicate is evaluated once per notification,
+    no matter how many tasks are waiting on it.
+
+    Subscribers (static sensitivity) stay resident in the queue.
+    They share predicate evaluation with dynamically waiting tasks.
+    """
 
     def __init__(self):
-        self._items: dict[Task[Any], bool] = {}
-        self._pvs: defaultdict[Task[Any], set[PredVariable]] = defaultdict(set)
+        # task => (unblock, order)
+        self._items: dict[Task[Any], tuple[bool, int]] = {}
+        self._pvs: dict[Task[Any], set[PredVariable]] = {}
+
+        # predicate => {task: pv}
+        self._preds: dict[Predicate, dict[Task[Any], PredVariable]] = {}
+
+        # predicate => {subscriber: pv}
+        self._subs: dict[Predicate, dict[_Subscriber, PredVariable]] = {}
+
+        # Monotonically increasing integer
+        # Wake up tasks in the order they started waiting
+        self._index: int = 0
+
+    blocked_on = "PredVariable"
+
+    # Set by subclasses that need to know when subscriptions are armed
+    track_armed = False
+
+    def on_arm(self):
+        """Subscription armed."""
+
+    def on_disarm(self):
+        """Subscription disarmed."""
+
+    def __bool__(self) -> bool:
+        return bool(self._items) or bool(self._subs)
+
+    def _unbucket(self, task: Task[Any], p: Predicate):
+        bucket = self._preds[p]
+        del bucket[task]
+        if not bucket:
+            del self._preds[p]
 
     def drop(self, task: Task[Any]):
         del self._items[task]
-        del self._pvs[task]
+        for p in {pv._p for pv in self._pvs.pop(task)}:
+            self._unbucket(task, p)
         task._unlink(tq=self)
 
     def remove(self, task: Task[Any], pv: PredVariable):
-        self._pvs[task].remove(pv)
-        if not self._pvs[task]:
+        pvs = self._pvs[task]
+        pvs.remove(pv)
+
+        # Other PredVariables may share the same predicate
+        if self._preds[pv._p][task] is pv:
+            for x in pvs:
+                if x._p == pv._p:
+                    self._preds[pv._p][task] = x
+                    break
+            else:
+                self._unbucket(task, pv._p)
+
+        if not pvs:
             self.drop(task)
 
     def push(self, task: Task[Any], unblock: bool, pv: PredVariable):
         if task not in self._items:
             task._link(tq=self)
-            self._items[task] = unblock
+            self._items[task] = (unblock, self._index)
+            self._pvs[task] = set()
+            self._index += 1
         else:
-            assert unblock == self._items[task]
+            assert unblock == self._items[task][0]
         self._pvs[task].add(pv)
 
-    def pop(self) -> Iterator[tuple[Task[Any], bool, set[PredVariable], PredVariable]]:
-        items: list[tuple[Task[Any], bool, set[PredVariable], PredVariable]] = []
+        try:
+            bucket = self._preds[pv._p]
+        except KeyError:
+            bucket = self._preds[pv._p] = {}
+        bucket.setdefault(task, pv)
 
-        for task, unblock in self._items.items():
+    def subscribe(self, sub: _Subscriber, pv: PredVariable):
+        try:
+            bucket = self._subs[pv._p]
+        except KeyError:
+            bucket = self._subs[pv._p] = {}
+        bucket.setdefault(sub, pv)
+
+    def unsubscribe(self, sub: _Subscriber, pv: PredVariable):
+        bucket = self._subs[pv._p]
+        bucket.pop(sub, None)
+        if not bucket:
+            del self._subs[pv._p]
+
+    def fired(self) -> list[Predicate]:
+        """Evaluate each distinct predicate; return the ones that are True."""
+        fired = [p for p in self._preds if p()]
+        if self._subs:
+            fired.extend(p for p in self._subs if p not in self._preds and p())
+        return fired
+
+    def pop(
+        self, fired: list[Predicate]
+    ) -> Iterator[tuple[Task[Any], bool, set[PredVariable], PredVariable]]:
+        buckets = [self._preds[p] for p in fired if p in self._preds]
+
+        # Common case: one predicate fired; bucket is already in wait order
+        if len(buckets) == 1:
+            items = list(buckets[0].items())
+        else:
+            tpvs: dict[Task[Any], PredVariable] = {}
+            for bucket in buckets:
+                for task, pv in bucket.items():
+                    tpvs.setdefault(task, pv)
+            items = sorted(tpvs.items(), key=lambda x: self._items[x[0]][1])
+
+        for task, pv in items:
+            unblock, _ = self._items[task]
             pvs = self._pvs[task]
-            for pv in pvs:
-                if pv:
-                    items.append((task, unblock, pvs, pv))
-                    break
-
-        for task, unblock, pvs, pv in items:
             self.drop(task)
             yield (task, unblock, pvs, pv)
 
+    def pop_subs(self, fired: list[Predicate]) -> list[tuple[_Subscriber, PredVariable]]:
+        """Return triggered subscribers, in the order they subscribed."""
+        subs: dict[_Subscriber, PredVariable] = {}
+        for p in fired:
+            bucket = self._subs.get(p)
+            if bucket is not None:
+                for sub, pv in bucket.items():
+                    subs.setdefault(sub, pv)
+        return list(subs.items())
+
+
+class _Subscriber(ABC):
+    """Resident member of variable wait queues (static sensitivity)."""
+
+    @abstractmethod
+    def _fire(self, kernel: Kernel[Any], pv: PredVariable) -> None:
+        """React to a predicate in the sensitivity list becoming True."""
+
 
 class Variable(KernelIf):
     """Model component that changes over time.
@@ -75,18 +185,43 @@ class Variable(KernelIf):
     Tasks may schedule updates to variables.
     Changes to variable values may unblock tasks,
     which may in turn schedule updates to other variables.
+
+    An optional *name* identifies the variable in kernel reports.
     """
 
-    def __init__(self):
+    def __init__(self, name: str | None = None):
+        self._name = name
         self._waitq = _WaitQ()
 
-    def _set(self):
-        for task, unblock, pvs, pv in self._waitq.pop():
+        # Interned PredVariable for any change
+        self._changed_pv: PredVariable | None = None
+
+    @property
+    def name(self) -> str | None:
+        """Variable name, or None if not given."""
+        return self._name
+
+    def _notify(self, waitq: _WaitQ):
+        fired = waitq.fired()
+        if fired:
+            self._wake_fired(waitq, fired)
+
+    def _wake_fired(self, waitq: _WaitQ, fired: list[Predicate]):
+        kernel = self._kernel
+
+        for task, unblock, pvs, pv in waitq.pop(fired):
             if unblock:
-                self._kernel._forks.clr(task, *pvs)
-                self._kernel.call_soon(task, args=(Task.Command.RESUME, pv))
+                kernel._forks.clr(task, *pvs)
+                kernel.call_soon(task, args=(Task.Command.RESUME, pv))
             else:
-                self._kernel.call_soon(task, args=(Task.Command.RESUME,))
+                kernel.call_soon(task, args=(Task.Command.RESUME,))
+
+        if waitq._subs:
+            for sub, pv in waitq.pop_subs(fired):
+                sub._fire(kernel, pv)
+
+    def _set(self):
+        self._notify(self._waitq)
 
         # Add variable to update set
         self._kernel.touch_var(self)
@@ -94,12 +229,19 @@ class Variable(KernelIf):
     def pred(self, p: Predicate | None = None) -> PredVariable:
         """Return blocking, predicated variable.
 
+        If no predicate is given, wait for any change.
+        That PredVariable is created once, and shared by all waiters.
+
         Args:
             p: Predicate function with no args and ``bool`` return type.
 
         Returns:
             Predicated Variable object.
         """
+        if p is None:
+            if self._changed_pv is None:
+                self._changed_pv = PredVariable(self)
+            return self._changed_pv
         return PredVariable(self, p)
 
     @abstractmethod
@@ -130,6 +272,7 @@ class PredVariable(KernelIf, Blocking):
 
     def __init__(self, v: Variable, p: Predicate | None = None):
         self._var = v
+        self._waitq = v._waitq
         if p is None:
             self._p = v.changed
         else:
@@ -152,17 +295,123 @@ class PredVariable(KernelIf, Blocking):
            to ``True``, unblock all tasks waiting for that event.
         """
         task = self._kernel.check_task()
-        self._var._waitq.push(task, unblock=False, pv=self)
+        self._waitq.push(task, unblock=False, pv=self)
         y = yield from task.switch_gen()
         assert y is None
 
     # Blocking
     def try_block(self, task: Task[Any]) -> Blocking.Type:
-        self._var._waitq.push(task, unblock=True, pv=self)
+        self._waitq.push(task, unblock=True, pv=self)
         return Blocking.Type.PERM_BLOCKING
 
     def unblock(self, task: Task[Any]):
-        self._var._waitq.remove(task, pv=self)
+        self._waitq.remove(task, pv=self)
+
+
+class Subscription(KernelIf, SupportsDropTask, _Subscriber):
+    """Persistent (static) sensitivity to predicated variables.
+
+    Awaiting a ``PredVariable`` registers the task in the variable's wait
+    queue, and the registration is dropped when the task wakes up.
+    A task that awaits the same PredVariable(s) in a loop pays that cost on
+    every iteration.
+
+    A subscription registers once, when it is created,
+    and stays resident until it is closed.
+    Awaiting it only *arms* the subscription for the current task,
+    which is O(1) work, however many variables it is sensitive to.
+    For a single PredVariable, that costs about the same as awaiting it;
+    the saving is with several, e.g. instead of ``any_of``.
+    Await returns the PredVariable that triggered.
+
+    Only one task at a time may await a subscription.
+    When a variable changes, armed subscriptions wake up in the order they
+    were created.
+
+    Use as a context manager to close the subscription automatically::
+
+        with Subscription(clk.posedge()) as sub:
+            while True:
+                await sub
+                q.next = d.prev
+
+    Alternatively, use ``create_task(..., sensitive=[...])`` and ``wait``.
+    """
+
+    blocked_on = "PredVariable"
+
+    def __init__(self, fst: PredVariable, *rst: PredVariable):
+        self._pvs = tuple(dict.fromkeys((fst, *rst)))
+
+        # Armed by this task
+        self._task: Task[Any] | None = None
+
+        self._closed = False
+
+        for pv in self._pvs:
+            pv._waitq.subscribe(self, pv)
+
+        # Wait queues that track armed subscriptions
+        waitqs = dict.fromkeys(pv._waitq for pv in self._pvs)
+        self._tracked = tuple(wq for wq in waitqs if wq.track_armed)
+
+    @property
+    def pvs(self) -> tuple[PredVariable, ...]:
+        """Predicated variables in the sensitivity list."""
+        return self._pvs
+
+    def close(self):
+        """Remove subscription from all variable wait queues."""
+        if self._task is not None:
+            self.drop(self._task)
+        if not self._closed:
+            for pv in self._pvs:
+                pv._waitq.unsubscribe(self, pv)
+            self._closed = True
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ):
+        self.close()
+
+    def __await__(self) -> Generator[None, Blocking, PredVariable]:
+        """Await any predicated variable in the sensitivity list."""
+        if self._closed:
+            raise RuntimeError("Subscription is closed")
+        if self._task is not None:
+            raise RuntimeError("Subscription is armed by another task")
+
+        task = self._kernel.check_task()
+        task._link(tq=self)
+        self._task = task
+        for wq in self._tracked:
+            wq.on_arm()
+
+        pv = yield from task.switch_gen()
+        return cast(PredVariable, pv)
+
+    def drop(self, task: Task[Any]):
+        assert self._task is task
+        self._task = None
+        task._unlink(tq=self)
+        for wq in self._tracked:
+            wq.on_disarm()
+
+    def _fire(self, kernel: Kernel[Any], pv: PredVariable):
+        task = self._task
+        if task is not None:
+            # Same as drop, inlined: called once per wake-up
+            self._task = None
+            task._unlink(tq=self)
+            for wq in self._tracked:
+                wq.on_disarm()
+            kernel.call_soon(task, args=(Task.Command.RESUME, pv))
 
 
 class Value[T](ABC):
@@ -184,12 +433,16 @@ class Value[T](ABC):
 class Singular[T](Variable, Value[T]):
     """Model state organized as a single unit."""
 
-    def __init__(self, value: T):
-        Variable.__init__(self)
+    def __init__(self, value: T, name: str | None = None):
+        Variable.__init__(self, name)
         self._prev = value
         self._next = value
         self._changed: bool = False
 
+        # Interned PredVariables for edges
+        self._posedge_pv: PredVariable | None = None
+        self._negedge_pv: PredVariable | None = None
+
     # Value
     def get_prev(self) -> T:
         return self._prev
@@ -197,6 +450,7 @@ class Singular[T](Variable, Value[T]):
     prev = property(fget=get_prev)
 
     def set_next(self, value: T):
+        self._kernel.check_write()
         self._changed = value != self._next
         self._next = value
 
@@ -219,6 +473,34 @@ class Singular[T](Variable, Value[T]):
     def changed(self) -> bool:
         return self._changed
 
+    def is_posedge(self) -> bool:
+        """Return True if value changed from falsy to truthy."""
+        return not self._prev and bool(self._next)
+
+    def is_negedge(self) -> bool:
+        """Return True if value changed from truthy to falsy."""
+        return bool(self._prev) and not self._next
+
+    def posedge(self) -> PredVariable:
+        """Return blocking, predicated variable for positive edges.
+
+        Equivalent to ``pred(is_posedge)``,
+        but the PredVariable is created once, and shared by all waiters.
+        """
+        if self._posedge_pv is None:
+            self._posedge_pv = PredVariable(self, self.is_posedge)
+        return self._posedge_pv
+
+    def negedge(self) -> PredVariable:
+        """Return blocking, predicated variable for negative edges.
+
+        Equivalent to ``pred(is_negedge)``,
+        but the PredVariable is created once, and shared by all waiters.
+        """
+        if self._negedge_pv is None:
+            self._negedge_pv = PredVariable(self, self.is_negedge)
+        return self._negedge_pv
+
     def update(self):
         self._prev = self._next
         self._changed = False
@@ -227,8 +509,8 @@ class Singular[T](Variable, Value[T]):
 class Aggregate[T](Variable):
     """Model state organized as multiple units."""
 
-    def __init__(self, value: T):
-        Variable.__init__(self)
+    def __init__(self, value: T, name: str | None = None):
+        Variable.__init__(self, name)
         self._prevs: defaultdict[Hashable, T] = defaultdict(lambda: value)
         self._nexts: dict[Hashable, T] = {}
 
@@ -248,6 +530,7 @@ class Aggregate[T](Variable):
 
     def set_next(self, key: Hashable, value: T):
         """Schedule update to value in the current timeslot."""
+        self._kernel.check_write()
         if value != self.get_next(key):
             self._nexts[key] = value
 
@@ -0,0 +1,166 @@
+"""Wall-clock watchdog"""
+
+from __future__ import annotations
+
+import ctypes
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import TYPE_CHECKING, Any, TextIO
+
+from ._action import Action, QueueItem
+from ._probe import Probe, _Shadow
+from ._profile import _action_label
+from ._task import Task
+
+if TYPE_CHECKING:
+    from ._kernel import DefaultKernel
+
+
+class WatchdogTimeout(Exception):
+    """A task activation exceeded the watchdog wall-time threshold.
+
+    Raised inside the task by ``DefaultKernel.enable_watchdog``,
+    if *raise_timeout* is True.
+    """
+
+
+def _watch(ref: weakref.ref[_WatchdogProbe], stop: threading.Event, interval: float):
+    # Hold the probe (and its kernel) only while checking it
+    while not stop.wait(interval):
+        probe = ref()
+        if probe is None:
+            return
+        probe._check()
+        del probe
+
+
+class _WatchdogProbe(Probe):
+    """Watch the wall time of the current activation from another thread.
+
+    The kernel thread only stores the current item and its start time,
+    without locking.
+    The start time also identifies the activation:
+    the watcher reads it before and after the item,
+    and ignores a torn read.
+
+    The thread holds the probe by weak reference,
+    so it exits if the kernel is dropped without disabling the watchdog.
+    """
+
+    def __init__(
+        self,
+        kernel: DefaultKernel[Any],
+        timeout: float,
+        raise_timeout: bool,
+        file: TextIO | None,
+    ):
+        if timeout <= 0:
+            raise ValueError(f"Expected timeout > 0, got {timeout}")
+
+        super().__init__(kernel)
+        self._timeout = timeout
+        self._raise = raise_timeout
+        self._file = file
+
+        # Current item, and its start time, written by the kernel thread
+        self._item: Task[Any] | Action | None = None
+        self._t0: float | None = None
+        self._ident = threading.get_ident()
+
+        # Start time of the last reported activation
+        self._reported: float | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _shadows(self) -> list[_Shadow]:
+        kernel = self._kernel
+        queue = kernel._queue
+        pop = queue.pop
+        run_slot = kernel._run_slot
+
+        def stamping_pop() -> QueueItem:
+            item = pop()
+            # Item first: a new start time implies a new item
+            self._item = item[1]
+            self._t0 = time.perf_counter()
+            return item
+
+        def watched_run_slot(t: int) -> bool:
+            self._ident = threading.get_ident()
+            try:
+                return run_slot(t)
+            finally:
+                self._t0 = None
+
+        return [
+            (queue, "pop", stamping_pop),
+            (kernel, "_run_slot", watched_run_slot),
+        ]
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=_watch,
+            args=(weakref.ref(self), self._stop, self._timeout / 4),
+            name=f"{self._kernel._name}-watchdog",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _check(self):
+        t0 = self._t0
+        item = self._item
+        if t0 is None or item is None or t0 != self._t0 or t0 == self._reported:
+            return
+        elapsed = time.perf_counter() - t0
+        if elapsed > self._timeout:
+            self._reported = t0
+            self._report(item, elapsed)
+            if self._raise and isinstance(item, Task):
+                self._raise_in_task(item, t0)
+
+    def _report(self, item: Task[Any] | Action, elapsed: float):
+        name = item.name if isinstance(item, Task) else _action_label(item)
+        lines = [
+            f"Watchdog: {name} has run for {elapsed:.3f}s "
+            f"at time {self._kernel.time()}, without yielding\n"
+        ]
+        frame = sys._current_frames().get(self._ident)
+        if frame is not None:
+            lines.extend(traceback.format_stack(frame))
+        f = sys.stderr if self._file is None else self._file
+        f.write("".join(lines))
+        f.flush()
+
+    def _in_task(self, task: Task[Any]) -> bool:
+        """Return True if the kernel thread is executing inside *task*."""
+        coro_frame = getattr(task.coro, "cr_frame", None)
+        frame = sys._current_frames().get(self._ident)
+        while frame is not None:
+            if frame is coro_frame:
+                return True
+            frame = frame.f_back
+        return False
+
+    def _raise_in_task(self, task: Task[Any], t0: float):
+        # The exception is raised where the kernel thread was preempted,
+        # which must be inside the task, not the kernel.
+        # Check the start time last, with no other work before the call,
+        # so the activation cannot change while this thread holds the GIL.
+        ident = ctypes.c_ulong(self._ident)
+        exc = ctypes.py_object(WatchdogTimeout)
+        if not self._in_task(task) or self._t0 != t0:
+            return
+        n = ctypes.pythonapi.PyThreadState_SetAsyncExc(ident, exc)
+        if n != 1:
+            # Undo: no thread, or more than one thread, was modified
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ident, None)
@@ -0,0 +1,75 @@
+"""Test NumPy array variables"""
+
+import pytest
+
+from deltacycle import ArraySingular, create_task, run, sleep
+
+from .conftest import Trace, trace
+
+np = pytest.importorskip("numpy")
+
+
+def test_array_basic():
+    x = ArraySingular(np.zeros((2, 3)), dtype=np.int32)
+    assert x.shape == (2, 3)
+    assert x.dtype == np.int32
+
+    async def main():
+        # Views are read-only
+        with pytest.raises(ValueError):
+            x.prev[0, 0] = 1
+        with pytest.raises(ValueError):
+            x.value[0, 0] = 1
+
+        x.next = np.ones((2, 3))
+        assert x.changed()
+        assert (x.prev == 0).all()
+        assert (x.value == 1).all()
+
+        await sleep(1)
+        assert not x.changed()
+        assert (x.prev == 1).all()
+        assert (x.value == 1).all()
+
+        # Partial update: copy-on-write from prev
+        x.set_next_item((0, slice(1, 3)), 5)
+        assert x.changed()
+        assert x.value.tolist() == [[1, 5, 5], [1, 1, 1]]
+
+        await sleep(1)
+        assert x.prev.tolist() == [[1, 5, 5], [1, 1, 1]]
+
+        # Same value: not a change
+        x.next = x.prev.copy()
+        assert not x.changed()
+
+    run(main())
+
+
+EXP = {
+    (1, "mon", "1.0"),
+    (3, "mon", "2.0"),
+}
+
+
+def test_array_tolerance(captrace: Trace):
+    x = ArraySingular(np.zeros(4), atol=0.1)
+
+    async def mon():
+        while True:
+            await x.pred()
+            trace(f"{x.value[0]}")
+
+    async def main():
+        create_task(mon(), name="mon")
+        await sleep(1)
+        x.next = np.full(4, 1.0)
+        await sleep(1)
+        # Within tolerance
+        x.next = np.full(4, 1.05)
+        await sleep(1)
+        x.next = np.full(4, 2.0)
+
+    run(main())
+
+    assert captrace == EXP
@@ -0,0 +1,71 @@
+"""Test signal banks"""
+
+import sys
+from typing import Never
+
+import pytest
+
+from deltacycle import BankItem, SignalBank, create_task, run, sleep
+
+from .conftest import Trace, trace
+
+
+def test_bank_basic():
+    bank = SignalBank(8, value=0, typecode="q")
+    assert len(bank) == 8
+
+    with pytest.raises(IndexError):
+        bank[8]
+
+    async def main():
+        x = bank[3]
+        assert x.index == 3
+        x.next = 42
+        assert x.changed()
+        assert not bank[4].changed()
+        assert bank.changed()
+        assert x.prev == 0
+        assert x.value == 42
+        await sleep(1)
+
+        assert not x.changed()
+        assert not bank.changed()
+        assert x.prev == 42
+
+        # Bulk commit
+        for i in range(8):
+            bank[i].next = i
+        await sleep(1)
+        assert [bank.get_prev(i) for i in range(8)] == list(range(8))
+
+    run(main())
+
+
+def test_bank_chain(captrace: Trace):
+    """Chain of buffers."""
+    n = 4
+    bank: SignalBank[bool] = SignalBank(n, value=False)
+
+    async def buf(x: BankItem[bool], y: BankItem[bool]) -> Never:
+        while True:
+            await x.pred()
+            trace(f"{x.value:d}")
+            y.next = x.value
+
+    async def main():
+        for i in range(n - 1):
+            create_task(buf(bank[i], bank[i + 1]), name=f"buf_{i}")
+        await sleep(1)
+        bank[0].next = True
+
+    run(main())
+
+    assert captrace == {(1, f"buf_{i}", "1") for i in range(n - 1)}
+    assert all(bank.get_prev(i) for i in range(n))
+
+
+def test_bank_memory():
+    n = 10_000
+    bank = SignalBank(n, value=0, typecode="b")
+    size = sys.getsizeof(bank._prevs) + sys.getsizeof(bank._nexts)
+    assert size / n < 4
@@ -0,0 +1,132 @@
+"""Test packed bit vectors"""
+
+import pytest
+
+from deltacycle import Bits, BitVec, cat, create_task, run, sleep
+
+from .conftest import Trace, trace
+
+
+def test_bits_basic():
+    x = Bits.from_str("10XZ")
+    assert x.size == len(x) == 4
+    assert str(x) == "4'b10XZ"
+    assert x == Bits.from_str("1_0xz")
+    assert x != Bits.from_str("10X0")
+    assert hash(x) == hash(Bits.from_str("10XZ"))
+    assert not x.is_known()
+    assert bool(x)
+    assert not Bits(4)
+
+    with pytest.raises(ValueError):
+        Bits(-1)
+    with pytest.raises(ValueError):
+        Bits.from_str("10?")
+    with pytest.raises(ValueError):
+        int(x)
+    assert int(Bits.from_str("1010")) == 10
+
+
+def test_bits_slice_cat():
+    x = Bits.from_str("10XZ")
+    assert x[0] == Bits.from_str("Z")
+    assert x[-1] == Bits.from_str("1")
+    assert x[1:3] == Bits.from_str("0X")
+    assert x[2:] == Bits.from_str("10")
+    assert x[3:1] == Bits(0)
+
+    with pytest.raises(IndexError):
+        x[4]
+    with pytest.raises(ValueError):
+        x[::2]
+
+    assert cat(x[:2], x[2:]) == x
+    assert cat(Bits.from_str("01"), Bits.from_str("1X")) == Bits.from_str("1X01")
+
+
+def test_bits_ops():
+    x = Bits.from_str("0000_1111_XXXX_ZZZZ")
+    y = Bits.from_str("01XZ_01XZ_01XZ_01XZ")
+
+    assert ~x == Bits.from_str("1111_0000_XXXX_XXXX")
+    assert x & y == Bits.from_str("0000_01XX_0XXX_0XXX")
+    assert x | y == Bits.from_str("01XX_1111_X1XX_X1XX")
+    assert x ^ y == Bits.from_str("01XX_10XX_XXXX_XXXX")
+
+    with pytest.raises(ValueError):
+        _ = x & Bits(4)
+
+
+def test_bitvec_masks():
+    x = BitVec(8)
+
+    async def main():
+        x.next = 0b0000_1111
+        assert x.changed_mask() == 0b0000_1111
+        assert x.posedge_mask() == 0b0000_1111
+        assert x.negedge_mask() == 0
+        await sleep(1)
+
+        x.next = 0b0011_1100
+        assert x.changed_mask() == 0b0011_0011
+        assert x.posedge_mask() == 0b0011_0000
+        assert x.negedge_mask() == 0b0000_0011
+        await sleep(1)
+
+        x.set_next_bits(slice(4, 8), Bits.from_str("XXXX"))
+        assert x.value == Bits.from_str("XXXX_1100")
+        assert x.changed_mask() == 0b1111_0000
+        assert x.posedge_mask() == 0
+        assert x.negedge_mask() == 0
+
+        with pytest.raises(ValueError):
+            x.next = 256
+        with pytest.raises(ValueError):
+            x.next = Bits(4)
+        with pytest.raises(ValueError):
+            x.set_next_bits(slice(0, 4), Bits(2))
+
+    run(main())
+
+
+def test_bitvec_two_state():
+    with pytest.raises(ValueError):
+        BitVec(4, value=Bits.from_str("000X"), four_state=False)
+
+
+EXP = {
+    (1, "lo", "0x1"),
+    (3, "lo", "0x3"),
+    (2, "hi", "0x10"),
+    (3, "hi", "0x30"),
+}
+
+
+def test_bitvec_pred_bits(captrace: Trace):
+    bus = BitVec(8)
+
+    async def mon(key: slice):
+        while True:
+            await bus.pred_bits(key)
+            trace(f"{int(bus.value) & (0xF << key.start):#x}")
+
+    async def main():
+        create_task(mon(slice(0, 4)), name="lo")
+        create_task(mon(slice(4, 8)), name="hi")
+        await sleep(1)
+        bus.next = 0x01
+        await sleep(1)
+        bus.next = 0x11
+        await sleep(1)
+        bus.next = 0x33
+
+    run(main(), until=10)
+
+    assert captrace == EXP
+
+
+def test_bitvec_pred_bits_interned():
+    bus = BitVec(8)
+    assert bus.pred_bits(slice(0, 4)) is bus.pred_bits(slice(None, 4))
+    assert bus.pred_bits(3) is bus.pred_bits(slice(3, 4))
+    assert bus.pred_bits(slice(0, 4)) is not bus.pred_bits(slice(4, 8))
@@ -0,0 +1,223 @@
+"""Test kernel-driven clocks"""
+
+from typing import Never
+
+import pytest
+
+from deltacycle import Clock, create_task, now, run, sleep, step, wait
+
+from .conftest import Trace, trace
+
+
+def test_clock_errors():
+    with pytest.raises(ValueError):
+        Clock(period=1)
+    with pytest.raises(ValueError):
+        Clock(period=10, duty=10)
+    with pytest.raises(ValueError):
+        Clock(period=10, phase=-1)
+
+
+def test_clock_analytic():
+    clk = Clock(period=10, duty=3, phase=2)
+    assert clk.period == 10 and clk.duty == 3 and clk.phase == 2
+    assert [clk.level_at(t) for t in range(14)] == [
+        False, False, True, True, True, False, False,
+        False, False, False, False, False, True, True,
+    ]  # fmt: skip
+    assert clk.next_edge(0) == 2
+    assert clk.next_edge(2) == 5
+    assert clk.next_edge(5) == 12
+
+
+EXP = {
+    # Fast clock: period 4
+    (2, "fast", "1"),
+    (4, "fast", "0"),
+    (6, "fast", "1"),
+    (8, "fast", "0"),
+    (10, "fast", "1"),
+    # Slow clock: period 10, duty 3, phase 1
+    (1, "slow", "1"),
+    (4, "slow", "0"),
+    (11, "slow", "1"),
+}
+
+
+def test_clock_domains(captrace: Trace):
+    fast = Clock(period=4, phase=2)
+    slow = Clock(period=10, duty=3, phase=1)
+
+    async def mon(clk: Clock) -> Never:
+        while True:
+            await clk.pred()
+            trace(f"{clk.value:d}")
+
+    async def main():
+        create_task(mon(fast), name="fast")
+        create_task(mon(slow), name="slow")
+        fast.start()
+        slow.start()
+
+        with pytest.raises(RuntimeError):
+            fast.start()
+
+    run(main(), until=12)
+
+    assert captrace == EXP
+
+
+def test_clock_start_stop():
+    clk = Clock(period=10)
+
+    async def main():
+        await sleep(3)
+
+        # Start mid-period: clock level set immediately
+        clk.start()
+        assert clk.running()
+        assert clk.value
+        await clk.negedge()
+        assert clk.prev and not clk.value
+
+        await sleep(1)
+        clk.stop()
+        assert not clk.running()
+        await sleep(100)
+        assert not clk.value
+
+        # Restart
+        clk.start()
+        await clk.posedge()
+        assert clk.value
+
+    run(main(), until=200)
+
+
+def test_clock_fast_forward():
+    clk = Clock(period=10, duty=3, phase=2)
+    times: list[int] = []
+
+    async def main():
+        clk.start()
+        await clk.posedge()
+        times.append(now())
+
+        # Nobody waiting: clock goes idle
+        await sleep(1_000_005)
+        assert clk.idle() and clk.running()
+
+        # Analytic value while idle: t=1000007, (t-2) % 10 == 5
+        assert not clk.value and not clk.prev and not clk.changed()
+
+        # Waiting wakes the clock up, in phase
+        await clk.posedge()
+        times.append(now())
+        assert not clk.idle()
+        await clk.negedge()
+        times.append(now())
+
+    slots = list(step(main()))
+
+    assert times == [2, 1_000_012, 1_000_015]
+    assert len(slots) < 10
+
+
+def test_clock_fast_forward_edge():
+    clk = Clock(period=10, phase=0)
+
+    async def main():
+        clk.start()
+        await clk.negedge()
+        await sleep(20)
+
+        # Edge due now: it has not happened yet
+        assert now() == 25 and clk.idle()
+        assert not clk.changed() and clk.value and clk.prev
+        assert not clk.is_negedge() and not clk.is_posedge()
+        await clk.negedge()
+        assert now() == 25 and not clk.value
+        await clk.posedge()
+        assert now() == 30
+
+        # Stop while idle: hold current value
+        await sleep(11)
+        assert clk.idle()
+        clk.stop()
+        assert not clk.running() and clk.value
+
+    run(main())
+
+
+def test_clock_fast_forward_same():
+    def sim(fast_forward: bool) -> list[tuple[int, bool, bool]]:
+        clk = Clock(period=10, phase=5, fast_forward=fast_forward)
+        wakes: list[tuple[int, bool, bool]] = []
+
+        async def main():
+            clk.start()
+            for delay in (95, 0, 3, 17, 20, 1):
+                if delay:
+                    await sleep(delay)
+                await clk.posedge()
+                wakes.append((now(), clk.prev, clk.value))
+                await clk.negedge()
+                wakes.append((now(), clk.prev, clk.value))
+            clk.stop()
+
+        run(main())
+        return wakes
+
+    assert sim(True) == sim(False)
+    assert sim(True)[0] == (95, False, True)
+
+
+def test_clock_read_after_run():
+    clk = Clock(period=10, phase=5)
+
+    async def main():
+        clk.start()
+        await clk.posedge()
+        await sleep(101)
+        assert clk.idle()
+
+    run(main())
+
+    # Idle clock lets the kernel complete; it is still readable
+    assert clk.prev and clk.value and not clk.changed()
+
+
+def test_clock_fast_forward_off():
+    clk = Clock(period=10, fast_forward=False)
+
+    async def main():
+        clk.start()
+        await sleep(1_000)
+        assert not clk.idle()
+
+    slots = 0
+    for t in step(main()):
+        slots += 1
+        if t > 1_000:
+            break
+    assert slots > 200
+
+
+def test_clock_fast_forward_subscription():
+    clk = Clock(period=10, phase=5)
+    times: list[int] = []
+
+    async def mon():
+        s = wait()
+        for _ in range(3):
+            await s
+            times.append(now())
+            await sleep(100)
+
+    async def main():
+        clk.start()
+        create_task(mon(), sensitive=[clk.posedge()])
+
+    list(step(main()))
+
+    assert times == [5, 105, 205]
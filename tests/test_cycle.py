@@ -0,0 +1,209 @@
+"""Test cycle-based kernel"""
+
+from typing import Any, cast
+
+import pytest
+
+from deltacycle import (
+    Clock,
+    CycleKernel,
+    Register,
+    SignalBank,
+    Singular,
+    create_task,
+    get_running_kernel,
+    run,
+    sleep,
+)
+
+from .test_add import VALS
+
+
+def _kernel() -> CycleKernel[Any]:
+    return cast(CycleKernel[Any], get_running_kernel())
+
+
+def test_add():
+    a = Singular(False)
+    b = Singular(False)
+    ci = Singular(False)
+    s = Singular(False)
+    co = Singular(False)
+
+    def sum_():
+        s.next = a.value ^ b.value ^ ci.value
+
+    def carry():
+        co.next = a.value & b.value | ci.value & (a.value | b.value)
+
+    async def main():
+        kernel = _kernel()
+        kernel.comb(sum_, [a, b, ci], [s])
+        kernel.comb(carry, [a, b, ci], [co])
+        for a_val, b_val, ci_val, s_val, co_val in VALS:
+            a.next = a_val
+            b.next = b_val
+            ci.next = ci_val
+            await sleep(1)
+            assert (s.value, co.value) == (s_val, co_val)
+
+    run(main(), kernel_type=CycleKernel)
+
+
+def test_levels():
+    """Reconvergent cone: y depends on x through two paths."""
+    x = Singular(0)
+    p = Singular(0)
+    q = Singular(0)
+    y = Singular(0)
+    evals: list[str] = []
+
+    def f_y():
+        evals.append("y")
+        y.next = p.value + q.value
+
+    def f_p():
+        evals.append("p")
+        p.next = x.value + 1
+
+    def f_q():
+        evals.append("q")
+        q.next = x.value * 2
+
+    async def main():
+        kernel = _kernel()
+        kernel.comb(f_y, [p, q], [y])
+        kernel.comb(f_p, [x], [p])
+        kernel.comb(f_q, [x], [q])
+        assert kernel.levels() == [[f_p, f_q], [f_y]]
+
+        await sleep(1)
+        assert y.value == 1
+        evals.clear()
+
+        x.next = 5
+        await sleep(1)
+        assert y.value == 16
+
+        # Each process evaluated once
+        assert evals == ["p", "q", "y"]
+
+    run(main(), kernel_type=CycleKernel)
+
+
+def test_counter():
+    """Synchronous counter: register + incrementer."""
+    clk = Clock(period=10, phase=5)
+    d = Singular(0)
+    q = Register(clk, d)
+
+    def inc():
+        d.next = (q.value + 1) % 16
+
+    async def main():
+        _kernel().comb(inc, [q], [d])
+        clk.start()
+        await sleep(101)
+        assert q.value == 10 and d.value == 11
+
+    run(main(), kernel_type=CycleKernel, until=200)
+
+
+def test_undeclared():
+    """Undeclared writes fall back to event semantics."""
+    x = Singular(0)
+    y = Singular(0)
+    z = Singular(0)
+
+    def f_y():
+        y.next = x.value + 1
+
+    def f_z():
+        z.next = y.value + 1
+        # Not declared as output; dirties level zero
+        if z.value < 10:
+            x.next = z.value
+
+    async def main():
+        kernel = _kernel()
+        kernel.comb(f_y, [x], [y])
+        kernel.comb(f_z, [y], [z])
+        await sleep(1)
+        assert (x.value, y.value, z.value) == (8, 9, 10)
+
+    run(main(), kernel_type=CycleKernel)
+
+
+def test_errors():
+    x = Singular(0)
+    y = Singular(0)
+
+    def f():
+        pass
+
+    def g():
+        pass
+
+    async def loop():
+        kernel = _kernel()
+        kernel.comb(f, [x], [y])
+        kernel.comb(g, [y], [x])
+        with pytest.raises(ValueError, match="loop"):
+            kernel.levels()
+
+    # Also raised by the kernel, when it evaluates the logic
+    with pytest.raises(ValueError, match="loop"):
+        run(loop(), kernel_type=CycleKernel)
+
+    async def drivers():
+        kernel = _kernel()
+        kernel.comb(f, [], [y])
+        kernel.comb(g, [], [y])
+        with pytest.raises(ValueError, match="multiple"):
+            kernel.levels()
+
+    with pytest.raises(ValueError, match="multiple"):
+        run(drivers(), kernel_type=CycleKernel)
+
+
+def test_no_settle():
+    x = Singular(0)
+
+    def f():
+        # Undeclared feedback that never settles
+        x.next = x.value + 1
+
+    class Kernel(CycleKernel[None]):
+        max_passes = 10
+
+    async def main():
+        cast(Kernel, get_running_kernel()).comb(f, [x], [])
+        await sleep(1)
+
+    with pytest.raises(RuntimeError, match="settle"):
+        run(main(), kernel_type=Kernel)
+
+
+def test_bank():
+    """Every bank write re-dirties its readers, even after a settle pass."""
+    bank = SignalBank(2, 0)
+    y = Singular(0)
+
+    def f():
+        y.next = bank.get_next(0) + bank.get_next(1)
+
+    async def late():
+        bank.set_next(1, 100)
+
+    async def main():
+        kernel = _kernel()
+        kernel.comb(f, [bank], [y])
+        await sleep(1)
+
+        # Second write to the bank in this slot comes after the settle pass
+        create_task(late(), priority=CycleKernel.settle_priority + 1)
+        bank.set_next(0, 1)
+        await sleep(1)
+        assert y.value == 101
+
+    run(main(), kernel_type=CycleKernel)
@@ -0,0 +1,79 @@
+"""Test kernel hooks"""
+
+import pytest
+
+from deltacycle import DefaultKernel, Singular, Task, create_task, run, sleep
+
+
+def test_hooks():
+    x = Singular(0)
+
+    async def child(n: int):
+        await sleep(n)
+        x.next = n
+
+    async def main():
+        create_task(child(3), name="c3")
+        create_task(child(5), name="c5")
+        await sleep(7)
+
+    kernel = DefaultKernel(main())
+    events: list[tuple[object, ...]] = []
+
+    # Slot end hooks see settled values
+    kernel.on_slot_end(lambda t: events.append(("end", t, x.value)))
+    kernel.on_time_advance(lambda old, new: events.append(("advance", old, new)))
+    kernel.on_task_start(lambda task: events.append(("start", task.name)))
+
+    @kernel.on_task_done
+    def done(task: Task[object]):
+        events.append(("done", task.name))
+
+    run(kernel=kernel)
+
+    assert events == [
+        ("advance", -1, 0),
+        ("start", "main"),
+        ("start", "c3"),
+        ("start", "c5"),
+        ("end", 0, 0),
+        ("advance", 0, 3),
+        ("done", "c3"),
+        ("end", 3, 3),
+        ("advance", 3, 5),
+        ("done", "c5"),
+        ("end", 5, 5),
+        ("advance", 5, 7),
+        ("done", "main"),
+        ("end", 7, 5),
+    ]
+
+
+def test_remove_hook():
+    async def main():
+        await sleep(10)
+        await sleep(10)
+
+    kernel = DefaultKernel(main())
+
+    def check(t: int):
+        assert t < 10, "too late"
+
+    kernel.on_slot_end(check)
+    kernel.on_task_done(print)
+
+    # Hook exceptions propagate out of run
+    with pytest.raises(AssertionError, match="too late"):
+        run(kernel=kernel)
+
+    kernel.remove_hook(check)
+    kernel.remove_hook(print)
+    with pytest.raises(ValueError):
+        kernel.remove_hook(check)
+
+    # No hooks: kernel methods are not shadowed
+    assert "_run_slot" not in vars(kernel)
+    assert "pop" not in vars(kernel._queue)
+
+    run(kernel=kernel)
+    assert kernel.main.done()
@@ -71,6 +71,30 @@ def test_limits(captrace: Trace):
     assert kernel.time() == 400
 
 
+def test_slot_limits(captrace: Trace):
+    run(main(1000), max_slots=10)
+    kernel = get_running_kernel()
+    assert kernel.time() == 9
+
+    # Stop after the slot where the condition becomes true
+    run(kernel=kernel, stop_when=lambda: kernel.time() >= 100)
+    assert kernel.time() == 100
+
+    # Simulation time limit hits first
+    run(kernel=kernel, until=150, max_slots=100)
+    assert kernel.time() == 149
+
+    # Wall time budget: at least one slot runs
+    run(kernel=kernel, max_wall_seconds=0.0)
+    assert kernel.time() == 150
+
+    with pytest.raises(ValueError):
+        run(kernel=kernel, max_slots=0)
+
+    # Resume to completion
+    assert run(kernel=kernel, max_wall_seconds=60.0) == 1000
+
+
 def test_nocoro():
     with pytest.raises(ValueError):
         run()
@@ -0,0 +1,148 @@
+"""Test wait latency histograms"""
+
+import gc
+import json
+
+import pytest
+
+from deltacycle import (
+    AnyOf,
+    DefaultKernel,
+    Event,
+    Histogram,
+    LatencyReport,
+    Lock,
+    Queue,
+    Task,
+    create_task,
+    run,
+    set_kernel,
+    sleep,
+)
+
+
+def test_histogram():
+    h = Histogram(precision=3)
+    assert h.percentile(50) == 0
+    assert h.mean == 0.0
+
+    # Exact below 2**3
+    for v in range(8):
+        h.record(v)
+    assert h.buckets() == [(v, v, 1) for v in range(8)]
+
+    # Buckets span 1/4 of the value
+    h.record(100, count=2)
+    assert h.buckets()[-1] == (96, 111, 2)
+    assert h.count == 10
+    assert h.min == 0
+    assert h.max == 100
+    assert h.mean == pytest.approx((28 + 200) / 10)
+    assert h.percentile(50) == 4
+    assert h.percentile(99) == 100
+    assert h.percentile(0) == 0
+
+    g = Histogram(precision=3)
+    g.record(1000)
+    h.merge(g)
+    assert h.count == 11
+    assert h.max == 1000
+    assert h.percentile(100) == 1000
+
+    d = json.loads(json.dumps(h.to_dict()))
+    assert Histogram.from_dict(d).buckets() == h.buckets()
+
+    with pytest.raises(ValueError):
+        h.merge(Histogram(precision=4))
+    with pytest.raises(ValueError):
+        h.record(-1)
+    with pytest.raises(ValueError):
+        h.percentile(101)
+    with pytest.raises(ValueError):
+        Histogram(precision=0)
+
+
+def test_latency():
+    lock = Lock()
+    q: Queue[int] = Queue()
+    event = Event()
+
+    async def user():
+        async with lock.req():
+            await sleep(10)
+
+    async def getter():
+        await q.get()
+
+    async def waiter():
+        await event
+
+    async def impatient():
+        # Reneges from the lock after 5
+        await AnyOf(lock.req(), create_task(sleep(5)))
+
+    async def main():
+        for _ in range(3):
+            create_task(user())
+        create_task(getter())
+        create_task(waiter())
+        create_task(impatient())
+
+        await sleep(5)
+        q.try_put(1)
+        await sleep(5)
+        event.set()
+
+    kernel = DefaultKernel(main())
+    with pytest.raises(RuntimeError):
+        kernel.latency()
+    kernel.enable_latency()
+    run(kernel=kernel)
+
+    report = kernel.latency()
+    sim = report.sim
+    assert set(sim) == {"AnyOf/AllOf", "Event", "Queue.get", "Semaphore.get", "Task"}
+    assert sim["Queue.get"].max == 5
+    assert sim["Event"].max == 10
+    assert sim["AnyOf/AllOf"].max == 5
+    assert sim["Task"].max == 5
+
+    # Two users wait 10 and 20; impatient task waits 5
+    assert [(lo, n) for lo, _, n in sim["Semaphore.get"].buckets()] == [(5, 1), (10, 1), (20, 1)]
+
+    acts = report.activations
+    assert acts["Semaphore.get"].count == 3
+    assert acts["Semaphore.get"].min > 0
+
+    lines = report.table().splitlines()
+    assert len(lines) == 6
+    assert lines[-2].endswith("Semaphore.get")
+    with pytest.raises(ValueError):
+        report.table(axis="wall")
+
+    # Merge replications
+    both = report.merge(LatencyReport.from_dict(json.loads(json.dumps(report.to_dict()))))
+    assert both.sim["Semaphore.get"].count == 6
+    assert report.sim["Semaphore.get"].count == 3
+
+    kernel.disable_latency()
+    with pytest.raises(RuntimeError):
+        kernel.latency()
+
+
+def test_dropped_kernel():
+    """A kernel dropped with latency enabled restores Task._link."""
+    link = getattr(Task, "_link")
+
+    async def main():
+        await sleep(1)
+
+    kernel = DefaultKernel(main())
+    kernel.enable_latency()
+    assert getattr(Task, "_link") is not link
+    run(kernel=kernel)
+
+    del kernel
+    set_kernel()
+    gc.collect()
+    assert getattr(Task, "_link") is link
@@ -0,0 +1,108 @@
+"""Test zero-delay livelock detection"""
+
+from typing import Never
+
+import pytest
+
+from deltacycle import (
+    DefaultKernel,
+    Kernel,
+    LivelockError,
+    Method,
+    Singular,
+    create_task,
+    get_running_kernel,
+    run,
+    sleep,
+)
+
+from .common import Int
+
+
+class SmallKernel(DefaultKernel[None]):
+    max_slot_activations = 1_000
+    max_slot_updates = 10_000
+    livelock_sample = 100
+    livelock_top = 3
+
+
+def test_ping_pong():
+    a = Int(name="a")
+    b = Int(name="b")
+
+    async def ping() -> Never:
+        while True:
+            await b.pred()
+            a.next = a.value + 1
+
+    async def pong() -> Never:
+        while True:
+            await a.pred()
+            b.next = b.value + 1
+
+    async def main():
+        create_task(ping(), name="ping")
+        create_task(pong(), name="pong")
+        await sleep(10)
+        a.next = 1
+
+    with pytest.raises(LivelockError) as e:
+        run(main(), kernel_type=SmallKernel)
+
+    assert e.value.time == 10
+    assert {name for name, _ in e.value.tasks} == {"ping", "pong"}
+    assert {name for name, _ in e.value.variables} == {"a", "b"}
+    assert "more than 1000 activations" in str(e.value)
+
+
+def test_kernel_finished():
+    x = Singular(0)
+
+    def toggle():
+        x.next = not x.value
+
+    kernel: Kernel[None] | None = None
+
+    async def main():
+        nonlocal kernel
+        kernel = get_running_kernel()
+        Method(toggle, [x.pred()])
+        x.next = 1
+
+    with pytest.raises(LivelockError) as e:
+        run(main(), kernel_type=SmallKernel)
+
+    assert e.value.tasks[0][0] == "Method(test_kernel_finished.<locals>.toggle)"
+    assert kernel is not None and kernel.state() is Kernel.State.FINISHED
+
+
+def test_updates():
+    x = Singular(0)
+
+    async def main():
+        for i in range(20_000):
+            x.next = i
+        await sleep(0)
+
+    with pytest.raises(LivelockError, match="more than 10000 variable updates"):
+        run(main(), kernel_type=SmallKernel)
+
+
+def test_disabled():
+    x = Singular(0)
+
+    class Unlimited(SmallKernel):
+        max_slot_activations = None
+        max_slot_updates = None
+
+    def count():
+        if x.value < 5_000:
+            x.next = x.value + 1
+
+    async def main():
+        Method(count, [x.pred()])
+        x.next = 1
+        await sleep(1)
+        assert x.value == 5_000
+
+    run(main(), kernel_type=Unlimited)
@@ -0,0 +1,89 @@
+"""Test simulation logging"""
+
+import io
+import logging
+
+import pytest
+
+from deltacycle import SimLog, create_task, log, run, sleep
+
+
+class Costly:
+    """Count string conversions."""
+
+    n = 0
+
+    def __str__(self) -> str:
+        Costly.n += 1
+        return "costly"
+
+
+def test_log():
+    lines: list[str] = []
+    slog = SimLog(level=logging.INFO, capacity=3, sink=lines.append, fmt="{time} {task}: {message}")
+
+    async def worker(n: int):
+        for i in range(n):
+            slog.info("i=%d", i)
+            slog.debug("%s", Costly())
+            await sleep(10)
+
+    async def main():
+        create_task(worker(2), name="w")
+        slog.warning("main")
+        await sleep(100)
+
+    slog.info("before")
+    run(main())
+
+    # Debug records are never formatted
+    assert Costly.n == 0
+    assert lines == ["-1 : before", "0 main: main", "0 w: i=0", "10 w: i=1"]
+
+    # Ring buffer keeps the last 3 records
+    records = slog.records()
+    assert [r.message for r in records] == ["main", "i=0", "i=1"]
+    assert records[0].level_name == "WARNING"
+    assert records[-1].time == 10
+
+    f = io.StringIO()
+    slog.dump(f)
+    assert f.getvalue().splitlines() == lines[1:]
+
+    slog.clear()
+    assert not slog.records()
+
+
+def test_filters():
+    slog = SimLog(level=logging.DEBUG)
+    slog.set_filter(tasks={"a"}, start=10, stop=30)
+    assert slog.enabled_for(logging.DEBUG)
+
+    async def task():
+        for _ in range(5):
+            slog.debug("%s", Costly())
+            await sleep(10)
+
+    async def main():
+        create_task(task(), name="a")
+        create_task(task(), name="b")
+
+    Costly.n = 0
+    run(main())
+
+    assert [(r.time, r.task) for r in slog.records()] == [(10, "a"), (20, "a")]
+    assert Costly.n == 0
+
+    with pytest.raises(ValueError):
+        slog.configure(capacity=0)
+
+
+def test_global_log():
+    log.configure(level=logging.ERROR)
+    try:
+        assert not log.enabled_for(logging.WARNING)
+        log.warning("dropped")
+        log.error("kept")
+        assert [r.message for r in log.records()] == ["kept"]
+    finally:
+        log.configure()
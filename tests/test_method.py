@@ -0,0 +1,289 @@
+"""Test method (callback) processes"""
+
+from typing import Never
+
+import pytest
+
+from deltacycle import Clock, Kernel, Method, Singular, create_task, get_kernel, now, run, sleep
+
+from .common import Bool
+from .conftest import Trace, trace
+from .test_add import EXP, VALS
+
+
+def test_add(captrace: Trace):
+    """Same adder as test_add, with a method instead of a task."""
+    period = 10
+
+    clk = Bool(name="clk")
+    a = Bool(name="a")
+    b = Bool(name="b")
+    ci = Bool(name="ci")
+    s = Bool(name="s")
+    co = Bool(name="co")
+
+    def adder():
+        g = a.value & b.value
+        p = a.value | b.value
+        s.next = a.value ^ b.value ^ ci.value
+        co.next = g | p & ci.value
+
+    async def drv_clk() -> Never:
+        clk.next = False
+        while True:
+            await sleep(period // 2)
+            clk.next = not clk.prev
+
+    async def drv_inputs():
+        for a_val, b_val, ci_val, _, _ in VALS:
+            a.next = a_val
+            b.next = b_val
+            ci.next = ci_val
+            await clk.posedge()
+
+    async def mon_outputs() -> Never:
+        while True:
+            await clk.posedge()
+            trace(f"s={s.prev:b} co={co.prev:b}")
+
+    async def main():
+        Method(adder, [a.pred(), b.pred(), ci.pred()], priority=-1)
+        create_task(drv_clk(), name="drv_clk", priority=0)
+        create_task(drv_inputs(), name="drv_inputs", priority=0)
+        create_task(mon_outputs(), name="mon_outputs", priority=1)
+
+    run(main(), until=period * len(VALS))
+
+    assert captrace == EXP
+
+
+def test_once_per_slot():
+    a = Singular(0)
+    b = Singular(0)
+    y = Singular(0)
+    calls: list[int] = []
+
+    def f():
+        calls.append(now())
+        y.next = a.value + b.value
+
+    m = Method(f, [a.pred(), b.pred(), a.pred()])
+    assert m.func is f and m.priority == 0
+    assert m.pvs == (a.pred(), b.pred())
+
+    async def main():
+        a.next = 1
+        b.next = 2
+        await y.pred()
+        assert y.value == 3
+
+        # Combinational chain settles within the slot
+        await sleep(5)
+        b.next = 5
+        await y.pred()
+        assert now() == 5 and y.value == 6
+
+        m.close()
+        assert m.closed()
+        a.next = 10
+        await sleep(1)
+        assert y.value == 6
+
+        with pytest.raises(RuntimeError):
+            m.schedule()
+
+    run(main())
+
+    assert calls == [0, 5]
+
+
+def test_schedule():
+    a = Singular(1)
+    y = Singular(0)
+
+    def f():
+        y.next = a.value
+
+    async def main():
+        m = Method(f, [a.pred()])
+        m.schedule()
+        m.schedule()
+        await y.pred()
+        assert y.value == 1
+
+    run(main())
+
+    with pytest.raises(ValueError):
+        Method(f, [])
+
+
+def test_clock():
+    clk = Clock(period=10)
+    n = Singular(0)
+
+    def count():
+        n.next = n.value + 1
+
+    async def main():
+        clk.start()
+        await sleep(50)
+
+        # A method keeps the clock awake; the edge due now still fires
+        m = Method(count, [clk.posedge()])
+        await sleep(40)
+        assert not clk.idle()
+        assert n.value == 4
+
+        m.close()
+        await sleep(20)
+        assert clk.idle()
+
+    run(main(), until=1000)
+
+
+def test_except():
+    """A raising method stops the simulation, and leaves the kernel finished."""
+    a = Singular(1)
+
+    def f():
+        _ = 1 // a.value
+
+    async def main():
+        Method(f, [a.pred()])
+        a.next = 0
+        await sleep(1)
+
+    with pytest.raises(ZeroDivisionError):
+        run(main())
+
+    kernel = get_kernel()
+    assert kernel is not None and kernel.state() is Kernel.State.FINISHED
+    with pytest.raises(RuntimeError):
+        run(kernel=kernel)
+
+
+def _diamond(ranked: bool):
+    """Reconvergent paths: a => x => z, and a => y => w => z."""
+    a = Singular(0)
+    x = Singular(0)
+    y = Singular(0)
+    w = Singular(0)
+    z = Singular(0)
+    seen: list[int] = []
+
+    def fx():
+        x.next = a.value + 1
+
+    def fy():
+        y.next = a.value + 2
+
+    def fw():
+        w.next = y.value * 10
+
+    def fz():
+        z.next = x.value + w.value
+        seen.append(x.value + w.value)
+
+    def outs(*vs: Singular[int]):
+        return vs if ranked else None
+
+    async def main():
+        Method(fx, [a.pred()], outputs=outs(x))
+        Method(fy, [a.pred()], outputs=outs(y))
+        Method(fw, [y.pred()], outputs=outs(w))
+        mz = Method(fz, [x.pred(), w.pred()], outputs=outs(z))
+
+        for i in range(1, 4):
+            a.next = i
+            await sleep(1)
+
+        return mz
+
+    mz = run(main())
+    return mz, seen, z.prev
+
+
+def test_ranked():
+    mz, seen, z = _diamond(ranked=False)
+    assert mz is not None
+    # Called once per arriving input change
+    assert mz.triggers == 6 and mz.calls == 6
+    assert z == 54
+
+    mz, seen, z = _diamond(ranked=True)
+    assert mz is not None
+    assert mz.rank() == 2
+    assert mz.outputs is not None
+
+    # One call per slot, after all inputs settled
+    assert mz.triggers == 6 and mz.calls == 3
+    assert seen == [32, 43, 54]
+    assert z == 54
+
+
+def test_rank_loop():
+    a = Singular(0)
+    b = Singular(0)
+
+    def f():
+        pass
+
+    async def main():
+        m1 = Method(f, [a.pred()], outputs=[b])
+        m2 = Method(f, [b.pred()], outputs=[a])
+        with pytest.raises(ValueError):
+            m1.rank()
+
+        m2.close()
+        assert m1.rank() == 0
+        m1.close()
+
+    run(main())
+
+    # Ranked methods need a running kernel
+    with pytest.raises(RuntimeError):
+        Method(f, [a.pred()], outputs=[b])
+
+
+def test_rank_kernels():
+    """A loop left in one simulation does not leak into the next."""
+
+    def f():
+        pass
+
+    async def main1():
+        a = Singular(0)
+        b = Singular(0)
+        Method(f, [a.pred()], outputs=[b])
+        Method(f, [b.pred()], outputs=[a])
+
+    run(main1())
+
+    mz, seen, z = _diamond(ranked=True)
+    assert mz is not None
+    assert mz.rank() == 2
+    assert seen == [32, 43, 54] and z == 54
+
+
+def test_rank_undeclared():
+    """Undeclared feedback still settles, with extra calls."""
+    a = Singular(0)
+    b = Singular(0)
+    calls: list[int] = []
+
+    def f():
+        calls.append(a.value)
+        if a.value < 3:
+            a.next = a.value + 1
+        b.next = a.value
+
+    async def main():
+        m = Method(f, [a.pred()], outputs=[b])
+        a.next = 1
+        await sleep(1)
+        assert b.prev == 3
+        m.close()
+
+    run(main())
+
+    assert calls == [1, 2, 3]
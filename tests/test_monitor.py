@@ -0,0 +1,143 @@
+"""Test resource monitors"""
+
+import pytest
+
+from deltacycle import (
+    Container,
+    CreditPool,
+    LevelStats,
+    Lock,
+    Queue,
+    Semaphore,
+    create_task,
+    run,
+    sleep,
+)
+
+
+def test_lock():
+    lock = Lock()
+    mon = lock.monitor()
+    assert lock.monitor() is mon
+
+    async def user(t0: int, t1: int):
+        await sleep(t0)
+        async with lock.req():
+            await sleep(t1)
+
+    async def main():
+        # Busy [10, 40); one user waits [20, 30)
+        create_task(user(10, 20))
+        create_task(user(20, 10))
+        await sleep(50)
+
+    run(main())
+
+    assert mon.level.duration() == 50
+    assert mon.level.min == 0
+    assert mon.level.max == 1
+    assert mon.utilization() == pytest.approx(30 / 50)
+
+    assert mon.waiting.max == 1
+    assert mon.waiting.mean() == pytest.approx(10 / 50)
+    assert mon.waiting.changes == 2
+
+
+def test_queue():
+    q: Queue[int] = Queue(capacity=2)
+    mon = q.monitor(series=100)
+
+    async def producer():
+        for i in range(4):
+            await q.put(i)
+            await sleep(10)
+
+    async def consumer():
+        await sleep(25)
+        for _ in range(4):
+            await q.get()
+
+    async def main():
+        create_task(producer())
+        create_task(consumer())
+
+    run(main())
+
+    # Level: 1 @ [0, 10), 2 @ [10, 25), 0 @ [25, 45)
+    assert mon.level.series() == [
+        (0, 0),
+        (0, 1),
+        (10, 2),
+        (25, 1),
+        (25, 0),
+        (25, 1),
+        (25, 0),
+        (35, 1),
+        (35, 0),
+    ]
+    assert mon.level.duration() == 45
+    assert mon.level.max == 2
+    assert mon.level.mean() == pytest.approx(40 / 45)
+    assert mon.utilization() == pytest.approx(40 / 45 / 2)
+
+    # Producer waits [20, 25); consumer waits [25, 35)
+    assert mon.waiting.mean() == pytest.approx(15 / 45)
+    assert mon.waiting.mean(now=35) == pytest.approx(15 / 35)
+
+
+def test_container_credits():
+    c = Container()
+    c_mon = c.monitor()
+    credits = CreditPool(value=4, capacity=4)
+    p_mon = credits.monitor()
+
+    async def main():
+        c.try_put(3)
+        async with credits.req(n=3):
+            await sleep(10)
+        c.try_get(2)
+        await sleep(10)
+
+    run(main())
+
+    assert c_mon.level.mean() == pytest.approx((3 * 10 + 1 * 10) / 20)
+    with pytest.raises(ValueError):
+        c_mon.utilization()
+
+    assert p_mon.level.min == 1
+    assert p_mon.utilization() == pytest.approx(3 * 10 / 4 / 20)
+
+
+def test_semaphore_started():
+    sem = Semaphore(value=2)
+
+    async def main():
+        await sleep(10)
+        mon = sem.monitor()
+        await sem.get()
+        await sleep(10)
+        return mon
+
+    mon = run(main())
+    assert mon is not None
+    assert mon.level.duration() == 10
+    assert mon.level.mean() == 1.0
+    assert mon.level.var() == 0.0
+
+
+def test_level_stats():
+    stats = LevelStats(0, 0, series=4)
+    for t in range(1, 11):
+        stats._record(t, t % 2)
+    stats._record(11, 0)
+
+    assert stats.changes == 10
+    assert stats.mean(now=10) == pytest.approx(0.5)
+    assert stats.std(now=10) == pytest.approx(0.5)
+    assert LevelStats(0, 3).mean() == 3.0
+
+    # Decimated to every 4th change
+    assert stats.series() == [(0, 0), (4, 0), (8, 0)]
+
+    with pytest.raises(ValueError):
+        LevelStats(0, 0, series=-1)
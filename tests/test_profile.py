@@ -0,0 +1,127 @@
+"""Test task CPU time profiler"""
+
+import gc
+import re
+import time
+import weakref
+
+import pytest
+
+from deltacycle import (
+    DefaultKernel,
+    Singular,
+    Task,
+    TaskGroup,
+    create_task,
+    nba,
+    run,
+    sleep,
+)
+
+
+async def slow():
+    for _ in range(3):
+        time.sleep(0.002)
+        await sleep(1)
+
+
+async def fast():
+    for _ in range(3):
+        await sleep(1)
+
+
+async def group():
+    async with TaskGroup() as tg:
+        tg.create_task(slow(), name="slow")
+        tg.create_task(fast(), name="fast")
+
+
+def test_profile():
+    x = Singular(0)
+
+    async def main():
+        create_task(group(), name="group")
+        for i in range(2):
+            nba(x, i)
+            await sleep(1)
+
+    kernel = DefaultKernel(main())
+    with pytest.raises(RuntimeError):
+        kernel.profile()
+    kernel.enable_profile()
+    run(kernel=kernel)
+
+    prof = kernel.profile()
+
+    by_task = {name: (n, t) for name, n, t in prof.by_task()}
+    # 3 sleeps + return
+    assert by_task["slow"][0] == 4
+    assert by_task["fast"][0] == 4
+    assert by_task["slow"][1] >= 0.006 > by_task["fast"][1]
+    assert prof.by_task()[0][0] == "slow"
+
+    # Actions created per write are grouped together
+    assert by_task["Write"][0] == 2
+
+    by_func = prof.by_function()
+    assert by_func[0][0].startswith("slow (test_profile.py:")
+
+    stacks = [stack for stack, _, _ in prof.by_stack()]
+    assert re.fullmatch(r"group \(.*\);slow \(.*\)", stacks[0])
+    assert any(re.fullmatch(r"test_profile.<locals>.main \(.*\)", s) for s in stacks)
+
+    lines = prof.collapsed().splitlines()
+    assert len(lines) == len(stacks)
+    assert re.fullmatch(r"group \(.*\);slow \(.*\) \d+", lines[0])
+
+    assert prof.calls == sum(n for _, n, _ in prof.by_task())
+    assert prof.total == pytest.approx(sum(t for _, _, t in prof.by_task()))
+
+    table = prof.table(by="task", limit=2).splitlines()
+    assert len(table) == 3
+    assert table[1].endswith("  slow")
+    with pytest.raises(ValueError):
+        prof.table(by="line")
+
+
+def test_done_tasks():
+    """The profile does not keep done tasks alive."""
+    refs: list[weakref.ref[Task[None]]] = []
+
+    async def main():
+        for _ in range(3):
+            t = create_task(fast(), name="fast")
+            refs.append(weakref.ref(t))
+            await t
+
+    kernel = DefaultKernel(main())
+    kernel.enable_profile()
+    run(kernel=kernel)
+
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+    # 3 tasks x (3 sleeps + return)
+    by_task = {name: n for name, n, _ in kernel.profile().by_task()}
+    assert by_task["fast"] == 12
+
+
+def test_probes():
+    """Stats and profile may be enabled and disabled in any order."""
+
+    async def main():
+        await fast()
+
+    kernel = DefaultKernel(main())
+    kernel.enable_stats()
+    kernel.enable_profile()
+    kernel.disable_stats()
+    run(kernel=kernel)
+
+    assert kernel.profile().by_task()[0][1] == 4
+    with pytest.raises(RuntimeError):
+        kernel.stats()
+
+    kernel.disable_profile()
+    assert "pop" not in vars(kernel._queue)
+    assert "_run_slot" not in vars(kernel)
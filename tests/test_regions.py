@@ -0,0 +1,144 @@
+"""Test scheduling regions"""
+
+from typing import Never
+
+import pytest
+
+from deltacycle import (
+    Kernel,
+    Method,
+    Singular,
+    create_task,
+    get_running_kernel,
+    nba,
+    now,
+    run,
+    sleep,
+)
+
+from .conftest import Trace, trace
+
+R = Kernel.Region
+
+
+def test_order():
+    order: list[str] = []
+
+    async def f(name: str):
+        order.append(name)
+        if name == "observed":
+            # Back to the active region
+            create_task(f("active2"))
+
+    async def main():
+        for region in reversed(R):
+            create_task(f(region.name.lower()), region=region)
+
+    run(main())
+
+    assert order == ["active", "inactive", "nba", "observed", "active2", "postponed"]
+
+
+def test_postponed_monitor(captrace: Trace):
+    x = Singular(0)
+
+    async def drv():
+        for i in range(1, 4):
+            await sleep(1)
+            x.next = i
+            x.next = i * 10
+
+    async def mon() -> Never:
+        while True:
+            await x.pred()
+            assert get_running_kernel().region() is R.POSTPONED
+            trace(f"x={x.value}")
+
+    async def main():
+        create_task(mon(), name="mon", region=R.POSTPONED)
+        create_task(drv(), name="drv")
+
+    run(main())
+
+    assert captrace == {(1, "mon", "x=10"), (2, "mon", "x=20"), (3, "mon", "x=30")}
+
+
+def test_postponed_read_only():
+    x = Singular(0)
+    woken: list[int] = []
+
+    async def bad():
+        x.next = 1
+
+    async def waiter():
+        await x.pred()
+        woken.append(x.value)
+
+    async def main():
+        w = create_task(waiter())
+        await sleep(1)
+
+        t = create_task(bad(), region=R.POSTPONED)
+        await sleep(1)
+        assert isinstance(t.exception(), RuntimeError)
+
+        # The rejected write has no effect
+        assert x.value == 0 and not x.changed()
+        assert w in x._waitq._items and not woken
+
+        x.next = 2
+        await w
+        assert woken == [2]
+
+    run(main())
+
+
+def test_nba():
+    a = Singular(1)
+    b = Singular(2)
+
+    async def swap_a():
+        nba(a, b.value)
+
+    async def swap_b():
+        nba(b, a.value)
+        # Not yet updated
+        assert a.value == 1
+
+    async def main():
+        create_task(swap_a())
+        create_task(swap_b())
+        await a.pred()
+
+        # Woken up by the first NBA write; resumed in the active region,
+        # before the second NBA write
+        assert get_running_kernel().region() is R.ACTIVE
+        assert (a.value, b.value) == (2, 2)
+        assert now() == 0
+
+        await sleep(1)
+        assert (a.value, b.value) == (2, 1)
+
+    run(main())
+
+
+def test_method_region():
+    x = Singular(0)
+    seen: list[int] = []
+
+    def sample():
+        seen.append(x.value)
+
+    async def main():
+        m = Method(sample, [x.pred()], region=R.OBSERVED)
+        assert m.region is R.OBSERVED
+        x.next = 1
+        x.next = 2
+        await sleep(1)
+
+    run(main())
+
+    assert seen == [2]
+
+    with pytest.raises(ValueError):
+        Method(sample, [x.pred()], region=9)  # pyright: ignore[reportArgumentType]
@@ -0,0 +1,96 @@
+"""Test clocked registers"""
+
+from deltacycle import Clock, Register, Singular, any_of, create_task, now, run, sleep
+
+from .conftest import Trace, trace
+
+EXP = {
+    (5, "mon", "q=(1, 0, 0)"),
+    (15, "mon", "q=(2, 1, 0)"),
+    (25, "mon", "q=(3, 2, 1)"),
+    (35, "mon", "q=(3, 3, 2)"),
+    (45, "mon", "q=(3, 3, 3)"),
+}
+
+
+def test_shift(captrace: Trace):
+    clk = Clock(period=10, phase=5)
+    d = Singular(0)
+    q0 = Register(clk, d)
+    q1 = Register(clk, q0)
+    q2 = Register(clk, q1)
+    assert clk.registers == (q0, q1, q2)
+    assert q2.clk is clk and q2.d is q1
+
+    async def drv_d():
+        for i in range(1, 4):
+            d.next = i
+            await clk.posedge()
+
+    async def mon():
+        while True:
+            await any_of(q0.pred(), q1.pred(), q2.pred())
+            trace(f"q={(q0.value, q1.value, q2.value)}")
+
+    async def main():
+        clk.start()
+        create_task(drv_d(), name="drv_d")
+        create_task(mon(), name="mon")
+
+    run(main(), until=100)
+
+    assert captrace == EXP
+
+
+def test_enable_reset():
+    clk = Clock(period=10, phase=5)
+    d = Singular(0)
+    en = Singular(True)
+    rst = Singular(False)
+    q = Register(clk, d, enable=en, reset=rst, value=7)
+    assert q.enable is en and q.reset is rst
+    assert q.value == 7
+
+    async def main():
+        clk.start()
+
+        d.next = 1
+        await q.pred()
+        assert now() == 5 and q.value == 1
+
+        # Hold
+        en.next = False
+        d.next = 2
+        await sleep(20)
+        assert q.value == 1
+
+        # Reset has priority over enable
+        rst.next = True
+        await q.pred()
+        assert now() == 35 and q.value == 7
+
+        # Release
+        rst.next = False
+        en.next = True
+        await q.pred()
+        assert now() == 45 and q.value == 2
+
+    run(main(), until=100)
+
+
+def test_idle_clock():
+    clk = Clock(period=10, phase=5)
+    d = Singular(1)
+
+    async def main():
+        clk.start()
+        await sleep(100)
+        assert clk.idle()
+
+        # Adding a register wakes up the clock
+        q = Register(clk, d, value=0)
+        assert not clk.idle()
+        await q.pred()
+        assert now() == 105 and q.value == 1
+
+    run(main(), until=200)
@@ -0,0 +1,139 @@
+"""Test static sensitivity"""
+
+from typing import Never
+
+import pytest
+
+from deltacycle import (
+    Interrupt,
+    Singular,
+    Subscription,
+    create_task,
+    get_current_task,
+    run,
+    sleep,
+    wait,
+)
+
+from .common import Bool, Int
+from .conftest import Trace, trace
+
+
+async def drv_clk(clk: Bool, period: int) -> Never:
+    clk.next = False
+    while True:
+        await sleep(period // 2)
+        clk.next = not clk.prev
+
+
+EXP = {
+    (25, "mon", "q2=1"),
+    (35, "mon", "q2=2"),
+}
+
+
+def test_pipeline(captrace: Trace):
+    clk = Bool(name="clk")
+    d = Int(name="d")
+    q1 = Int(name="q1")
+    q2 = Int(name="q2")
+
+    async def dff(q: Int, d: Int) -> Never:
+        while True:
+            await wait()
+            q.next = d.prev
+
+    async def drv_d():
+        for i in range(1, 4):
+            d.next = i
+            await clk.posedge()
+
+    async def mon() -> Never:
+        with Subscription(clk.posedge()) as sub:
+            while True:
+                await sub
+                if q2.prev:
+                    trace(f"q2={q2.prev}")
+
+    async def main():
+        create_task(drv_clk(clk, 10), name="drv_clk")
+        create_task(drv_d(), name="drv_d")
+        create_task(dff(q1, d), name="dff1", sensitive=[clk.posedge()])
+        create_task(dff(q2, q1), name="dff2", sensitive=[clk.posedge()])
+        create_task(mon(), name="mon", priority=1)
+
+    run(main(), until=40)
+
+    assert captrace == EXP
+
+
+def test_subscription_lifecycle():
+    x = Singular(value=0)
+    y = Singular(value=0)
+
+    async def waiter():
+        task = get_current_task()
+        assert task is not None and task.sensitive is not None
+        pv = await wait()
+        assert pv is y.pred()
+        pv = await wait()
+        assert pv is x.pred()
+
+    async def main():
+        t = create_task(waiter(), sensitive=[x.pred(), y.pred()])
+        await sleep(1)
+        # Registered once, resident in both wait queues
+        assert x._waitq._subs and y._waitq._subs
+        y.next = 1
+        await sleep(1)
+        x.next = 1
+        await t
+        # Closed when task is done
+        assert not x._waitq._subs and not y._waitq._subs
+
+    run(main())
+
+
+def test_subscription_interrupt():
+    x = Singular(value=0)
+
+    async def waiter():
+        with pytest.raises(Interrupt):
+            await wait()
+        # Re-arm after interrupt
+        await wait()
+
+    async def main():
+        t = create_task(waiter(), sensitive=[x.pred()])
+        await sleep(1)
+        t.interrupt()
+        await sleep(1)
+        x.next = 1
+        await t
+
+    run(main())
+
+
+def test_subscription_errors():
+    x = Singular(value=0)
+    sub = Subscription(x.pred())
+
+    async def waiter():
+        await sub
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await wait()
+
+        t = create_task(waiter())
+        await sleep(1)
+        with pytest.raises(RuntimeError):
+            await sub
+        x.next = 1
+        await t
+
+        sub.close()
+        with pytest.raises(RuntimeError):
+            await sub
+
+    run(main())
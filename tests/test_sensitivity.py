@@ -0,0 +1,76 @@
+"""Test sensitivity efficiency report"""
+
+import pytest
+
+from deltacycle import (
+    DefaultKernel,
+    Method,
+    SignalBank,
+    Singular,
+    create_task,
+    run,
+    sleep,
+)
+
+
+def test_sensitivity():
+    clk = Singular(False, name="clk")
+    x = Singular(0)
+    bank = SignalBank(4, 0, name="bank")
+
+    def f():
+        pass
+
+    async def posedge_waiter():
+        while True:
+            await clk.posedge()
+
+    async def bank_waiter():
+        await bank[2].pred()
+
+    async def main():
+        # 3 waiters share one posedge predicate
+        for _ in range(3):
+            create_task(posedge_waiter())
+        create_task(bank_waiter())
+        Method(f, [x.pred()])
+
+        for i in range(10):
+            await sleep(1)
+            clk.next = not clk.prev
+            x.next = i + 1
+        bank[2].next = 1
+
+    kernel = DefaultKernel(main())
+    with pytest.raises(RuntimeError):
+        kernel.sensitivity()
+    kernel.enable_sensitivity()
+    run(kernel=kernel, until=20)
+
+    report = kernel.sensitivity()
+    rows = {(var, pred): tuple(counts) for var, pred, *counts in report.rows()}
+
+    # Worst offender: half of the clock toggles are negedges
+    var, pred, *counts = report.rows()[0]
+    assert var == "clk"
+    assert pred == "Singular.is_posedge"
+    assert counts == [10, 5, 30]
+
+    # Method sensitivity is always hit
+    (x_row,) = (r for (_, p), r in rows.items() if p == "Singular.changed")
+    assert x_row == (10, 10, 10)
+
+    # Variables without a name are reported by repr
+    assert any(var.startswith("<deltacycle.") for var, _ in rows)
+
+    # Bank signals are reported by index
+    assert any(var == "bank[2]" for var, _ in rows)
+
+    table = report.table(limit=1).splitlines()
+    assert len(table) == 2
+    assert "50.0%" in table[1]
+    assert table[1].endswith("Singular.is_posedge")
+
+    kernel.disable_sensitivity()
+    with pytest.raises(RuntimeError):
+        kernel.sensitivity()
@@ -0,0 +1,127 @@
+"""Test kernel performance counters"""
+
+import gc
+
+import pytest
+
+from deltacycle import (
+    DefaultKernel,
+    Method,
+    Singular,
+    Task,
+    Variable,
+    any_of,
+    create_task,
+    get_running_kernel,
+    run,
+    set_kernel,
+    sleep,
+)
+
+
+def test_stats():
+    x = Singular(0)
+    y = Singular(0)
+
+    def f():
+        y.next = x.value
+
+    async def waiter():
+        for _ in range(3):
+            await x.pred()
+
+    async def forker():
+        await any_of(x.pred(), y.pred())
+
+    async def main():
+        Method(f, [x.pred()])
+        create_task(waiter())
+        create_task(forker())
+        for i in range(1, 4):
+            await sleep(10)
+            x.next = i
+
+    kernel = DefaultKernel(main())
+    with pytest.raises(RuntimeError):
+        kernel.stats()
+    kernel.enable_stats()
+    run(kernel=kernel)
+
+    stats = kernel.stats()
+    assert stats.slots == 4
+    assert stats.sim_time == 30
+    assert stats.wall_time > 0.0
+    assert stats.sim_wall_ratio > 0.0
+
+    # main, waiter, forker
+    assert stats.activations[Task.Command.START] == 3
+    # main: 3 sleeps; waiter: 3 changes; forker: 1 change
+    assert stats.activations[Task.Command.RESUME] == 7
+    # Method calls
+    assert stats.actions == 3
+
+    assert stats.pops == stats.pushes == 13
+    assert stats.drops == 0
+    assert stats.peak_queue == 4
+
+    # x and y change at 10, 20, 30
+    assert stats.commits == 6
+    assert stats.peak_commits == 2
+    assert stats.commits_per_slot == 6 / 4
+
+    assert stats.fork_sets == 1 and stats.fork_drops == 1
+    # All waiters on x share one predicate
+    assert stats.pred_evals == 3
+    # waiter x3, Method x3, forker x1
+    assert stats.wakeups == 7
+
+    assert "activations={'START': 3, 'RESUME': 7}" in repr(stats)
+
+    # Snapshot does not change
+    kernel.disable_stats()
+    kernel.disable_stats()
+    assert stats.slots == 4
+    with pytest.raises(RuntimeError):
+        kernel.stats()
+
+
+def test_enable_running():
+    async def main():
+        kernel = get_running_kernel()
+        assert isinstance(kernel, DefaultKernel)
+        kernel.enable_stats()
+        for _ in range(10):
+            await sleep(1)
+        stats = kernel.stats()
+        kernel.disable_stats()
+        return stats
+
+    stats = run(main())
+    assert stats is not None
+    # Stats are read during the last slot
+    assert stats.slots == 9
+    assert stats.activations[Task.Command.RESUME] == 10
+
+    # Enable resets counters
+    kernel = DefaultKernel(main())
+    kernel.enable_stats()
+    kernel.enable_stats()
+    run(kernel=kernel)
+
+
+def test_dropped_kernel():
+    """A kernel dropped with stats enabled restores Variable._notify."""
+    notify = Variable._notify
+
+    async def main():
+        await sleep(1)
+
+    kernel = DefaultKernel(main())
+    kernel.enable_stats()
+    assert Variable._notify is not notify
+    run(kernel=kernel)
+
+    del kernel
+    set_kernel()
+    gc.collect()
+    assert Variable._notify is notify
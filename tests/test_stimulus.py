@@ -0,0 +1,183 @@
+"""Test streaming stimulus"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from deltacycle import (
+    Aggregate,
+    Kernel,
+    Singular,
+    create_task,
+    get_kernel,
+    now,
+    play_stimulus,
+    read_stimulus_csv,
+    read_stimulus_npy,
+    run,
+    sleep,
+)
+
+CSV = """\
+time,signal,value
+0,a,1
+10,a,2
+10,b,5
+20,m3,7
+30,a,3
+"""
+
+
+def _monitor(a: Singular[int], b: Singular[int], seen: list[tuple[int, int, int]]):
+    async def mon():
+        while True:
+            await sleep(1)
+            seen.append((now(), a.prev, b.prev))
+
+    return mon
+
+
+def test_csv(tmp_path: Path):
+    path = tmp_path / "stim.csv"
+    path.write_text(CSV)
+
+    assert list(read_stimulus_csv(path)) == [
+        (0, "a", 1),
+        (10, "a", 2),
+        (10, "b", 5),
+        (20, "m3", 7),
+        (30, "a", 3),
+    ]
+
+    a = Singular(0)
+    b = Singular(0)
+    mem = Aggregate(0)
+    seen: list[tuple[int, int, int]] = []
+
+    async def main():
+        signals = {"a": a, "b": b, "m3": mem[3]}
+        play_stimulus(read_stimulus_csv(path), signals)
+        create_task(_monitor(a, b, seen)())
+        await sleep(40)
+
+    run(main(), until=40)
+
+    assert (1, 1, 0) in seen
+    assert (11, 2, 5) in seen
+    assert (31, 3, 5) in seen
+    assert mem[3].prev == 7
+    assert mem[2].prev == 0
+
+
+def test_csv_convert(tmp_path: Path):
+    path = tmp_path / "stim.csv"
+    path.write_text("0,a,0x10\n5,b,1.5\n")
+
+    records = read_stimulus_csv(
+        path,
+        convert={"a": lambda s: int(s, base=16), "b": float},
+        header=False,
+    )
+    assert list(records) == [(0, "a", 16), (5, "b", 1.5)]
+
+
+def test_unknown_signal(tmp_path: Path):
+    path = tmp_path / "stim.csv"
+    path.write_text(CSV)
+
+    a = Singular(0)
+
+    async def main():
+        play_stimulus(read_stimulus_csv(path), {"a": a})
+        await sleep(20)
+
+    with pytest.raises(KeyError):
+        run(main())
+
+    # Simulation finished at the bad record, with earlier slots intact
+    kernel = get_kernel()
+    assert kernel is not None
+    assert kernel.state() is Kernel.State.FINISHED
+    assert kernel.time() == 10 and a.prev == 1
+    with pytest.raises(RuntimeError):
+        run(kernel=kernel)
+
+    # Unknown first record: raised in the calling task
+    b = Singular(0)
+
+    async def main2():
+        with pytest.raises(KeyError):
+            play_stimulus(read_stimulus_csv(path), {})
+        b.next = 5
+        await sleep(1)
+        return b.prev
+
+    assert run(main2()) == 5
+
+
+def test_bounded_read_ahead():
+    x = Singular(0)
+    consumed = 0
+
+    def records() -> Iterator[tuple[int, str, int]]:
+        nonlocal consumed
+        for t in range(1_000):
+            consumed += 1
+            yield (t, "x", t)
+
+    checks: list[tuple[int, int]] = []
+
+    async def main():
+        play_stimulus(records(), {"x": x})
+        for _ in range(3):
+            await sleep(100)
+            checks.append((now(), consumed))
+
+    run(main())
+
+    # Records are read no further ahead than the next write
+    assert checks == [(100, 101), (200, 201), (300, 301)]
+
+
+def test_npy(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+
+    x = Singular(0)
+    y = Singular(0)
+    seen: list[tuple[int, int, int]] = []
+
+    # Structured array, with string signal names
+    dtype = np.dtype([("time", np.int64), ("signal", "U1"), ("value", np.int64)])
+    recs = np.array([(0, "x", 1), (3, "y", 2), (3, "x", 4), (7, "x", 5)], dtype=dtype)
+    path = tmp_path / "stim.npy"
+    np.save(path, recs)
+
+    assert list(read_stimulus_npy(path, chunk_size=3)) == [
+        (0, "x", 1),
+        (3, "y", 2),
+        (3, "x", 4),
+        (7, "x", 5),
+    ]
+
+    async def main():
+        play_stimulus(read_stimulus_npy(path, chunk_size=2), {"x": x, "y": y})
+        create_task(_monitor(x, y, seen)())
+        await sleep(10)
+
+    run(main(), until=10)
+
+    assert (1, 1, 0) in seen
+    assert (4, 4, 2) in seen
+    assert (8, 5, 2) in seen
+
+    # Plain (N, 3) array, with integer signal ids
+    path = tmp_path / "stim2.npy"
+    np.save(path, np.arange(12).reshape(4, 3))
+    assert list(read_stimulus_npy(path)) == [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 10, 11)]
+
+    # Bad shape
+    path = tmp_path / "stim3.npy"
+    np.save(path, np.arange(8).reshape(4, 2))
+    with pytest.raises(ValueError):
+        list(read_stimulus_npy(path))
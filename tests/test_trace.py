@@ -0,0 +1,138 @@
+"""Test Chrome trace export"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from deltacycle import (
+    DefaultKernel,
+    Event,
+    Method,
+    Semaphore,
+    Singular,
+    create_task,
+    run,
+    sleep,
+)
+
+
+def _sim(path: Path, axis: str) -> list[dict[str, Any]]:
+    async def main():
+        ev = Event()
+        sem = Semaphore(1)
+        x = Singular(0)
+        y = Singular(0)
+
+        def f():
+            y.next = x.value
+
+        async def a():
+            async with sem.req():
+                await ev
+                await sleep(2)
+
+        async def b():
+            await x.pred()
+            ev.set()
+            async with sem.req():
+                pass
+
+        Method(f, [x.pred()])
+        create_task(a(), name="a")
+        create_task(b(), name="b")
+        await sleep(1)
+        x.next = 1
+        await sleep(5)
+
+    kernel = DefaultKernel(main())
+    kernel.enable_trace(path, axis=axis, timescale=100)
+    run(kernel=kernel)
+    kernel.disable_trace()
+    kernel.disable_trace()
+
+    with open(path) as f:
+        return json.load(f)["traceEvents"]
+
+
+def test_sim_axis(tmp_path: Path):
+    events = _sim(tmp_path / "trace.json", axis="sim")
+
+    names = {e["tid"]: e["args"]["name"] for e in events if e["name"] == "thread_name"}
+    assert names[1] == "main"
+    assert "Method(_sim.<locals>.main.<locals>.f)" in names.values()
+
+    slices = [e for e in events if e["ph"] == "X"]
+    assert all(e["dur"] == 1 for e in slices)
+
+    def find(name: str, time: int) -> dict[str, Any]:
+        (e,) = (e for e in slices if e["name"] == name and e["args"]["time"] == time)
+        return e
+
+    # Activations at time 1, in execution order
+    assert find("main", 1)["ts"] == 100
+    assert find("b", 1)["ts"] > 100
+    assert find("main", 6)["ts"] == 600
+
+    assert find("a", 0)["args"]["blocked_on"] == ["Event"]
+    assert find("b", 0)["args"]["blocked_on"] == ["PredVariable"]
+    assert find("b", 1)["args"]["woken_by"] == "main"
+    assert find("b", 1)["args"]["blocked_on"] == ["Semaphore"]
+    assert find("a", 1)["args"]["woken_by"] == "b"
+    assert find("a", 1)["args"]["blocked_on"] == ["sleep"]
+    assert find("b", 3)["args"]["woken_by"] == "a"
+    assert find("main", 6)["args"]["state"] == "RETURNED"
+
+    # Every flow start has a matching finish
+    starts = {e["id"] for e in events if e["ph"] == "s"}
+    finishes = {e["id"] for e in events if e["ph"] == "f"}
+    assert starts == finishes
+
+
+def test_wall_axis(tmp_path: Path):
+    events = _sim(tmp_path / "trace.json", axis="wall")
+
+    slices = [e for e in events if e["ph"] == "X"]
+    ts = [e["ts"] for e in slices]
+    assert ts == sorted(ts)
+    for e in slices:
+        assert e["dur"] == pytest.approx(e["args"]["wall_us"], abs=1e-3)
+
+
+def test_errors(tmp_path: Path):
+    async def main():
+        pass
+
+    kernel = DefaultKernel(main())
+    with pytest.raises(ValueError):
+        kernel.enable_trace(tmp_path / "trace.json", axis="cycles")
+    with pytest.raises(ValueError):
+        kernel.enable_trace(tmp_path / "trace.json", timescale=0)
+    run(kernel=kernel)
+
+
+def test_sim_overflow(tmp_path: Path):
+    path = tmp_path / "trace.json"
+
+    async def noop():
+        pass
+
+    async def main():
+        for _ in range(5):
+            create_task(noop())
+        await sleep(1)
+
+    kernel = DefaultKernel(main())
+    kernel.enable_trace(path, timescale=4)
+    with pytest.warns(RuntimeWarning):
+        run(kernel=kernel)
+    kernel.disable_trace()
+
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+
+    # Slot 0 has six activations; none spill into time step 1
+    slot0 = [e["ts"] for e in events if e["ph"] == "X" and e["args"]["time"] == 0]
+    assert len(slot0) == 6
+    assert max(slot0) == 3
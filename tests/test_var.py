@@ -30,3 +30,63 @@ def test_var_await():
             assert x8.value == 8 * i
 
     run(main())
+
+
+def test_pred_interned():
+    x = Singular(value=False)
+    assert x.pred() is x.pred()
+    assert x.posedge() is x.posedge()
+    assert x.negedge() is x.negedge()
+    assert x.pred(x.is_posedge) is not x.posedge()
+
+
+def test_pred_shared():
+    """Each distinct predicate is evaluated once per notification."""
+    clk = Singular(value=False)
+    n = 0
+
+    def p() -> bool:
+        nonlocal n
+        n += 1
+        return clk.is_posedge()
+
+    woken: list[int] = []
+
+    async def waiter(i: int):
+        await clk.pred(p)
+        woken.append(i)
+
+    async def main():
+        for i in range(10):
+            create_task(waiter(i))
+        await sleep(1)
+        clk.next = True
+
+    run(main())
+
+    assert n == 1
+    assert woken == list(range(10))
+
+
+def test_pred_order():
+    """Tasks wake up in the order they started waiting."""
+    x = Singular(value=0)
+
+    woken: list[int] = []
+
+    async def waiter(i: int):
+        if i % 2:
+            await x.pred(lambda: x.value > 0)
+        else:
+            await x.pred()
+        woken.append(i)
+
+    async def main():
+        for i in range(6):
+            create_task(waiter(i))
+        await sleep(1)
+        x.next = 1
+
+    run(main())
+
+    assert woken == list(range(6))
@@ -0,0 +1,94 @@
+"""Test wall-clock watchdog"""
+
+import gc
+import io
+import threading
+import time
+
+import pytest
+
+from deltacycle import (
+    DefaultKernel,
+    Task,
+    WatchdogTimeout,
+    create_task,
+    run,
+    set_kernel,
+    sleep,
+)
+
+
+def spin(seconds: float):
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        pass
+
+
+async def hog():
+    await sleep(5)
+    spin(0.2)
+    await sleep(1)
+    return 42
+
+
+async def main():
+    task = create_task(hog(), name="hog")
+    await sleep(10)
+    return task
+
+
+def test_watchdog():
+    f = io.StringIO()
+    kernel = DefaultKernel(main())
+    kernel.enable_watchdog(timeout=0.02, file=f)
+    task = run(kernel=kernel)
+    kernel.disable_watchdog()
+    assert task is not None
+
+    assert task.result() == 42
+
+    # Reported once, with the stack of the spinning task
+    out = f.getvalue()
+    assert out.count("Watchdog: hog has run for") == 1
+    assert "at time 5" in out
+    assert "in spin" in out
+
+
+def test_watchdog_raise():
+    f = io.StringIO()
+    kernel = DefaultKernel(main())
+    kernel.enable_watchdog(timeout=0.02, raise_timeout=True, file=f)
+    task = run(kernel=kernel)
+    kernel.disable_watchdog()
+    assert task is not None
+
+    assert task.state() is Task.State.EXCEPTED
+    assert isinstance(task.exception(), WatchdogTimeout)
+
+
+def test_watchdog_quiet():
+    f = io.StringIO()
+    kernel = DefaultKernel(main())
+    kernel.enable_watchdog(timeout=10.0, file=f)
+    run(kernel=kernel)
+    kernel.disable_watchdog()
+    assert not f.getvalue()
+
+    with pytest.raises(ValueError):
+        kernel.enable_watchdog(timeout=0)
+
+
+def test_watchdog_dropped():
+    """A dropped kernel stops its watchdog thread."""
+    kernel = DefaultKernel(main())
+    kernel.enable_watchdog(timeout=0.02, file=io.StringIO())
+    run(kernel=kernel)
+
+    name = f"{kernel._name}-watchdog"
+    (thread,) = (t for t in threading.enumerate() if t.name == name)
+
+    del kernel
+    set_kernel()
+    gc.collect()
+    thread.join(timeout=1.0)
+    assert not thread.is_alive()
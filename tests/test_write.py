@@ -0,0 +1,115 @@
+"""Test timed value writes"""
+
+from typing import Any, cast
+
+import pytest
+
+from deltacycle import (
+    DefaultKernel,
+    Kernel,
+    Singular,
+    create_task,
+    get_running_kernel,
+    now,
+    run,
+    schedule_write,
+    schedule_writes,
+    sleep,
+)
+
+
+def test_schedule_write():
+    x = Singular(0)
+    seen: list[tuple[int, int]] = []
+
+    async def mon():
+        for _ in range(3):
+            await x.pred()
+            seen.append((now(), x.value))
+
+    async def main():
+        create_task(mon(), name="mon")
+        schedule_write(x, 1, at=10)
+        schedule_write(x, 3, at=30)
+        schedule_write(x, 2, at=20)
+
+        with pytest.raises(ValueError):
+            schedule_write(x, 4, at=-1)
+
+    run(main())
+
+    assert seen == [(10, 1), (20, 2), (30, 3)]
+
+
+def test_schedule_writes():
+    x = Singular(0)
+    seen: list[tuple[int, int]] = []
+
+    async def mon():
+        while True:
+            await x.pred()
+            seen.append((now(), x.value))
+
+    async def main():
+        create_task(mon(), name="mon")
+        schedule_writes(x, zip([1, 2, 2, 5, 5, 5], [10, 20, 21, 50, 51, 52]))
+        await sleep(10)
+
+    run(main())
+
+    # Same time: written in order, last value wins
+    assert seen == [(1, 10), (2, 21), (5, 52)]
+
+
+def test_lazy():
+    x = Singular(0)
+
+    def events():
+        for t in range(1, 1_000):
+            yield (t, t)
+
+    async def main():
+        schedule_writes(x, events())
+        await sleep(500)
+        kernel = cast(DefaultKernel[Any], get_running_kernel())
+
+        # Only the next write is in the queue
+        assert len(kernel._queue) <= 2
+        assert x.prev == 499
+
+    run(main())
+
+    assert x.value == 999
+
+
+def test_region_priority():
+    x = Singular(0)
+
+    async def main():
+        schedule_write(x, 1, at=5, region=Kernel.Region.NBA)
+        schedule_write(x, 2, at=5, priority=-1)
+        await sleep(5)
+        # Active region write already happened; NBA has not
+        assert x.value == 2
+        await sleep(1)
+        assert x.value == 1
+
+    run(main())
+
+
+def test_order_error():
+    x = Singular(0)
+
+    async def main():
+        schedule_writes(x, [(5, 1), (3, 2)])
+        await sleep(10)
+
+    with pytest.raises(ValueError):
+        run(main())
+
+    async def past():
+        await sleep(5)
+        schedule_writes(x, [(3, 1)])
+
+    with pytest.raises(ValueError):
+        run(past())